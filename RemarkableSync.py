@@ -5,6 +5,7 @@ RemarkableSync - Unified command-line interface
 Single entry point for backing up and converting ReMarkable tablet files.
 """
 
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -157,6 +158,11 @@ def cli(ctx, log_level):
 @add_log_level_option
 @click.option("--skip-templates", is_flag=True, help="Skip backing up template files")
 @click.option("--force", "-f", is_flag=True, help="Force backup all files (ignore sync status)")
+@click.option(
+    "--verify-hashes",
+    is_flag=True,
+    help="Re-hash every local file instead of trusting unchanged size and mtime",
+)
 @add_connection_options
 def backup(
     backup_dir: Path,
@@ -164,6 +170,7 @@ def backup(
     log_level: str,
     skip_templates: bool,
     force: bool,
+    verify_hashes: bool,
     host: str,
     use_wifi: bool,
     wifi_host: str,
@@ -186,6 +193,7 @@ def backup(
             host=host,
             use_wifi=use_wifi,
             wifi_host=wifi_host,
+            verify_hashes=verify_hashes,
         )
     )
 
@@ -720,6 +728,9 @@ def main():
     Config-based defaults (backup_dir, output_dir, connection, etc.) are
     injected as CLI args so the subcommand sees them.
     """
+    # PDF conversion may use worker processes; needed for the frozen executable
+    multiprocessing.freeze_support()
+
     known_commands = {"backup", "pdf", "sync", "md", "config", "watch", "check-update"}
     has_command = any(arg in known_commands for arg in sys.argv[1:])
 
@@ -15,17 +15,89 @@ This module provides:
 - Optional automatic PDF conversion after backup
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
+import shlex
+import shutil
+import tarfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 import paramiko
 from scp import SCPException
 
-from .connection import ReMarkableConnection
-from .metadata import FileMetadata
+from ..utils import is_page_dir, read_json
+from .connection import DEFAULT_MAX_CONNS, ReMarkableConnection
+from .metadata import HASH_ALGORITHM, FileMetadata
+
+# Batches larger than this are streamed as tar archives instead of per-file transfers
+TAR_BATCH_THRESHOLD = 50
+# Budget for the file names of one tar invocation.  The whole command reaches the
+# tablet as a single ``sh -c`` argument, which Linux caps at 128 KiB, so batches
+# are sized by the length of their quoted names rather than by file count.
+TAR_BATCH_BYTES = 96 * 1024
+# Only files smaller than this go into tar batches.  Small files are bound by
+# per-file round-trips; large ones run faster on parallel pool channels.
+TAR_MEMBER_MAX_BYTES = 64 * 1024
+
+# Every this many incremental (-newermt) listings, list everything again so files
+# whose mtimes went backwards, or local copies that were deleted, are caught
+FULL_LISTING_EVERY = 10
+
+# Threads used to read and parse .metadata files in find_notebooks
+NOTEBOOK_SCAN_WORKERS = 8
+
+# Read size when copying archive members to disk, and write buffer for SFTP downloads
+COPY_CHUNK_SIZE = 1 << 20
+
+# Notebook UUID at the start of a relative xochitl path ("uuid.metadata", "uuid/page.rm")
+_UUID_RE = re.compile(r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?:[/.]|$)")
+
+
+class _HashingWriter:
+    """Write-only file wrapper that hashes everything written through it.
+
+    Lets a download record its digest without reading the new file back.
+    """
+
+    def __init__(self, target: BinaryIO):
+        self._target = target
+        self._digest = hashlib.new(HASH_ALGORITHM)
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._target.write(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _tar_batches(
+    remote_dir: str, files_to_sync: List[Tuple[Dict, Path]]
+) -> Iterator[Dict[str, Tuple[Dict, Path]]]:
+    """Split *files_to_sync* into tar batches of at most :data:`TAR_BATCH_BYTES` of names.
+
+    Each batch maps the path relative to *remote_dir* to ``(remote_file, local_path)``.
+    """
+    prefix_len = len(remote_dir.rstrip("/") + "/")
+    batch: Dict[str, Tuple[Dict, Path]] = {}
+    used = 0
+    for remote_file, local_path in files_to_sync:
+        rel_path = remote_file["path"][prefix_len:]
+        # Quoted name plus the separating space
+        cost = len(shlex.quote(rel_path).encode()) + 1
+        if batch and used + cost > TAR_BATCH_BYTES:
+            yield batch
+            batch, used = {}, 0
+        batch[rel_path] = (remote_file, local_path)
+        used += cost
+    if batch:
+        yield batch
 
 
 class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
@@ -36,7 +108,7 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
 
     Key features:
     - Incremental sync based on file modification times
-    - Integrity verification using MD5 checksums
+    - Integrity verification using SHA-256 checksums
     - Automatic PDF conversion integration
     - Progress tracking and detailed logging
     """
@@ -50,6 +122,8 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         wifi_host: str = "",
         pre_sync_command: str = "",
         post_sync_command: str = "",
+        max_conns: int = DEFAULT_MAX_CONNS,
+        verify_hashes: bool = False,
     ):
         """Initialize backup orchestrator.
 
@@ -61,11 +135,14 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
             wifi_host: Wi-Fi IP/hostname (auto-discovered if empty)
             pre_sync_command: Shell command to run before SSH connects.
             post_sync_command: Shell command to run after SSH disconnects.
+            max_conns: Number of files to download concurrently.
+            verify_hashes: Re-hash every local file instead of trusting an
+                unchanged local size and mtime.
         """
         self.backup_dir = backup_dir
         self.files_dir = backup_dir / "Notebooks"
         self.templates_dir = backup_dir / "Templates"
-        self.metadata_file = backup_dir / "sync_metadata.json"
+        self.metadata_file = backup_dir / "sync_metadata.db"
 
         self.files_dir.mkdir(parents=True, exist_ok=True)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
@@ -77,8 +154,9 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
             wifi_host=wifi_host,
             pre_sync_command=pre_sync_command,
             post_sync_command=post_sync_command,
+            max_conns=max_conns,
         )
-        self.metadata = FileMetadata(self.metadata_file)
+        self.metadata = FileMetadata(self.metadata_file, verify_hashes=verify_hashes)
 
         # ReMarkable paths
         self.remote_xochitl_dir = "/home/root/.local/share/remarkable/xochitl"
@@ -177,6 +255,138 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         print(f"  Found {len(allowed)} notebooks in selected folders")
         return allowed
 
+    def _download_one(self, remote_file: Dict, local_path: Path) -> Optional[Exception]:
+        """Download a single file through the transfer pool and record its metadata.
+
+        Runs on a worker thread; each call checks out its own pooled client so
+        downloads proceed concurrently over separate SSH channels.
+
+        Returns:
+            The exception raised by the transfer, or None on success
+        """
+        file_hash = None
+        try:
+            with self.connection.pool.client() as client:
+                if hasattr(client, "getfo"):
+                    # SFTP hands over the data, so hash it on the way to disk.
+                    # getfo() writes in 32 KiB pieces; the larger buffer turns
+                    # those into one write() per COPY_CHUNK_SIZE.
+                    with open(local_path, "wb", buffering=COPY_CHUNK_SIZE) as target:
+                        writer = _HashingWriter(target)
+                        client.getfo(remote_file["path"], writer)
+                    file_hash = writer.hexdigest()
+                else:
+                    client.get(remote_file["path"], os.fspath(local_path))
+            self.metadata.update_file_metadata(remote_file, local_path, file_hash)
+            return None
+        except (OSError, SCPException, paramiko.SSHException) as e:
+            return e
+
+    def _extract_tar(
+        self, remote_dir: str, expected: Dict[str, Tuple[Dict, Path]]
+    ) -> Iterator[Tuple[Dict, Path]]:
+        """Stream *expected* files from *remote_dir* as one tar archive.
+
+        Only archive members named in *expected* (relative path -> ``(remote_file,
+        local_path)``) are written, each to its precomputed local path.  Entries
+        are removed from *expected* as they are extracted, so whatever remains
+        afterwards still needs downloading.
+        """
+        with self.connection.stream_tar(remote_dir, list(expected)) as stream:
+            with tarfile.open(fileobj=stream, mode="r|") as archive:
+                for member in archive:
+                    name = member.name.removeprefix("./")
+                    entry = expected.get(name) if member.isfile() else None
+                    source = archive.extractfile(member) if entry else None
+                    if source is None:
+                        continue
+
+                    remote_file, local_path = entry
+                    with open(local_path, "wb") as target:
+                        writer = _HashingWriter(target)
+                        shutil.copyfileobj(source, writer, COPY_CHUNK_SIZE)
+                    self.metadata.update_file_metadata(remote_file, local_path, writer.hexdigest())
+                    del expected[name]
+                    yield remote_file, local_path
+
+    def _download_files(
+        self, remote_dir: str, files_to_sync: List[Tuple[Dict, Path]]
+    ) -> Iterator[Tuple[Dict, Path, Optional[Exception]]]:
+        """Download *files_to_sync*, yielding ``(remote_file, local_path, error)`` per file.
+
+        When there are many small files, they are first streamed as tar archives
+        over a single SSH channel, amortising per-file protocol round-trips.
+        Large files, files the archive did not deliver, and every file of a
+        small batch are fetched individually in parallel through the transfer
+        pool.
+        """
+        # Create each destination directory once rather than once per file
+        for parent in {local_path.parent for _, local_path in files_to_sync}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logging.debug("Failed to create %s: %s", parent, e)
+
+        pending = files_to_sync
+        small = [entry for entry in files_to_sync if entry[0]["size"] < TAR_MEMBER_MAX_BYTES]
+        if len(small) > TAR_BATCH_THRESHOLD:
+            pending = [entry for entry in files_to_sync if entry[0]["size"] >= TAR_MEMBER_MAX_BYTES]
+            for expected in _tar_batches(remote_dir, small):
+                try:
+                    for remote_file, local_path in self._extract_tar(remote_dir, expected):
+                        yield remote_file, local_path, None
+                except (tarfile.TarError, paramiko.SSHException, OSError) as e:
+                    logging.debug("Tar transfer failed, falling back to per-file copies: %s", e)
+                pending.extend(expected.values())
+
+        if not pending:
+            return
+
+        # Biggest files first, so a large PDF picked up last doesn't leave the
+        # other channels idle while it finishes
+        pending = sorted(pending, key=lambda entry: entry[0]["size"], reverse=True)
+        with ThreadPoolExecutor(max_workers=self.connection.pool.size) as executor:
+            futures = {
+                executor.submit(self._download_one, remote_file, local_path): (
+                    remote_file,
+                    local_path,
+                )
+                for remote_file, local_path in pending
+            }
+            for future in as_completed(futures):
+                remote_file, local_path = futures[future]
+                yield remote_file, local_path, future.result()
+
+    def _listing_cutoff(self, scope: str) -> Optional[int]:
+        """Return the mtime to pass as ``newer_than`` for an incremental listing.
+
+        Returns None when a full listing is needed: no previous clean run,
+        a changed folder filter, hash verification, or the periodic full scan.
+        """
+        last_mtime = self.metadata.get_state("last_sync_mtime")
+        if (
+            last_mtime is None
+            or self.metadata.verify_hashes
+            or self.metadata.get_state("listing_scope") != scope
+            or self.metadata.get_state("incremental_listings", 0) >= FULL_LISTING_EVERY
+        ):
+            return None
+        # find -newermt is strict; step back a second to catch same-second writes
+        return last_mtime - 1
+
+    def _record_listing(self, scope: str, max_mtime: Optional[int], incremental: bool):
+        """Remember the newest mtime seen so the next run can list only newer files."""
+        if incremental:
+            previous = self.metadata.get_state("last_sync_mtime")
+            if max_mtime is None or previous > max_mtime:
+                max_mtime = previous
+        if max_mtime is None:
+            return
+        runs = self.metadata.get_state("incremental_listings", 0) + 1 if incremental else 0
+        self.metadata.set_state("last_sync_mtime", max_mtime)
+        self.metadata.set_state("listing_scope", scope)
+        self.metadata.set_state("incremental_listings", runs)
+
     def _do_backup_files(
         self,
     ) -> Tuple[bool, Set[str], Dict[str, Set[str]]]:  # pylint: disable=too-many-branches
@@ -186,47 +396,67 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         try:
             allowed_uuids = self._resolve_allowed_uuids()
 
-            # Get list of remote files
-            from src.utils.console import console
-
-            with console.status("[bold blue]Scanning tablet files..."):
-                remote_files = self.connection.list_files(self.remote_xochitl_dir)
-            print(f"  Scanned {len(remote_files)} files on tablet")
-
-            if not remote_files:
-                logging.warning("No files found on ReMarkable tablet")
-                return True, set(), {}
-
-            # Apply folder filter — only sync files belonging to allowed UUIDs
-            if allowed_uuids is not None:
+            # Remote paths are POSIX and always under remote_xochitl_dir, so the
+            # relative path is a plain slice past this prefix
+            prefix = self.remote_xochitl_dir.rstrip("/") + "/"
+            prefix_len = len(prefix)
 
-                def _file_in_allowed(rf):
-                    rel = os.path.relpath(rf["path"], self.remote_xochitl_dir)
-                    parts = rel.split(os.sep)
-                    # Extract UUID from path (e.g. "uuid.metadata" or "uuid/page.rm")
-                    first = parts[0].split(".")[0]
-                    if len(first) == 36:
-                        return first in allowed_uuids
-                    return True  # Non-UUID files (e.g. version) always synced
+            # Only ask the tablet for files changed since the last clean run
+            scope = "*" if allowed_uuids is None else ",".join(sorted(allowed_uuids))
+            newer_than = self._listing_cutoff(scope)
 
-                before = len(remote_files)
-                remote_files = [rf for rf in remote_files if _file_in_allowed(rf)]
-                print(f"  Filtered to {len(remote_files)} files (from {before} total)")
+            # Stream the remote listing, applying the folder filter and the
+            # incremental check while the tablet is still walking its tree
+            from src.utils.console import console
 
-            if not remote_files:
+            scanned = 0
+            kept = 0
+            max_mtime: Optional[int] = None
+            files_to_sync = []
+            # With verify_hashes every local copy is re-hashed, so defer the
+            # decisions and hash them all at once across cores
+            to_verify = []
+            with console.status("[bold blue]Scanning tablet files..."):
+                for remote_file in self.connection.iter_files(
+                    self.remote_xochitl_dir, newer_than=newer_than
+                ):
+                    scanned += 1
+                    if max_mtime is None or remote_file["mtime"] > max_mtime:
+                        max_mtime = remote_file["mtime"]
+                    relative_path = remote_file["path"][prefix_len:]
+
+                    # Folder filter — only sync files belonging to allowed UUIDs;
+                    # non-UUID files (e.g. version) are always synced
+                    if allowed_uuids is not None:
+                        match = _UUID_RE.match(relative_path)
+                        if match and match.group(1) not in allowed_uuids:
+                            continue
+                    kept += 1
+
+                    local_path = self.files_dir / relative_path
+                    if self.metadata.verify_hashes:
+                        to_verify.append((remote_file, local_path))
+                    elif self.metadata.should_sync_file(remote_file, local_path):
+                        files_to_sync.append((remote_file, local_path))
+
+                if to_verify:
+                    self.metadata.verify_batch([lp for _, lp in to_verify if lp.exists()])
+                    files_to_sync.extend(
+                        (rf, lp) for rf, lp in to_verify if self.metadata.should_sync_file(rf, lp)
+                    )
+
+            print(f"  Scanned {scanned} files on tablet")
+            if allowed_uuids is not None and scanned:
+                print(f"  Filtered to {kept} files (from {scanned} total)")
+
+            incremental = newer_than is not None
+            if not kept and not incremental:
                 logging.warning("No files found on ReMarkable tablet")
                 return True, set(), {}
 
-            # Filter files that need syncing
-            files_to_sync = []
-            for remote_file in remote_files:
-                relative_path = os.path.relpath(remote_file["path"], self.remote_xochitl_dir)
-                local_path = self.files_dir / relative_path
-
-                if self.metadata.should_sync_file(remote_file, local_path):
-                    files_to_sync.append((remote_file, local_path))
-
             if not files_to_sync:
+                self._record_listing(scope, max_mtime, incremental)
+                self.metadata.save()
                 print("  All files are up to date")
                 logging.info("All files are up to date")
                 return True, set(), {}
@@ -239,66 +469,54 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
             updated_pages: Dict[str, Set[str]] = {}
 
             # Download files with Rich progress bar (pinned to bottom)
-            from src.utils.console import create_progress, print_error
+            from src.utils.console import ThrottledProgress, create_progress, print_error
+
+            if self.connection.pool is None:
+                logging.error("Transfer pool not initialized")
+                return False, set(), {}
 
+            failed = 0
             with create_progress("Downloading") as progress:
                 task = progress.add_task("Downloading", total=len(files_to_sync))
+                bar = ThrottledProgress(progress, task)
 
-                for remote_file, local_path in files_to_sync:
-                    try:
-                        # Create local directory if needed
-                        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        # Download file
-                        if self.connection.scp_client is None:
-                            logging.error("SCP client not initialized")
-                            return False, set(), {}
-                        self.connection.scp_client.get(remote_file["path"], str(local_path))
-
-                        # Update metadata
-                        self.metadata.update_file_metadata(remote_file, local_path)
-
-                        # Track notebook UUID if this file belongs to a notebook
-                        relative_path = os.path.relpath(
-                            remote_file["path"], self.remote_xochitl_dir
-                        )
-                        path_parts = relative_path.split(os.sep)
-
-                        notebook_uuid = None
-                        if len(path_parts) >= 1:
-                            first_part = path_parts[0].split(".")[0]
-                            if len(first_part) == 36 and first_part not in [
-                                "templates",
-                                "version",
-                            ]:
-                                notebook_uuid = first_part
-
-                        if len(path_parts) >= 2:
-                            if len(path_parts[0]) == 36 and path_parts[0] not in [
-                                "templates",
-                                "version",
-                            ]:
-                                notebook_uuid = path_parts[0]
-
-                        if notebook_uuid:
-                            updated_notebooks.add(notebook_uuid)
-
-                            if len(path_parts) >= 2 and path_parts[-1].endswith(".rm"):
-                                page_id = path_parts[-1].rsplit(".", 1)[0]
-                                if notebook_uuid not in updated_pages:
-                                    updated_pages[notebook_uuid] = set()
-                                updated_pages[notebook_uuid].add(page_id)
-
-                        progress.update(task, advance=1, description=local_path.name[:40])
-
-                    except (OSError, SCPException) as e:
-                        print_error(f"  ERR - Failed to download {remote_file['path']}: {e}")
-                        progress.update(task, advance=1)
+                for remote_file, _local_path, error in self._download_files(
+                    self.remote_xochitl_dir, files_to_sync
+                ):
+                    if error is not None:
+                        print_error(f"  ERR - Failed to download {remote_file['path']}: {error}")
+                        failed += 1
+                        bar.advance()
+                        continue
+
+                    # Track notebook UUID if this file belongs to a notebook
+                    relative_path = remote_file["path"][prefix_len:]
+                    match = _UUID_RE.match(relative_path)
+
+                    if match:
+                        notebook_uuid = match.group(1)
+                        updated_notebooks.add(notebook_uuid)
+
+                        if relative_path.endswith(".rm") and "/" in relative_path:
+                            page_id = relative_path.rsplit("/", 1)[1][:-3]
+                            if notebook_uuid not in updated_pages:
+                                updated_pages[notebook_uuid] = set()
+                            updated_pages[notebook_uuid].add(page_id)
+
+                    bar.advance(description=remote_file["path"].rpartition("/")[2][:40])
+
+                bar.flush()
+
+            # A failed file must be listed again next run, so only advance the
+            # listing cutoff when everything arrived
+            if not failed:
+                self._record_listing(scope, max_mtime, incremental)
 
             # Save metadata
             self.metadata.save()
 
-            if updated_notebooks:
+            # Guarded so the sort only happens when debug output is actually wanted
+            if updated_notebooks and logging.getLogger().isEnabledFor(logging.DEBUG):
                 logging.debug("Updated notebook UUIDs: %s", sorted(updated_notebooks))
 
             logging.info(
@@ -315,22 +533,22 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         logging.info("Starting template backup...")
 
         try:
-            # Get list of template files
-            remote_files = self.connection.list_files(self.remote_templates_dir)
-
-            if not remote_files:
-                logging.warning("No template files found on ReMarkable tablet")
-                return True
-
-            # Filter templates that need syncing
+            # Stream the template listing, keeping only templates that need syncing
+            prefix_len = len(self.remote_templates_dir.rstrip("/") + "/")
+            scanned = 0
             files_to_sync = []
-            for remote_file in remote_files:
-                relative_path = os.path.relpath(remote_file["path"], self.remote_templates_dir)
+            for remote_file in self.connection.iter_files(self.remote_templates_dir):
+                scanned += 1
+                relative_path = remote_file["path"][prefix_len:]
                 local_path = self.templates_dir / relative_path
 
                 if self.metadata.should_sync_file(remote_file, local_path):
                     files_to_sync.append((remote_file, local_path))
 
+            if not scanned:
+                logging.warning("No template files found on ReMarkable tablet")
+                return True
+
             if not files_to_sync:
                 logging.info("All template files are up to date")
                 return True
@@ -338,25 +556,24 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
             logging.info("Syncing %d template files...", len(files_to_sync))
 
             # Download template files with progress bar
-            from src.utils.console import create_progress, print_error
+            from src.utils.console import ThrottledProgress, create_progress, print_error
+
+            if self.connection.pool is None:
+                logging.error("Transfer pool not initialized")
+                return False
 
             with create_progress("Templates") as progress:
                 task = progress.add_task("Templates", total=len(files_to_sync))
-                for remote_file, local_path in files_to_sync:
-                    try:
-                        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        if self.connection.scp_client is None:
-                            logging.error("SCP client not initialized")
-                            return False
-                        self.connection.scp_client.get(remote_file["path"], str(local_path))
+                with ThrottledProgress(progress, task) as bar:
+                    for remote_file, _local_path, error in self._download_files(
+                        self.remote_templates_dir, files_to_sync
+                    ):
+                        if error is not None:
+                            print_error(
+                                f"  ERR - Failed to download {remote_file['path']}: {error}"
+                            )
 
-                        self.metadata.update_file_metadata(remote_file, local_path)
-
-                    except (OSError, SCPException) as e:
-                        print_error(f"  ERR - Failed to download {remote_file['path']}: {e}")
-
-                    progress.update(task, advance=1, description=local_path.name[:40])
+                        bar.advance(description=remote_file["path"].rpartition("/")[2][:40])
 
             # Save metadata
             self.metadata.save()
@@ -368,6 +585,43 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
             logging.error("Template backup failed: %s", e)
             return False
 
+    def _scan_files_dir(
+        self,
+    ) -> Tuple[List[Path], Set[str], Dict[str, List[Path]], Dict[str, List[Path]]]:
+        """Scan the backup files directory once, bucketing page files by notebook.
+
+        Returns:
+            Tuple of (.metadata files, UUIDs with a .content file, .rm files by
+            UUID, .json files by UUID)
+        """
+        metadata_files: List[Path] = []
+        content_uuids: Set[str] = set()
+        rm_by_uuid: Dict[str, List[Path]] = defaultdict(list)
+        json_by_uuid: Dict[str, List[Path]] = defaultdict(list)
+
+        try:
+            top_entries = list(os.scandir(self.files_dir))
+        except OSError:
+            return metadata_files, content_uuids, rm_by_uuid, json_by_uuid
+
+        for entry in top_entries:
+            if entry.name.endswith(".metadata") and entry.is_file():
+                metadata_files.append(Path(entry.path))
+            elif entry.name.endswith(".content") and entry.is_file():
+                content_uuids.add(entry.name[: -len(".content")])
+            elif is_page_dir(entry):
+                try:
+                    with os.scandir(entry.path) as children:
+                        for child in children:
+                            if child.name.endswith(".rm"):
+                                rm_by_uuid[entry.name].append(Path(child.path))
+                            elif child.name.endswith(".json"):
+                                json_by_uuid[entry.name].append(Path(child.path))
+                except OSError as e:
+                    logging.debug("Failed to scan %s: %s", entry.path, e)
+
+        return metadata_files, content_uuids, rm_by_uuid, json_by_uuid
+
     def find_notebooks(self) -> List[Dict]:
         """Find and parse notebook metadata.
 
@@ -377,33 +631,52 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         Returns:
             List of dictionaries containing notebook information
         """
-        notebooks = []
+        metadata_files, content_uuids, rm_by_uuid, json_by_uuid = self._scan_files_dir()
+        # A notebook without a .content file is skipped, so don't parse its metadata
+        metadata_files = [f for f in metadata_files if f.stem in content_uuids]
+        if not metadata_files:
+            return []
 
-        # Look for .metadata files which indicate notebooks/documents
-        for metadata_file in self.files_dir.glob("*.metadata"):
-            try:
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+        # Parsing is dominated by per-file open/read latency, so fan out on threads
+        def _parse(metadata_file: Path) -> Optional[Dict]:
+            return self._parse_notebook(metadata_file, rm_by_uuid, json_by_uuid)
+
+        workers = min(NOTEBOOK_SCAN_WORKERS, len(metadata_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [nb for nb in executor.map(_parse, metadata_files) if nb is not None]
 
-                uuid = metadata_file.stem
-                notebook_info = {
-                    "uuid": uuid,
-                    "name": metadata.get("visibleName", "Untitled"),
-                    "type": metadata.get("type", "unknown"),
-                    "parent": metadata.get("parent", ""),
-                    "metadata_file": metadata_file,
-                    "content_file": self.files_dir / f"{uuid}.content",
-                    "rm_files": list(self.files_dir.glob(f"{uuid}/*.rm")),
-                    "pagedata_files": list(self.files_dir.glob(f"{uuid}/*.json")),
-                }
+    def _parse_notebook(
+        self,
+        metadata_file: Path,
+        rm_by_uuid: Dict[str, List[Path]],
+        json_by_uuid: Dict[str, List[Path]],
+    ) -> Optional[Dict]:
+        """Build the notebook info dict for one .metadata file.
+
+        The caller has already checked that the notebook has a .content file.
 
-                if notebook_info["content_file"].exists():
-                    notebooks.append(notebook_info)
+        Returns:
+            The notebook dictionary, or None if the file cannot be parsed
+        """
+        try:
+            metadata = read_json(metadata_file)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning("Failed to parse %s: %s", metadata_file, e)
+            return None
 
-            except (OSError, json.JSONDecodeError) as e:
-                logging.warning("Failed to parse %s: %s", metadata_file, e)
+        uuid = metadata_file.stem
+        content_file = self.files_dir / f"{uuid}.content"
 
-        return notebooks
+        return {
+            "uuid": uuid,
+            "name": metadata.get("visibleName", "Untitled"),
+            "type": metadata.get("type", "unknown"),
+            "parent": metadata.get("parent", ""),
+            "metadata_file": metadata_file,
+            "content_file": content_file,
+            "rm_files": rm_by_uuid.get(uuid, []),
+            "pagedata_files": json_by_uuid.get(uuid, []),
+        }
 
     def convert_to_pdf(self, notebook: Dict) -> Optional[Path]:
         """Convert notebook to PDF using available tools.
@@ -421,18 +694,20 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
 
         # For now, create a placeholder PDF indicating conversion is needed
         # In a real implementation, you would integrate with rm2pdf or rmc
+        txt_path = output_path.with_suffix(".txt")
+        content = (
+            f"Notebook: {notebook['name']}\n"
+            f"UUID: {notebook['uuid']}\n"
+            f"Type: {notebook['type']}\n"
+            f"RM Files: {len(notebook['rm_files'])}\n"
+            f"Pages: {len(notebook['pagedata_files'])}\n"
+            "\nTo convert to PDF, you'll need to install rmc or rm2pdf tools\n"
+            "See: https://github.com/ricklupton/rmc\n"
+        )
         try:
-            with open(output_path.with_suffix(".txt"), "w", encoding="utf-8") as f:
-                f.write(f"Notebook: {notebook['name']}\n")
-                f.write(f"UUID: {notebook['uuid']}\n")
-                f.write(f"Type: {notebook['type']}\n")
-                f.write(f"RM Files: {len(notebook['rm_files'])}\n")
-                f.write(f"Pages: {len(notebook['pagedata_files'])}\n")
-                f.write("\nTo convert to PDF, you'll need to install rmc or rm2pdf tools\n")
-                f.write("See: https://github.com/ricklupton/rmc\n")
-
+            txt_path.write_text(content, encoding="utf-8")
             logging.info("Created metadata for %s", notebook["name"])
-            return output_path.with_suffix(".txt")
+            return txt_path
 
         except OSError as e:
             logging.error("Failed to create PDF metadata for %s: %s", notebook["name"], e)
@@ -501,7 +776,11 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
 
         logging.info("Starting PDF conversion...")
 
-        # Set output directory from config
+        if not updated_notebook_uuids and not force_convert_all:
+            logging.info("No notebooks were updated - skipping PDF conversion")
+            return True
+
+        # Output directory and folder filter both come from the config
         from ..config import load_config
 
         config = load_config()
@@ -511,14 +790,6 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
         else:
             output_dir = self.backup_dir / "PDF"
             logging.warning("No pdf_dir configured, falling back to %s", output_dir)
-
-        if not updated_notebook_uuids and not force_convert_all:
-            logging.info("No notebooks were updated - skipping PDF conversion")
-            return True
-
-        from ..config import load_config
-
-        config = load_config()
         folder_filter = config.get("folders", []) or None
 
         try:
@@ -531,6 +802,8 @@ class ReMarkableBackup:  # pylint: disable=too-many-instance-attributes
                 updated_uuids=updated_notebook_uuids if not force_convert_all else None,
                 updated_pages=updated_pages,
                 folder_filter=folder_filter,
+                workers=config.get("conversion_workers", 1),
+                force=force_convert_all,
             )
 
             if success:
@@ -12,8 +12,12 @@ Connection modes
 """
 
 import logging
+import queue
+import shlex
 import socket
-from typing import Dict, List, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Dict, Generator, Iterator, List, Optional, Tuple
 
 import click
 import paramiko
@@ -41,6 +45,14 @@ USB_HOST = "10.11.99.1"
 # mDNS/Bonjour hostname that many reMarkable tablets advertise on the LAN
 MDNS_HOSTNAME = "remarkable.local"
 
+# Number of concurrent file-transfer channels opened per connection
+DEFAULT_MAX_CONNS = 4
+
+# Seconds between SSH keepalives.  The connection can sit idle for minutes
+# while local files are re-hashed, long enough for Wi-Fi NAT or the tablet's
+# power management to drop it.
+KEEPALIVE_INTERVAL = 30
+
 
 def discover_tablet_host(timeout: float = 3.0) -> Optional[str]:
     """Attempt to discover a reMarkable tablet on the local network.
@@ -66,6 +78,122 @@ def discover_tablet_host(timeout: float = 3.0) -> Optional[str]:
     return None
 
 
+# Per-channel transfer tuning for pooled clients
+SFTP_WINDOW_SIZE = 4 * 1024 * 1024
+SFTP_MAX_PACKET_SIZE = 32 * 1024
+SCP_BUFF_SIZE = 256 * 1024
+
+# Read size when streaming remote command output
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# find actions for listing files, best first, each with its record separator
+_LISTING_FORMS = (
+    ("-printf '%T@ %s %p\\0'", b"\0"),
+    ("-exec stat -c '%Y %s %n' {} +", b"\n"),
+    ("-exec stat -c '%Y %s %n' {} \\;", b"\n"),
+)
+
+
+def _drain_in_background(stream) -> Callable[[], bytes]:
+    """Read *stream* to EOF on a daemon thread.
+
+    Returns a callable that waits for the reader and returns everything read,
+    so a command's stderr cannot back up while its stdout is being consumed.
+    """
+    chunks: List[bytes] = []
+    reader = threading.Thread(target=lambda: chunks.append(stream.read()), daemon=True)
+    reader.start()
+
+    def _result() -> bytes:
+        reader.join()
+        return b"".join(chunks)
+
+    return _result
+
+
+class ConnectionPool:
+    """Pool of file-transfer clients multiplexed over a single SSH transport.
+
+    Each client runs on its own SSH channel, so worker threads can download
+    files concurrently without re-authenticating.  SFTP is preferred; if the
+    tablet's SSH server does not offer the SFTP subsystem the pool falls back
+    to SCP clients, which expose the same ``get(remote, local)`` call.
+
+    Usage::
+
+        with pool.client() as client:
+            client.get(remote_path, local_path)
+    """
+
+    def __init__(self, transport: paramiko.Transport, max_conns: int = DEFAULT_MAX_CONNS):
+        """Open *max_conns* transfer clients on *transport*.
+
+        Args:
+            transport: Authenticated SSH transport to open channels on.
+            max_conns: Number of concurrent transfer clients to open.
+        """
+        self._clients: List = []
+        self._available: queue.Queue = queue.Queue()
+        for _ in range(max(1, max_conns)):
+            try:
+                client = self._open_client(transport)
+            except paramiko.ChannelException as e:
+                # The server caps sessions per connection (OpenSSH MaxSessions);
+                # run with the channels it granted rather than failing the backup
+                if not self._clients:
+                    raise
+                logging.debug("Server refused channel %d: %s", len(self._clients) + 1, e)
+                break
+            self._clients.append(client)
+            self._available.put(client)
+
+    @staticmethod
+    def _open_client(transport: paramiko.Transport):
+        # A wider channel window keeps more of SFTP's prefetched reads in flight
+        # (SFTPClient.get prefetches by default); SCP gets a larger read buffer
+        try:
+            return paramiko.SFTPClient.from_transport(
+                transport, window_size=SFTP_WINDOW_SIZE, max_packet_size=SFTP_MAX_PACKET_SIZE
+            )
+        except paramiko.ChannelException:
+            # No channel to be had at all; an SCP client would fail the same way
+            raise
+        except (paramiko.SSHException, OSError) as e:
+            logging.debug("SFTP unavailable, falling back to SCP: %s", e)
+            return SCPClient(transport, buff_size=SCP_BUFF_SIZE)
+
+    @property
+    def size(self) -> int:
+        """Number of transfer clients in the pool."""
+        return len(self._clients)
+
+    def acquire(self):
+        """Check out a transfer client, blocking until one is free."""
+        return self._available.get()
+
+    def release(self, client) -> None:
+        """Return a client previously obtained from :meth:`acquire`."""
+        self._available.put(client)
+
+    @contextmanager
+    def client(self) -> Iterator:
+        """Context manager that acquires and releases a transfer client."""
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self) -> None:
+        """Close every client in the pool."""
+        for client in self._clients:
+            try:
+                client.close()
+            except (paramiko.SSHException, OSError):
+                pass
+        self._clients = []
+
+
 class ReMarkableConnection:
     """Handles SSH connection to ReMarkable tablet.
 
@@ -86,6 +214,8 @@ class ReMarkableConnection:
         wifi_host: str = "",
         pre_sync_command: str = "",
         post_sync_command: str = "",
+        max_conns: int = DEFAULT_MAX_CONNS,
+        compress: Optional[bool] = None,
     ):
         """Initialize connection parameters.
 
@@ -101,6 +231,10 @@ class ReMarkableConnection:
                        network.  Ignored when *use_wifi* is False.
             pre_sync_command: Shell command to run before SSH connects.
             post_sync_command: Shell command to run after SSH disconnects.
+            max_conns: Number of concurrent file-transfer channels to open.
+            compress: Enable SSH transport compression.  By default only
+                network (Wi-Fi) connections compress: their link is slower
+                than the tablet can deflate, while USB is faster than it.
         """
         # Resolve effective host
         if use_wifi:
@@ -117,6 +251,11 @@ class ReMarkableConnection:
         self.port = port
         self.ssh_client = None
         self.scp_client = None
+        self.pool: Optional[ConnectionPool] = None
+        self.max_conns = max_conns
+        self.compress = self.host != USB_HOST if compress is None else compress
+        # Index into _LISTING_FORMS of the find invocation this tablet accepts
+        self._listing_form = 0
         self.password = password
         self.password_saved = False
         self.pre_sync_command = pre_sync_command.strip()
@@ -222,108 +361,127 @@ class ReMarkableConnection:
         password_attempt = 0
         used_saved_password = False
 
-        while password_attempt < max_password_retries:
-            try:
-                self.ssh_client = paramiko.SSHClient()
-                self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-                # Check if we're using a saved password
-                saved_password = self.get_saved_password()
-                if saved_password and not self.password:
-                    used_saved_password = True
-
-                password = self.get_password()
+        # One client serves every attempt.  A failed connect() leaves its
+        # transport open, so it is closed after each failure, and once more
+        # on any exit that doesn't hand the client to self.
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        connected = False
 
-                # Try multiple connection approaches for ReMarkable compatibility
-                connection_attempts = [
-                    {"timeout": 30, "banner_timeout": 30, "auth_timeout": 30},
-                    {"timeout": 60, "banner_timeout": 60, "auth_timeout": 60},
-                ]
+        def _close_client():
+            try:
+                ssh_client.close()
+            except (paramiko.SSHException, OSError):
+                pass
 
-                for i, params in enumerate(connection_attempts):
-                    try:
-                        logging.info(
-                            "Connection attempt %d with timeout %ds...", i + 1, params["timeout"]
-                        )
-                        self.ssh_client.connect(
-                            hostname=self.host,
-                            username=self.username,
-                            password=password,
-                            port=self.port,
-                            timeout=params["timeout"],
-                            banner_timeout=params["banner_timeout"],
-                            auth_timeout=params["auth_timeout"],
-                            allow_agent=False,
-                            look_for_keys=False,
-                        )
+        try:
+            while password_attempt < max_password_retries:
+                try:
+                    # Check if we're using a saved password
+                    saved_password = self.get_saved_password()
+                    if saved_password and not self.password:
+                        used_saved_password = True
+
+                    password = self.get_password()
+
+                    # Try multiple connection approaches for ReMarkable compatibility
+                    connection_attempts = [
+                        {"timeout": 30, "banner_timeout": 30, "auth_timeout": 30},
+                        {"timeout": 60, "banner_timeout": 60, "auth_timeout": 60},
+                    ]
+
+                    for i, params in enumerate(connection_attempts):
+                        try:
+                            logging.info(
+                                "Connection attempt %d with timeout %ds...",
+                                i + 1,
+                                params["timeout"],
+                            )
+                            ssh_client.connect(
+                                hostname=self.host,
+                                username=self.username,
+                                password=password,
+                                port=self.port,
+                                timeout=params["timeout"],
+                                banner_timeout=params["banner_timeout"],
+                                auth_timeout=params["auth_timeout"],
+                                allow_agent=False,
+                                look_for_keys=False,
+                                compress=self.compress,
+                            )
 
-                        transport = self.ssh_client.get_transport()
-                        if transport is None:
-                            raise ConnectionError("Failed to get SSH transport")
-                        self.scp_client = SCPClient(transport)
-                        logging.info("Connected to ReMarkable tablet at %s", self.host)
-
-                        return True
-
-                    except paramiko.AuthenticationException as e:
-                        logging.warning("Authentication failed on attempt %d: %s", i + 1, e)
-                        # Authentication failed - might be wrong password
-                        if used_saved_password:
-                            print_warn("  WRN - Saved password appears to be incorrect.")
-                            if click.confirm(
-                                "Would you like to enter a new password?", default=True
-                            ):
-                                # Delete the old saved password
-                                self.delete_saved_password()
-                                self.password = None
-                                used_saved_password = False
-                                password_attempt += 1
-                                break  # Break inner loop to retry with new password
-                            else:
-                                if click.confirm("Try saved password again?", default=False):
+                            transport = ssh_client.get_transport()
+                            if transport is None:
+                                raise ConnectionError("Failed to get SSH transport")
+                            transport.set_keepalive(KEEPALIVE_INTERVAL)
+                            self.ssh_client = ssh_client
+                            self.scp_client = SCPClient(transport)
+                            self.pool = ConnectionPool(transport, self.max_conns)
+                            logging.info("Connected to ReMarkable tablet at %s", self.host)
+
+                            connected = True
+                            return True
+
+                        except paramiko.AuthenticationException as e:
+                            _close_client()
+                            logging.warning("Authentication failed on attempt %d: %s", i + 1, e)
+                            # Authentication failed - might be wrong password
+                            if used_saved_password:
+                                print_warn("  WRN - Saved password appears to be incorrect.")
+                                if click.confirm(
+                                    "Would you like to enter a new password?", default=True
+                                ):
+                                    # Delete the old saved password
+                                    self.delete_saved_password()
+                                    self.password = None
+                                    used_saved_password = False
                                     password_attempt += 1
-                                    break
+                                    break  # Break inner loop to retry with new password
                                 else:
-                                    return False
-                        else:
-                            print_error(
-                                "  ERR - Authentication failed. Please check your password."
-                            )
-                            self.password = None
-                            password_attempt += 1
-                            break
-                    except (paramiko.SSHException, OSError) as e:
-                        logging.debug("Connection attempt %d failed: %s", i + 1, e)
-                        if self.ssh_client:
-                            try:
-                                self.ssh_client.close()
-                            except (paramiko.SSHException, OSError):
-                                pass
-                            self.ssh_client = paramiko.SSHClient()
-                            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-                logging.debug("All connection attempts failed")
-
-                print_error(
-                    f"  ERR - Connection to {self.host} failed. "
-                    "Check that the tablet is connected and try again."
-                )
-                return False
-
-            except (paramiko.SSHException, OSError) as e:
-                logging.debug("Failed to connect to ReMarkable: %s", e)
-                print_error(
-                    f"  ERR - Connection to {self.host} failed. "
-                    "Check that the tablet is connected and try again."
-                )
-                return False
-
-        print_error("  ERR - Maximum password retry attempts reached.")
-        return False
+                                    if click.confirm("Try saved password again?", default=False):
+                                        password_attempt += 1
+                                        break
+                                    else:
+                                        return False
+                            else:
+                                print_error(
+                                    "  ERR - Authentication failed. Please check your password."
+                                )
+                                self.password = None
+                                password_attempt += 1
+                                break
+                        except (paramiko.SSHException, OSError) as e:
+                            logging.debug("Connection attempt %d failed: %s", i + 1, e)
+                            _close_client()
+
+                    logging.debug("All connection attempts failed")
+
+                    print_error(
+                        f"  ERR - Connection to {self.host} failed. "
+                        "Check that the tablet is connected and try again."
+                    )
+                    return False
+
+                except (paramiko.SSHException, OSError) as e:
+                    logging.debug("Failed to connect to ReMarkable: %s", e)
+                    print_error(
+                        f"  ERR - Connection to {self.host} failed. "
+                        "Check that the tablet is connected and try again."
+                    )
+                    return False
+
+            print_error("  ERR - Maximum password retry attempts reached.")
+            return False
+        finally:
+            if not connected:
+                _close_client()
 
     def disconnect(self):
         """Close SSH and SCP connections to ReMarkable tablet."""
         print("  Disconnecting...")
+        if self.pool:
+            self.pool.close()
+            self.pool = None
         if self.scp_client:
             self.scp_client.close()
         if self.ssh_client:
@@ -356,38 +514,159 @@ class ReMarkableConnection:
             raise ConnectionError("Not connected to ReMarkable tablet")
 
         _, stdout, stderr = self.ssh_client.exec_command(command)
+        # Drain both streams before waiting for the exit status; otherwise a
+        # large output fills the channel window and the remote command blocks
+        stderr_data = _drain_in_background(stderr)
+        stdout_data = stdout.read()
         exit_code = stdout.channel.recv_exit_status()
 
-        return stdout.read().decode(), stderr.read().decode(), exit_code
+        return stdout_data.decode(), stderr_data().decode(), exit_code
 
-    def list_files(self, remote_path: str) -> List[Dict]:
-        """List files in remote directory with metadata.
+    def execute_command_stream(
+        self, command: str, separator: bytes = b"\n"
+    ) -> Generator[str, None, int]:
+        """Execute command on the tablet, yielding stdout records as they arrive.
+
+        Unlike :meth:`execute_command` nothing is buffered, so callers can
+        start processing output while the command is still running.  The
+        exit code is the generator's return value (``yield from`` result).
+
+        Args:
+            command: Shell command to execute on the tablet
+            separator: Byte sequence terminating each record (newline by
+                default; ``b"\\0"`` for NUL-delimited output)
+
+        Yields:
+            Records of stdout without the separator, decoded as UTF-8 with
+            ``surrogateescape`` so undecodable bytes survive the round trip
+
+        Raises:
+            ConnectionError: If not connected to tablet
+        """
+        if not self.ssh_client:
+            raise ConnectionError("Not connected to ReMarkable tablet")
+
+        _, stdout, stderr = self.ssh_client.exec_command(command)
+        stderr_data = _drain_in_background(stderr)
+        pending = b""
+        while chunk := stdout.read(STREAM_CHUNK_SIZE):
+            records = (pending + chunk).split(separator)
+            pending = records.pop()
+            for record in records:
+                yield record.decode("utf-8", "surrogateescape")
+        if pending:
+            yield pending.decode("utf-8", "surrogateescape")
+
+        exit_code = stdout.channel.recv_exit_status()
+        errors = stderr_data()
+        if exit_code != 0:
+            logging.debug("Command exited with %d: %s", exit_code, errors.decode())
+        return exit_code
+
+    @contextmanager
+    def stream_tar(self, remote_dir: str, rel_paths: List[str]) -> Iterator[BinaryIO]:
+        """Stream a tar archive of *rel_paths* (relative to *remote_dir*) from the tablet.
+
+        Runs ``tar`` on the tablet and yields its stdout as a binary stream,
+        so many files travel over one SSH channel instead of one transfer each.
+
+        Args:
+            remote_dir: Remote directory the paths are relative to
+            rel_paths: Relative paths of the files to archive
+
+        Raises:
+            ConnectionError: If not connected to tablet
+        """
+        if not self.ssh_client:
+            raise ConnectionError("Not connected to ReMarkable tablet")
+        transport = self.ssh_client.get_transport()
+        if transport is None:
+            raise ConnectionError("Failed to get SSH transport")
 
-        Uses the 'find' and 'stat' commands to get file modification times,
-        sizes, and paths for incremental sync comparison.
+        channel = transport.open_session()
+        try:
+            names = " ".join(shlex.quote(p) for p in rel_paths)
+            channel.exec_command(f"tar cf - -C {shlex.quote(remote_dir)} {names}")
+            yield channel.makefile("rb")
+        finally:
+            channel.close()
+
+    def iter_files(self, remote_path: str, newer_than: Optional[int] = None) -> Iterator[Dict]:
+        """Lazily list files in remote directory with metadata.
+
+        Streams ``find`` output so entries are yielded while the tablet is
+        still walking the tree.  GNU find's ``-printf`` with NUL-terminated
+        records is tried first (no ``stat`` process at all, and safe for any
+        filename); busybox find lacks it, so ``-exec stat {} +`` and finally
+        the per-file ``-exec stat {} \\;`` are used as fallbacks.  The form
+        that works is remembered for later listings on this connection.
 
         Args:
             remote_path: Remote directory path to scan
+            newer_than: Only list files modified after this Unix timestamp.
+                If the tablet's find does not support ``-newermt`` the full
+                listing is returned instead.
 
-        Returns:
-            List of dictionaries containing file metadata:
+        Yields:
+            Dictionaries containing file metadata:
             - path: Full file path on tablet
             - mtime: Unix timestamp of last modification
             - size: File size in bytes
         """
-        command = f"find {remote_path} -type f -exec stat -c '%Y %s %n' {{}} \\;"
-        stdout, stderr, exit_code = self.execute_command(command)
+        filters = [""]
+        if newer_than is not None:
+            filters.insert(0, f" -newermt @{newer_than}")
+        forms = sorted(range(len(_LISTING_FORMS)), key=lambda i: i != self._listing_form)
+
+        yielded = False
+        for newer in filters:
+            for form in forms:
+                action, separator = _LISTING_FORMS[form]
+                stream = self.execute_command_stream(
+                    f"find {remote_path} -type f{newer} {action}", separator
+                )
+                while True:
+                    try:
+                        record = next(stream)
+                    except StopIteration as stop:
+                        exit_code = stop.value
+                        break
+                    # "<mtime>[.<fraction>] <size> <path>" — path may contain spaces
+                    mtime, _, rest = record.partition(" ")
+                    size, _, path = rest.partition(" ")
+                    try:
+                        entry = {
+                            "path": path,
+                            "mtime": int(mtime.partition(".")[0]),
+                            "size": int(size),
+                        }
+                    except ValueError:
+                        logging.debug("Skipping malformed listing record: %r", record)
+                        continue
+                    if path:
+                        yielded = True
+                        yield entry
+
+                if exit_code == 0 or yielded:
+                    self._listing_form = form
+                    if exit_code != 0:
+                        logging.warning(
+                            "File listing for %s exited with %d", remote_path, exit_code
+                        )
+                    return
 
-        if exit_code != 0:
-            logging.error("Failed to list files: %s", stderr)
-            return []
-
-        files = []
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split(" ", 2)
-            if len(parts) == 3:
-                files.append({"path": parts[2], "mtime": int(parts[0]), "size": int(parts[1])})
-
-        return files
+        logging.error("Failed to list files in %s", remote_path)
+
+    def list_files(self, remote_path: str) -> List[Dict]:
+        """List files in remote directory with metadata.
+
+        Collects :meth:`iter_files` into a list, for callers that need the
+        whole listing at once; prefer iterating when a single pass will do.
+
+        Args:
+            remote_path: Remote directory path to scan
+
+        Returns:
+            List of dictionaries containing file metadata (see :meth:`iter_files`)
+        """
+        return list(self.iter_files(remote_path))
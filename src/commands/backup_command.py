@@ -18,6 +18,7 @@ def run_backup_command(
     host: str = USB_HOST,
     use_wifi: bool = False,
     wifi_host: str = "",
+    verify_hashes: bool = False,
 ) -> int:
     """Execute the backup command.
 
@@ -30,6 +31,7 @@ def run_backup_command(
         host: Tablet IP/hostname for USB connections
         use_wifi: Use Wi-Fi instead of USB
         wifi_host: Wi-Fi IP/hostname of the tablet
+        verify_hashes: Re-hash every local file to verify backup integrity
 
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -49,6 +51,8 @@ def run_backup_command(
         print("Template backup: Enabled")
     if force:
         print("Force mode: All files will be backed up")
+    if verify_hashes:
+        print("Verify mode: All local files will be re-hashed")
 
     backup_tool = ReMarkableBackup(
         backup_dir,
@@ -56,6 +60,7 @@ def run_backup_command(
         host=host,
         use_wifi=use_wifi,
         wifi_host=wifi_host,
+        verify_hashes=verify_hashes,
     )
 
     try:
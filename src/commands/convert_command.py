@@ -57,11 +57,12 @@ def run_convert_command(
         print(f"[ERROR] Backup directory not found: {backup_dir}")
         return 1
 
+    from ..config import load_config
+
+    config = load_config()
+
     # Set default output directory from config
     if not output_dir:
-        from ..config import load_config
-
-        config = load_config()
         pdf_dir = config.get("pdf_dir", "")
         if pdf_dir:
             output_dir = Path(pdf_dir)
@@ -103,6 +104,8 @@ def run_convert_command(
             sample=sample,
             notebook_filter=notebook,
             updated_uuids=updated_uuids,
+            workers=config.get("conversion_workers", 1),
+            force=force_all,
         )
 
         return 0 if success else 1
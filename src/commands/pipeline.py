@@ -158,6 +158,8 @@ def run_pipeline(
                 updated_uuids=updated_uuids if not force_convert and not skip_backup else None,
                 updated_pages=updated_pages,
                 folder_filter=folder_filter,
+                workers=config.get("conversion_workers", 1),
+                force=force_convert,
             )
             print_success("  OK - PDF conversion done")
             all_page_pdfs = sorted(p for pages in converted_pages.values() for p in pages)
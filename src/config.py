@@ -59,6 +59,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "ai_model": "",
     "pre_sync_command": "",
     "post_sync_command": "",
+    # Notebooks converted in parallel processes: 1 = sequential (default), 0 = one per
+    # CPU.  Parallel runs advance the progress bar a whole notebook at a time.
+    "conversion_workers": 1,
 }
 
 # All available sync actions
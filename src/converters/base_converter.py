@@ -13,11 +13,47 @@ This module provides:
 - Shared utilities for SVG/PDF conversion
 """
 
+import io
 import logging
-import shutil
+import os
+import re
+import tempfile
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
+
+from ..utils import copy_file
+
+try:
+    import cairosvg  # type: ignore
+
+    CAIROSVG_AVAILABLE = True
+except (ImportError, OSError):  # OSError when the libcairo shared library is missing
+    CAIROSVG_AVAILABLE = False
+
+try:
+    import pymupdf  # type: ignore
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz as pymupdf  # type: ignore  # PyMuPDF < 1.24
+
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        PYMUPDF_AVAILABLE = False
+
+# ReMarkable 2 dimensions in PDF points (72 points per inch at 226 DPI)
+REMARKABLE_WIDTH = 447.5  # 1404 pixels / 226 DPI * 72
+REMARKABLE_HEIGHT = 596.7  # 1872 pixels / 226 DPI * 72
+
+# cairosvg sizes output in CSS pixels (96 per inch); PDF points are 72 per inch
+_PX_PER_PT = 96 / 72
+
+# .rm files start with b"reMarkable .lines file, version=N" padded to 43 bytes
+_RM_HEADER_SIZE = 43
+_RM_VERSION_RE = re.compile(rb"version=([3-6])")
 
 
 class BaseConverter(ABC):
@@ -49,23 +85,109 @@ class BaseConverter(ABC):
         raise NotImplementedError("Subclasses must implement can_convert method")
 
     @abstractmethod
-    def convert_to_pdf(self, rm_file: Path, output_file: Path) -> bool:
+    def convert_to_pdf(
+        self, rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+    ) -> bool:
         """Convert a .rm file to PDF.
 
         Args:
             rm_file: Path to the source .rm file
             output_file: Path where the PDF should be created
+            work_dir: Directory for intermediate files, shared by every page
+                of a notebook.  A private temporary directory is used if None.
 
         Returns:
             bool: True if conversion was successful, False otherwise
         """
         raise NotImplementedError("Subclasses must implement convert_to_pdf method")
 
+    @contextmanager
+    def scratch_dir(self, work_dir: Optional[Path] = None) -> Iterator[Path]:
+        """Yield *work_dir*, or a private temporary directory removed on exit."""
+        if work_dir is not None:
+            yield work_dir
+            return
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def _svg_to_pdf_cairo(self, svg: Union[Path, bytes], label: str, pdf_file: Path) -> bool:
+        """Render SVG to PDF with cairosvg, scaled to fit the ReMarkable page.
+
+        Returns False when cairosvg is unavailable or fails, so the caller
+        can fall back to svglib.
+        """
+        if not CAIROSVG_AVAILABLE:
+            return False
+        source = {"bytestring": svg} if isinstance(svg, bytes) else {"url": str(svg)}
+        try:
+            cairosvg.svg2pdf(
+                **source,
+                write_to=str(pdf_file),
+                output_width=REMARKABLE_WIDTH * _PX_PER_PT,
+                output_height=REMARKABLE_HEIGHT * _PX_PER_PT,
+            )
+        except Exception as e:  # noqa: BLE001
+            self.logger.debug("cairosvg conversion error for %s: %s", label, e)
+            return False
+
+        if pdf_file.exists() and pdf_file.stat().st_size > 500:
+            self.logger.debug("SVG to PDF conversion successful (cairo): %s", pdf_file.name)
+            return True
+
+        self.logger.debug("cairosvg output missing or too small: %s", pdf_file.name)
+        return False
+
+    def _svg_to_pdf_mupdf(self, svg: Union[Path, bytes], label: str, pdf_file: Path) -> bool:
+        """Render SVG to PDF with PyMuPDF's native SVG reader.
+
+        The page is laid out the way the svglib path lays it out: a drawing
+        that already fits keeps its own size, anything else is scaled onto
+        a ReMarkable-sized page and anchored to its bottom-left corner, just
+        as reportlab draws it.
+
+        Returns False when PyMuPDF is unavailable or fails, so the caller
+        can fall back to svglib.
+        """
+        if not PYMUPDF_AVAILABLE:
+            return False
+        try:
+            data = svg if isinstance(svg, bytes) else Path(svg).read_bytes()
+            with pymupdf.open(stream=data, filetype="svg") as svg_doc:
+                drawing = pymupdf.open("pdf", svg_doc.convert_to_pdf())
+            with drawing, pymupdf.open() as out:
+                bounds = drawing[0].rect
+                scale = min(REMARKABLE_WIDTH / bounds.width, REMARKABLE_HEIGHT / bounds.height)
+                if abs(scale - 1.0) > 0.01:
+                    page = out.new_page(width=REMARKABLE_WIDTH, height=REMARKABLE_HEIGHT)
+                    target = pymupdf.Rect(
+                        0,
+                        REMARKABLE_HEIGHT - bounds.height * scale,
+                        bounds.width * scale,
+                        REMARKABLE_HEIGHT,
+                    )
+                else:
+                    page = out.new_page(width=bounds.width, height=bounds.height)
+                    target = page.rect
+                page.show_pdf_page(target, drawing, 0)
+                out.save(str(pdf_file), garbage=3, deflate=True, no_new_id=True)
+        except Exception as e:  # noqa: BLE001
+            self.logger.debug("PyMuPDF SVG conversion error for %s: %s", label, e)
+            return False
+
+        if pdf_file.exists() and pdf_file.stat().st_size > 500:
+            self.logger.debug("SVG to PDF conversion successful (mupdf): %s", pdf_file.name)
+            return True
+
+        self.logger.debug("PyMuPDF output missing or too small: %s", pdf_file.name)
+        return False
+
     def svg_to_pdf(self, svg_file: Path, pdf_file: Path) -> bool:
-        """Convert SVG file to PDF using svglib and reportlab.
+        """Convert SVG file to PDF.
 
-        This is a common utility function used by multiple converters
-        that work through SVG intermediate format.
+        Uses cairosvg (C rendering via libcairo) when it is installed, then
+        PyMuPDF, both far faster than svglib on stroke-dense pages, and
+        otherwise svglib and reportlab.  This is a common utility function used by multiple
+        converters that work through SVG intermediate format.
 
         Args:
             svg_file: Path to the source SVG file
@@ -74,6 +196,28 @@ class BaseConverter(ABC):
         Returns:
             bool: True if conversion was successful, False otherwise
         """
+        return self._svg_to_pdf(svg_file, svg_file.name, pdf_file)
+
+    def svg_data_to_pdf(self, svg_data: bytes, pdf_file: Path, label: str = "SVG data") -> bool:
+        """Convert in-memory SVG markup to PDF, without an intermediate file.
+
+        Args:
+            svg_data: UTF-8 encoded SVG document
+            pdf_file: Path where the PDF should be created
+            label: Name used in log messages (typically the source .rm file)
+
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        return self._svg_to_pdf(svg_data, label, pdf_file)
+
+    def _svg_to_pdf(self, svg: Union[Path, bytes], label: str, pdf_file: Path) -> bool:
+        """Shared body of :meth:`svg_to_pdf` and :meth:`svg_data_to_pdf`."""
+        if self._svg_to_pdf_cairo(svg, label, pdf_file):
+            return True
+        if self._svg_to_pdf_mupdf(svg, label, pdf_file):
+            return True
+
         try:
             # Import conversion libraries at runtime to avoid hard dependencies
             from reportlab.graphics import renderPDF  # pylint: disable=import-outside-toplevel
@@ -84,9 +228,9 @@ class BaseConverter(ABC):
 
         try:
             # Convert SVG to reportlab drawing
-            drawing = svg2rlg(str(svg_file))
+            drawing = svg2rlg(io.BytesIO(svg) if isinstance(svg, bytes) else str(svg))
             if drawing is None:
-                self.logger.debug("Failed to parse SVG file: %s", svg_file.name)
+                self.logger.debug("Failed to parse SVG file: %s", label)
                 return False
 
             # Log drawing dimensions for debugging
@@ -94,10 +238,6 @@ class BaseConverter(ABC):
                 "SVG drawing dimensions: width=%s, height=%s", drawing.width, drawing.height
             )
 
-            # ReMarkable 2 dimensions in PDF points (72 points per inch at 226 DPI)
-            REMARKABLE_WIDTH = 447.5  # 1404 pixels / 226 DPI * 72
-            REMARKABLE_HEIGHT = 596.7  # 1872 pixels / 226 DPI * 72
-
             # Scale the drawing to fit ReMarkable dimensions if needed
             if drawing.width > 0 and drawing.height > 0:
                 scale_x = REMARKABLE_WIDTH / drawing.width
@@ -128,7 +268,7 @@ class BaseConverter(ABC):
             return False
 
         except Exception as e:  # noqa: BLE001
-            self.logger.debug("SVG to PDF conversion error for %s: %s", svg_file.name, e)
+            self.logger.debug("SVG to PDF conversion error for %s: %s", label, e)
             return False
 
     def copy_existing_pdf(self, source_pdf: Path, target_pdf: Path) -> bool:
@@ -145,8 +285,12 @@ class BaseConverter(ABC):
             # Ensure target directory exists
             target_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy the PDF file
-            shutil.copy2(source_pdf, target_pdf)
+            # Copy the PDF file.  copy_file() copies in the kernel (a clone on
+            # btrfs/XFS); the rename keeps an interrupted copy from leaving a
+            # truncated target that later looks up to date.
+            partial_pdf = target_pdf.with_name(target_pdf.name + ".part")
+            copy_file(source_pdf, partial_pdf)
+            os.replace(partial_pdf, target_pdf)
 
             # Verify the copy was successful
             if target_pdf.exists() and target_pdf.stat().st_size > 0:
@@ -173,30 +317,12 @@ class BaseConverter(ABC):
             Optional[str]: Version string (e.g., "5", "6") or None if undetectable
         """
         try:
-            with open(rm_file, "rb") as f:
-                header = f.read(50).decode("utf-8", errors="ignore")
-
-                # Check for known version patterns
-                if "version=6" in header:
-                    return "6"
-                if "version=5" in header:
-                    return "5"
-                if "version=4" in header:
-                    return "4"
-                if "version=3" in header:
-                    return "3"
-
-                # Try to detect by file size and content patterns
-                f.seek(0)
-                content = f.read(32)
-                if len(content) > 8:
-                    # Additional heuristics could go here
-                    pass
-                return None
-
-        except Exception as e:  # noqa: BLE001
+            with open(rm_file, "rb", buffering=0) as f:
+                match = _RM_VERSION_RE.search(f.read(_RM_HEADER_SIZE))
+        except OSError as e:
             self.logger.debug("Version detection failed for %s: %s", rm_file.name, e)
             return None
+        return match.group(1).decode() if match else None
 
     def __str__(self) -> str:
         """Return string representation of the converter."""
@@ -13,8 +13,8 @@ This module provides:
 - SVG intermediate format processing
 """
 
-import tempfile
 from pathlib import Path
+from typing import Optional
 
 from .base_converter import BaseConverter
 
@@ -38,6 +38,9 @@ class V4Converter(BaseConverter):
     def __init__(self):
         """Initialize the v4 converter."""
         super().__init__("v4")
+        # Failed imports aren't cached by Python, so remember a missing rmrl
+        # rather than searching sys.path again for every page
+        self._rmrl_missing = False
 
     def can_convert(self, rm_file: Path) -> bool:
         """Check if this converter can handle the given .rm file.
@@ -54,7 +57,9 @@ class V4Converter(BaseConverter):
         version = self.detect_version(rm_file)
         return version == "4"
 
-    def convert_to_pdf(self, rm_file: Path, output_file: Path) -> bool:
+    def convert_to_pdf(
+        self, rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+    ) -> bool:
         """Convert a v4 .rm file to PDF using rmrl library.
 
         Uses rmrl to attempt rendering the .rm file to SVG format first,
@@ -66,21 +71,24 @@ class V4Converter(BaseConverter):
         Args:
             rm_file: Path to the source v4 .rm file
             output_file: Path where the PDF should be created
+            work_dir: Directory for intermediate files (temporary if None)
 
         Returns:
             bool: True if conversion was successful, False otherwise
         """
+        if self._rmrl_missing:
+            return False
         try:
             # Import rmrl on demand to handle missing dependencies gracefully
             import rmrl  # type: ignore # pylint: disable=import-outside-toplevel
         except ImportError:
+            self._rmrl_missing = True
             self.logger.debug("rmrl library not available for v4 conversion")
             return False
 
         try:
-            # Create temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
+            # Intermediate files go in the shared or a private temporary directory
+            with self.scratch_dir(work_dir) as temp_path:
                 svg_file = temp_path / f"{rm_file.stem}.svg"
 
                 # Step 1: Attempt to convert .rm to SVG using rmrl
@@ -104,6 +112,7 @@ class V4Converter(BaseConverter):
                 # Step 2: Convert SVG to PDF
                 self.logger.debug("Converting SVG to PDF for v4 file %s", rm_file.name)
                 success = self.svg_to_pdf(svg_file, output_file)
+                svg_file.unlink(missing_ok=True)
 
                 if success:
                     self.logger.debug(
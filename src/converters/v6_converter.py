@@ -9,27 +9,39 @@ Entry Point:
 
 This module provides:
 - Conversion of v6 format .rm files (current ReMarkable format)
-- Integration with rmc command-line tool
+- Integration with the rmc library, falling back to the rmc command-line tool
 - SVG intermediate format processing
 """
 
+import io
+import logging
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
+from typing import Optional
 
 from .base_converter import BaseConverter
 
+try:
+    from rmc.exporters.svg import tree_to_svg
+    from rmscene import read_tree
+
+    RMC_LIBRARY_AVAILABLE = True
+except ImportError:
+    RMC_LIBRARY_AVAILABLE = False
+
 
 class V6Converter(BaseConverter):
     """Converter for ReMarkable v6 format files using rmc library.
 
     The v6 format is the current format used by ReMarkable tablets.
-    This converter uses the 'rmc' command-line tool to convert files
-    through an SVG intermediate format.
+    This converter renders files through an SVG intermediate format with
+    rmc, calling the library in-process when it is importable so each page
+    doesn't pay for starting an ``rmc`` subprocess.
 
     Conversion Process:
-    1. Use rmc to convert .rm file to SVG
+    1. Use rmc to convert .rm file to SVG (in memory, else the rmc CLI
+       writing to a temporary file)
     2. Use svglib/reportlab to convert SVG to PDF
     3. Clean up temporary files
     """
@@ -37,6 +49,9 @@ class V6Converter(BaseConverter):
     def __init__(self):
         """Initialize the v6 converter."""
         super().__init__("v6")
+        # Set once the rmc command turns out not to be installed, so later
+        # pages don't each pay for a failed process spawn
+        self._rmc_cli_missing = False
 
     def can_convert(self, rm_file: Path) -> bool:
         """Check if this converter can handle the given .rm file.
@@ -53,7 +68,27 @@ class V6Converter(BaseConverter):
         version = self.detect_version(rm_file)
         return version == "6"
 
-    def convert_to_pdf(self, rm_file: Path, output_file: Path) -> bool:
+    def _render_svg_in_process(self, rm_file: Path) -> Optional[bytes]:
+        """Render *rm_file* to SVG markup with the rmc library.
+
+        Returns None when the library is missing or cannot parse the file,
+        in which case the caller falls back to the rmc command-line tool.
+        """
+        if not RMC_LIBRARY_AVAILABLE:
+            return None
+        try:
+            with open(rm_file, "rb") as f:
+                tree = read_tree(f)
+            buf = io.StringIO()
+            tree_to_svg(tree, buf)
+            return buf.getvalue().encode("utf-8")
+        except Exception as e:  # noqa: BLE001
+            self.logger.debug("In-process rmc failed for %s: %s", rm_file.name, e)
+            return None
+
+    def convert_to_pdf(
+        self, rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+    ) -> bool:
         """Convert a v6 .rm file to PDF using rmc tool.
 
         Uses rmc to convert the .rm file to SVG format first, then
@@ -62,14 +97,33 @@ class V6Converter(BaseConverter):
         Args:
             rm_file: Path to the source v6 .rm file
             output_file: Path where the PDF should be created
+            work_dir: Directory for intermediate files (temporary if None)
 
         Returns:
             bool: True if conversion was successful, False otherwise
         """
+        # Fast path: render in-process and hand the SVG straight to the PDF
+        # renderer, with no subprocess and no temporary files
+        svg_data = self._render_svg_in_process(rm_file)
+        if svg_data is not None:
+            if len(svg_data) < 100:
+                self.logger.debug("SVG output too small for %s", rm_file.name)
+                return False
+            success = self.svg_data_to_pdf(svg_data, output_file, rm_file.name)
+            if success:
+                self.logger.debug(
+                    "v6 conversion successful: %s -> %s", rm_file.name, output_file.name
+                )
+            else:
+                self.logger.debug("SVG to PDF conversion failed for %s", rm_file.name)
+            return success
+
+        if self._rmc_cli_missing:
+            return False
+
         try:
-            # Create temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
+            # Intermediate files go in the shared or a private temporary directory
+            with self.scratch_dir(work_dir) as temp_path:
                 svg_file = temp_path / f"{rm_file.stem}.svg"
 
                 _no_window = {}
@@ -78,9 +132,15 @@ class V6Converter(BaseConverter):
 
                 # Step 1: Convert .rm to SVG using rmc
                 self.logger.debug("Converting %s to SVG using rmc", rm_file.name)
+                # rmc writes the SVG to -o, so stdout is never needed and
+                # stderr only matters when it is going to be logged
+                # rmc children are already bounded by the notebook's page
+                # threads, which the caller sizes to its share of the CPUs
+                want_stderr = self.logger.isEnabledFor(logging.DEBUG)
                 result = subprocess.run(
                     ["rmc", "-t", "svg", "-o", str(svg_file), str(rm_file)],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
                     text=True,
                     timeout=30,
                     check=False,
@@ -105,6 +165,7 @@ class V6Converter(BaseConverter):
                 # Step 2: Convert SVG to PDF
                 self.logger.debug("Converting SVG to PDF for %s", rm_file.name)
                 success = self.svg_to_pdf(svg_file, output_file)
+                svg_file.unlink(missing_ok=True)
 
                 if success:
                     self.logger.debug(
@@ -118,6 +179,10 @@ class V6Converter(BaseConverter):
         except subprocess.TimeoutExpired:
             self.logger.warning("rmc conversion timeout for %s", rm_file.name)
             return False
+        except FileNotFoundError:
+            self._rmc_cli_missing = True
+            self.logger.warning("rmc not found; v6 pages cannot be converted (pip install rmc)")
+            return False
         except Exception as e:  # noqa: BLE001
             self.logger.debug("v6 conversion error for %s: %s", rm_file.name, e)
             return False
@@ -134,8 +199,8 @@ class V6Converter(BaseConverter):
                 kwargs["creationflags"] = 0x08000000
             result = subprocess.run(
                 ["rmc", "--version"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
                 check=False,
                 **kwargs,
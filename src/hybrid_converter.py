@@ -17,32 +17,65 @@ This module provides:
 """
 
 import hashlib
-import json
+import io
 import logging
-import shutil
+import os
+import re
 import tempfile
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 # Import modular converter classes
 from .converters import V4Converter, V5Converter, V6Converter
 from .template_renderer import TemplateRenderer
-from .utils import sanitize_name
+from .utils import copy_file, dump_json, is_page_dir, read_json, sanitize_name
 
 # Suppress warnings from third-party libraries to reduce output noise
 warnings.filterwarnings("ignore")
 
+# Upper bound on pages of one notebook converted concurrently
+MAX_PAGE_WORKERS = 8
+
+# Parsed .metadata files, relative to the backup directory
+METADATA_CACHE_FILE = Path(".cache") / "metadata.json"
+
+# .rm files start with b"reMarkable .lines file, version=N" padded to 43 bytes
+_RM_HEADER_SIZE = 43
+_RM_VERSION_RE = re.compile(rb"version=(\d)")
+_RM_VERSION_BUCKETS = {b"6": "v6_files", b"5": "v5_files", b"4": "v4_files", b"3": "v3_files"}
+
 
 def _hash_file(path: Path) -> str:
-    """Return MD5 hex-digest of *path*, or empty string if it doesn't exist."""
-    if not path.exists():
+    """Return the SHA-256 hex-digest of *path*, or empty string if it doesn't exist.
+
+    Only compared within a run, so the algorithm is free to follow the backup
+    metadata's: OpenSSL's SHA-256 uses the CPU's SHA extensions, and
+    file_digest() hashes in C without a Python read loop.
+    """
+    try:
+        with open(path, "rb") as fh:
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+    except OSError:
         return ""
-    h = hashlib.md5()
-    with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+
+
+def _is_fresh(target: Path, sources: List[Path]) -> bool:
+    """Return True if *target* exists and is at least as new as every existing source."""
+    try:
+        target_mtime = target.stat().st_mtime_ns
+    except OSError:
+        return False
+    for source in sources:
+        try:
+            if source.stat().st_mtime_ns > target_mtime:
+                return False
+        except OSError:
+            continue
+    return True
 
 
 def setup_logging(verbose: bool = False):
@@ -71,14 +104,71 @@ v5_converter = V5Converter()
 v6_converter = V6Converter()
 
 
+def _load_metadata_cache(cache_file: Path) -> Dict[str, list]:
+    """Return the ``{name: [mtime_ns, size, metadata]}`` cache, or {} if unusable."""
+    try:
+        cache = read_json(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_metadata_cache(cache_file: Path, cache: Dict[str, list]) -> None:
+    """Atomically write the metadata cache; failures only cost a re-parse next run."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(dump_json(cache))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.debug("Could not write metadata cache %s: %s", cache_file, e)
+
+
+def _scan_files_dir(
+    files_dir: Path,
+) -> Tuple[List[Path], Dict[str, List[Path]], Dict[str, List[Path]]]:
+    """Scan the backup files directory once, bucketing page files by notebook.
+
+    Returns:
+        Tuple of (.metadata files, .rm files by UUID, .pdf files by UUID)
+    """
+    metadata_files: List[Path] = []
+    rm_by_uuid: Dict[str, List[Path]] = defaultdict(list)
+    pdf_by_uuid: Dict[str, List[Path]] = defaultdict(list)
+
+    try:
+        top_entries = list(os.scandir(files_dir))
+    except OSError:
+        return metadata_files, rm_by_uuid, pdf_by_uuid
+
+    for entry in top_entries:
+        if entry.name.endswith(".metadata") and entry.is_file():
+            metadata_files.append(Path(entry.path))
+        elif is_page_dir(entry):
+            try:
+                with os.scandir(entry.path) as children:
+                    for child in children:
+                        if child.name.endswith(".rm"):
+                            rm_by_uuid[entry.name].append(Path(child.path))
+                        elif child.name.endswith(".pdf"):
+                            pdf_by_uuid[entry.name].append(Path(child.path))
+            except OSError as e:
+                logging.debug("Failed to scan %s: %s", entry.path, e)
+
+    return metadata_files, rm_by_uuid, pdf_by_uuid
+
+
 def find_notebooks(backup_dir: Path) -> List[Dict]:
     """Find and parse notebook metadata from backup directory.
 
     Scans the backup directory for .metadata files and analyzes associated
     .rm files to classify them by version for appropriate conversion tools.
+    Parsed metadata is cached in ``backup_dir/.cache/metadata.json`` keyed
+    by file name, mtime and size, so unchanged files are not re-parsed.
 
     File Version Detection:
-    - Reads the first 8 bytes of each .rm file to detect format version
+    - Reads the 43-byte header of each .rm file (unbuffered, one read) and
+      matches ``version=N`` in it with ``_RM_VERSION_RE``
     - version=5: Uses rmrl library (legacy format)
     - version=6: Uses rmc library (current format)
     - version=4: Detected but limited support (attempts rmrl fallback)
@@ -105,10 +195,21 @@ def find_notebooks(backup_dir: Path) -> List[Dict]:
         logging.error(f"Backup files directory not found: {files_dir}")
         return []
 
-    for metadata_file in files_dir.glob("*.metadata"):
+    cache_file = backup_dir / METADATA_CACHE_FILE
+    cache = _load_metadata_cache(cache_file)
+    fresh_cache: Dict[str, list] = {}
+    metadata_files, rm_by_uuid, pdf_by_uuid = _scan_files_dir(files_dir)
+
+    for metadata_file in metadata_files:
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            st = metadata_file.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(metadata_file.name)
+            if entry and entry[:2] == stamp:
+                metadata = entry[2]
+            else:
+                metadata = read_json(metadata_file)
+            fresh_cache[metadata_file.name] = stamp + [metadata]
 
             uuid = metadata_file.stem
             notebook_type = metadata.get("type", "unknown")
@@ -120,8 +221,8 @@ def find_notebooks(backup_dir: Path) -> List[Dict]:
                     "type": notebook_type,
                     "parent": metadata.get("parent", ""),
                     "metadata_file": metadata_file,
-                    "rm_files": list(files_dir.glob(f"{uuid}/*.rm")),
-                    "pdf_files": list(files_dir.glob(f"{uuid}/*.pdf")),
+                    "rm_files": rm_by_uuid.get(uuid, []),
+                    "pdf_files": pdf_by_uuid.get(uuid, []),
                 }
 
                 # Analyze file versions
@@ -133,18 +234,15 @@ def find_notebooks(backup_dir: Path) -> List[Dict]:
                 for rm_file in notebook_info["rm_files"]:
                     try:
                         # Read file header to determine version format
-                        # Each .rm file starts with a version identifier in ASCII
-                        with open(rm_file, "rb") as f:
-                            header = f.read(50).decode("ascii", errors="ignore")
-                            # Classify files by version for appropriate conversion tool
-                            if "version=6" in header:
-                                notebook_info["v6_files"].append(rm_file)
-                            elif "version=5" in header:
-                                notebook_info["v5_files"].append(rm_file)
-                            elif "version=4" in header:
-                                notebook_info["v4_files"].append(rm_file)
-                            elif "version=3" in header:
-                                notebook_info["v3_files"].append(rm_file)
+                        # Each .rm file starts with a version identifier in ASCII.
+                        # Unbuffered, so the read fetches the header rather
+                        # than a full 8 KiB buffer of stroke data.
+                        with open(rm_file, "rb", buffering=0) as f:
+                            match = _RM_VERSION_RE.search(f.read(_RM_HEADER_SIZE))
+                        # Classify files by version for appropriate conversion tool
+                        bucket = _RM_VERSION_BUCKETS.get(match.group(1)) if match else None
+                        if bucket:
+                            notebook_info[bucket].append(rm_file)
                     except Exception:
                         # Ignore files that can't be read or don't have valid headers
                         pass
@@ -165,6 +263,9 @@ def find_notebooks(backup_dir: Path) -> List[Dict]:
         except Exception as e:  # noqa: BLE001
             logging.warning(f"Failed to parse {metadata_file}: {e}")
 
+    if fresh_cache != cache:
+        _save_metadata_cache(cache_file, fresh_cache)
+
     return notebooks
 
 
@@ -186,13 +287,14 @@ def svg_to_pdf(svg_file: Path, pdf_file: Path) -> bool:
 
 
 def merge_pdf_with_template(
-    content_pdf: Path, template_pdf: Optional[Path], output_pdf: Path
+    content_pdf: Path, template_pdf: Union[Path, bytes, None], output_pdf: Path
 ) -> bool:
     """Merge a content PDF with a template background PDF.
 
     Args:
         content_pdf: Path to PDF with notebook content
-        template_pdf: Path to PDF with template background (None for no template)
+        template_pdf: Template background, as a path or as the PDF bytes
+            (None for no template)
         output_pdf: Path where merged PDF should be saved
 
     Returns:
@@ -208,13 +310,21 @@ def merge_pdf_with_template(
         writer = PdfWriter()
 
         # If we have a template, merge it with the content
-        if template_pdf and template_pdf.exists():
-            template_reader = PdfReader(str(template_pdf))
+        if isinstance(template_pdf, Path):
+            template_pdf = template_pdf.read_bytes() if template_pdf.exists() else None
+        if template_pdf:
+            template_bytes = template_pdf
+            template_reader = PdfReader(io.BytesIO(template_bytes))
             if len(template_reader.pages) > 0:
                 # For each content page, start with a fresh copy of the template
-                for content_page in content_reader.pages:
-                    # Get a fresh copy of the template page (always use first template page)
-                    template_copy = PdfReader(str(template_pdf)).pages[0]
+                for i, content_page in enumerate(content_reader.pages):
+                    # merge_page() modifies the page in place, so every content
+                    # page after the first needs its own parse of the template
+                    # (always use first template page).  Page PDFs hold a single
+                    # page, so usually the template is parsed only once.
+                    if i > 0:
+                        template_reader = PdfReader(io.BytesIO(template_bytes))
+                    template_copy = template_reader.pages[0]
 
                     # Merge content on top of template
                     template_copy.merge_page(content_page)
@@ -235,10 +345,58 @@ def merge_pdf_with_template(
         return output_pdf.exists() and output_pdf.stat().st_size > 0
 
     except Exception as e:
-        logging.debug(f"PDF template merge failed: {e}")
+        logging.debug("PDF template merge failed: %s", e)
         return False
 
 
+def _merge_pdfs_pikepdf(pdf_files: List[Path], output_file: Path) -> None:
+    """Merge with pikepdf (QPDF); raises ImportError when it isn't installed."""
+    import pikepdf  # type: ignore
+
+    with pikepdf.Pdf.new() as merged:
+        for pdf_file in pdf_files:
+            with pikepdf.Pdf.open(pdf_file) as src:
+                merged.pages.extend(src.pages)
+        # deterministic_id keeps unchanged merges byte-identical for pdf_changed;
+        # object streams pack the many small per-page objects compactly
+        merged.save(
+            output_file,
+            deterministic_id=True,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+
+
+def _merge_pdfs_pymupdf(pdf_files: List[Path], output_file: Path) -> None:
+    """Merge with PyMuPDF (MuPDF); raises ImportError when it isn't installed."""
+    try:
+        import pymupdf  # type: ignore
+    except ImportError:
+        import fitz as pymupdf  # type: ignore  # PyMuPDF < 1.24
+
+    with pymupdf.open() as merged:
+        for pdf_file in pdf_files:
+            with pymupdf.open(pdf_file) as src:
+                merged.insert_pdf(src)
+        # no_new_id keeps unchanged merges byte-identical for pdf_changed;
+        # garbage=3 also merges the fonts and resources every page repeats
+        merged.save(output_file, no_new_id=True, deflate=True, garbage=3)
+
+
+def _merge_pdfs_pypdf2(pdf_files: List[Path], output_file: Path) -> None:
+    """Merge with the pure-Python PyPDF2."""
+    from PyPDF2 import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for pdf_file in pdf_files:
+        reader = PdfReader(str(pdf_file))
+        for page in reader.pages:
+            writer.add_page(page)
+
+    with open(output_file, "wb") as f:
+        writer.write(f)
+
+
 def merge_pdfs(pdf_files: List[Path], output_file: Path) -> bool:
     """Merge multiple PDF files into a single PDF document.
 
@@ -253,29 +411,41 @@ def merge_pdfs(pdf_files: List[Path], output_file: Path) -> bool:
         bool: True if merge successful, False otherwise
 
     Note:
-        Uses PyPDF2 for PDF manipulation. Creates parent directories
-        if they don't exist.
+        Uses the first available of pikepdf, PyMuPDF and PyPDF2.  The
+        first two copy pages in C without building Python page objects,
+        which is much faster and flatter on memory for long notebooks.
+        A single input is copied byte-for-byte instead of re-written.
+        Creates parent directories if they don't exist.
     """
+    existing = [pdf_file for pdf_file in pdf_files if pdf_file.exists()]
     try:
-        from PyPDF2 import PdfReader, PdfWriter
-
-        writer = PdfWriter()
-
-        for pdf_file in pdf_files:
-            if pdf_file.exists():
-                reader = PdfReader(str(pdf_file))
-                for page in reader.pages:
-                    writer.add_page(page)
-
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "wb") as f:
-            writer.write(f)
+    except OSError as e:
+        logging.debug(f"PDF merge failed: {e}")
+        return False
 
+    # A single page needs no merging: copying it skips parsing and
+    # re-serialising the PDF (common for one-page notes and quick sheets)
+    if len(existing) == 1:
+        try:
+            copy_file(existing[0], output_file)
+        except OSError as e:
+            logging.debug("PDF copy failed for %s: %s", output_file.name, e)
+            return False
+        return output_file.stat().st_size > 0
+
+    for backend in (_merge_pdfs_pikepdf, _merge_pdfs_pymupdf, _merge_pdfs_pypdf2):
+        try:
+            backend(existing, output_file)
+        except ImportError:
+            continue
+        except Exception as e:
+            logging.debug("PDF merge with %s failed: %s", backend.__name__, e)
+            continue
         return output_file.exists() and output_file.stat().st_size > 0
 
-    except Exception as e:
-        logging.debug(f"PDF merge failed: {e}")
-        return False
+    logging.debug("PDF merge failed for %s", output_file.name)
+    return False
 
 
 def organize_notebooks_by_structure(notebooks: List[Dict], backup_dir: Path) -> Dict:
@@ -301,10 +471,14 @@ def organize_notebooks_by_structure(notebooks: List[Dict], backup_dir: Path) ->
     # Build folder structure
     folder_structure = {}
     documents_to_convert = []
+    hierarchy_cache: Dict[str, List[Tuple[str, str]]] = {}
+    # Folders already parsed by find_notebooks, so resolving a parent
+    # chain doesn't re-read their .metadata files
+    folders = {item["uuid"]: item for item in notebooks if item["type"] == "CollectionType"}
 
     for item in notebooks:
         if item["type"] == "DocumentType":
-            hierarchy = get_folder_hierarchy(item, backup_dir)
+            hierarchy = get_folder_hierarchy(item, backup_dir, hierarchy_cache, folders)
             item["folder_path"] = "/".join(name for name, _ in hierarchy)
             item["folder_hierarchy"] = hierarchy
             documents_to_convert.append(item)
@@ -317,36 +491,68 @@ def organize_notebooks_by_structure(notebooks: List[Dict], backup_dir: Path) ->
     return {"folder_structure": folder_structure, "documents_to_convert": documents_to_convert}
 
 
-def get_folder_hierarchy(notebook: Dict, backup_dir: Path) -> List[tuple]:
+def get_folder_hierarchy(
+    notebook: Dict,
+    backup_dir: Path,
+    cache: Optional[Dict[str, List[Tuple[str, str]]]] = None,
+    folders: Optional[Dict[str, Dict]] = None,
+) -> List[Tuple[str, str]]:
     """Get the folder hierarchy for a notebook by following parent UUIDs.
 
     Returns a list of ``(raw_name, uuid)`` tuples ordered from root to
     immediate parent, e.g. ``[("1:1", "abc..."), ("L65+", "def...")]``.
+
+    *cache* maps folder UUIDs to their resolved hierarchy (the folder
+    itself included).  Pass the same dict for every notebook so shared
+    ancestors are only read from disk once.
+
+    *folders* maps folder UUIDs to their :func:`find_notebooks` entries;
+    folders found there are not read from disk at all.
     """
-    hierarchy = []
-    current_uuid = notebook.get("parent")
+    if cache is None:
+        cache = {}
     files_dir = backup_dir / "Notebooks"
 
-    while current_uuid and current_uuid != "":
+    # Walk up until the root or an already-resolved folder
+    chain: List[Tuple[str, str]] = []
+    resolved: List[Tuple[str, str]] = []
+    current_uuid = notebook.get("parent")
+    while current_uuid:
+        if current_uuid in cache:
+            resolved = cache[current_uuid]
+            break
+        if any(uuid == current_uuid for uuid, _ in chain):
+            logging.debug(f"Parent cycle detected at {current_uuid}")
+            break
+        folder = folders.get(current_uuid) if folders else None
+        if folder is not None:
+            chain.append((current_uuid, folder["name"]))
+            current_uuid = folder.get("parent")
+            continue
         try:
-            metadata_file = files_dir / f"{current_uuid}.metadata"
-            if metadata_file.exists():
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-                folder_name = metadata.get("visibleName", "Unknown")
-                if folder_name:
-                    hierarchy.insert(0, (folder_name, current_uuid))
-                current_uuid = metadata.get("parent")
-            else:
-                break
+            # No exists() check first: a missing parent (e.g. "trash") just
+            # fails the open, saving a stat for every ancestor that is there
+            metadata = read_json(files_dir / f"{current_uuid}.metadata")
+        except FileNotFoundError:
+            break
         except Exception as e:
             logging.debug(f"Failed to read parent metadata for {current_uuid}: {e}")
             break
+        chain.append((current_uuid, metadata.get("visibleName", "Unknown")))
+        current_uuid = metadata.get("parent")
+
+    hierarchy = list(resolved)
+    for folder_uuid, folder_name in reversed(chain):
+        if folder_name:
+            hierarchy.append((folder_name, folder_uuid))
+        cache[folder_uuid] = list(hierarchy)
 
     return hierarchy
 
 
-def convert_v6_file_with_rmc(rm_file: Path, output_file: Path) -> bool:
+def convert_v6_file_with_rmc(
+    rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+) -> bool:
     """Convert v6 format .rm file to PDF using modular V6Converter.
 
     This is a wrapper function that maintains backward compatibility
@@ -355,14 +561,17 @@ def convert_v6_file_with_rmc(rm_file: Path, output_file: Path) -> bool:
     Args:
         rm_file: Path to the v6 format .rm file
         output_file: Path where PDF should be saved
+        work_dir: Directory for intermediate files (temporary if None)
 
     Returns:
         bool: True if conversion successful, False otherwise
     """
-    return v6_converter.convert_to_pdf(rm_file, output_file)
+    return v6_converter.convert_to_pdf(rm_file, output_file, work_dir)
 
 
-def convert_v5_file_with_rmrl(rm_file: Path, output_file: Path) -> bool:
+def convert_v5_file_with_rmrl(
+    rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+) -> bool:
     """Convert v5 format .rm file to PDF using modular V5Converter.
 
     This is a wrapper function that maintains backward compatibility
@@ -371,14 +580,17 @@ def convert_v5_file_with_rmrl(rm_file: Path, output_file: Path) -> bool:
     Args:
         rm_file: Path to the v5 format .rm file
         output_file: Path where PDF should be saved
+        work_dir: Directory for intermediate files (temporary if None)
 
     Returns:
         bool: True if conversion successful, False otherwise
     """
-    return v5_converter.convert_to_pdf(rm_file, output_file)
+    return v5_converter.convert_to_pdf(rm_file, output_file, work_dir)
 
 
-def convert_v4_file_with_rmrl(rm_file: Path, output_file: Path) -> bool:
+def convert_v4_file_with_rmrl(
+    rm_file: Path, output_file: Path, work_dir: Optional[Path] = None
+) -> bool:
     """Convert v4 format .rm file to PDF using modular V4Converter.
 
     This is a wrapper function that maintains backward compatibility
@@ -387,6 +599,7 @@ def convert_v4_file_with_rmrl(rm_file: Path, output_file: Path) -> bool:
     Args:
         rm_file: Path to the v4 format .rm file
         output_file: Path where PDF should be saved
+        work_dir: Directory for intermediate files (temporary if None)
 
     Returns:
         bool: True if conversion successful, False otherwise
@@ -394,7 +607,7 @@ def convert_v4_file_with_rmrl(rm_file: Path, output_file: Path) -> bool:
     Note:
         v4 format support is limited and may fail for many files.
     """
-    return v4_converter.convert_to_pdf(rm_file, output_file)
+    return v4_converter.convert_to_pdf(rm_file, output_file, work_dir)
 
 
 def copy_existing_pdf(pdf_file: Path, output_file: Path) -> bool:
@@ -429,8 +642,7 @@ def get_page_templates(content_file: Path) -> Dict[str, str]:
         return page_templates
 
     try:
-        with open(content_file, "r", encoding="utf-8") as f:
-            content_data = json.load(f)
+        content_data = read_json(content_file)
 
         # Extract pages from cPages structure
         c_pages = content_data.get("cPages", {})
@@ -445,7 +657,7 @@ def get_page_templates(content_file: Path) -> Dict[str, str]:
                 page_templates[page_id] = template_name
 
     except Exception as e:
-        logging.debug(f"Failed to extract page templates from {content_file}: {e}")
+        logging.debug("Failed to extract page templates from %s: %s", content_file, e)
 
     return page_templates
 
@@ -459,6 +671,8 @@ def convert_notebook(
     on_page_done: Optional[callable] = None,
     on_page_start: Optional[callable] = None,
     registry=None,
+    page_workers: int = MAX_PAGE_WORKERS,
+    force: bool = False,
 ) -> Dict:
     """Convert a notebook using appropriate tools for each file type.
 
@@ -474,11 +688,16 @@ def convert_notebook(
         backup_dir: RemarkableSync backup root directory.
         template_renderer: Optional template renderer for backgrounds.
         changed_page_ids: Set of page IDs whose ``.rm`` files changed.
-            When *None* all pages are (re-)converted.
+            When *None*, pages whose cached PDF is older than their ``.rm``
+            file are (re-)converted, and a merged PDF newer than all of its
+            pages is left as is.
         on_page_done: Callback ``(cached: bool)`` called after each page.
             *cached* is True when the page was served from cache.
         registry: Optional :class:`~src.utils.name_registry.NameRegistry`
             for stable, deduplicated output path names.
+        page_workers: Maximum number of pages converted concurrently.
+            Callbacks always run on the calling thread, in page order.
+        force: Re-convert and re-merge everything, ignoring cached output.
     """
     # Build output directory using registry if available, else plain sanitize
     hierarchy = notebook.get("folder_hierarchy", [])
@@ -496,11 +715,8 @@ def convert_notebook(
             output_notebook_dir = output_notebook_dir / sanitize_name(folder_name)
         safe_name = sanitize_name(notebook["name"]) or f"notebook_{notebook['uuid'][:8]}"
 
-    output_notebook_dir.mkdir(parents=True, exist_ok=True)
-
     # Persistent page PDF cache directory
     page_cache_dir = backup_dir / "PagePDFs" / notebook["uuid"]
-    page_cache_dir.mkdir(parents=True, exist_ok=True)
 
     results = {
         "name": notebook["name"],
@@ -516,15 +732,27 @@ def convert_notebook(
         "output_files": [],
     }
 
+    # A document with no pages of any kind produces nothing, so don't create
+    # (possibly remote) directories just to leave them empty
+    if not any(
+        notebook.get(key) for key in ("v5_files", "v6_files", "v4_files", "v3_files", "pdf_files")
+    ):
+        results["page_pdfs"] = []
+        return results
+
+    output_notebook_dir.mkdir(parents=True, exist_ok=True)
+    page_cache_dir.mkdir(parents=True, exist_ok=True)
+
     # Collect all PDF pages to merge (in order)
     page_pdfs = []
 
-    # Template temp dir (still ephemeral — templates are cheap to render)
-    template_temp_dir = None
-    if template_renderer:
-        template_temp_dir = Path(tempfile.mkdtemp(prefix="remarkable_templates_"))
+    # One scratch dir per notebook for converter intermediates.  It lives
+    # in the system temp dir, not next to the output, is created only once
+    # some page actually needs converting, and *scratch* removes it on exit
+    # even if conversion raises.
+    work_dir: Optional[Path] = None
 
-    try:
+    with ExitStack() as scratch:
         # Resolve ordered pages using .content file if present
         metadata_file = notebook.get("metadata_file")
         content_path = metadata_file.with_suffix(".content") if metadata_file else None
@@ -551,8 +779,7 @@ def convert_notebook(
         ordered_pages: List[Path] = []
         if content_path and content_path.exists():
             try:
-                with open(content_path, "r", encoding="utf-8") as cf:
-                    content_json = json.load(cf)
+                content_json = read_json(content_path)
                 page_ids = content_json.get("pages", [])
                 # v6 notebooks use cPages.pages with {id, idx, ...} dicts
                 if not page_ids:
@@ -563,13 +790,13 @@ def convert_notebook(
                     if pid in all_rm_by_id:
                         ordered_pages.append(all_rm_by_id[pid])
                     else:
-                        candidate = base_dir / f"{pid}.rm"
-                        if candidate.exists():
-                            ordered_pages.append(candidate)
-                        else:
-                            alt = list((content_path.parent).glob(f"{pid}.rm"))
-                            if alt:
-                                ordered_pages.append(alt[0])
+                        # A page the header scan couldn't classify, or a
+                        # loose page file next to the .content file
+                        page_file = f"{pid}.rm"
+                        for candidate in (base_dir / page_file, content_path.parent / page_file):
+                            if candidate.exists():
+                                ordered_pages.append(candidate)
+                                break
             except Exception as e:
                 logging.debug("Failed reading content ordering for %s: %s", notebook["name"], e)
 
@@ -581,83 +808,158 @@ def convert_notebook(
                 + notebook.get("v4_files", [])
             )
 
-        def _needs_conversion(page_id: str) -> bool:
-            """Check if a page needs (re-)conversion."""
-            if changed_page_ids is None:
-                return True  # No change info → convert all
-            return page_id in changed_page_ids
+        # Template files by name, looked up once per notebook
+        template_files: Dict[str, Optional[Path]] = {}
 
-        def _convert_page(rm_file: Path, version_tag: str, convert_fn, result_key: str) -> tuple:
-            """Convert a single page, using cache when possible.
+        def _page_sources(source: Path) -> List[Path]:
+            """Return every file a page's cached PDF is rendered from.
 
-            Returns ``(path, cached)`` where *cached* is True when the
-            page was served from the persistent cache without conversion.
-            Returns ``(None, False)`` on failure.
+            The .content file carries the page's template, and the template
+            file its background, so editing either leaves the .rm untouched
+            but still stales the cached page.
+            """
+            sources = [source]
+            if content_path:
+                sources.append(content_path)
+            if template_renderer:
+                template_name = page_templates.get(source.stem, "Blank")
+                if template_name and template_name != "Blank":
+                    if template_name not in template_files:
+                        template_files[template_name] = template_renderer.get_template_file(
+                            template_name
+                        )
+                    if template_files[template_name]:
+                        sources.append(template_files[template_name])
+            return sources
+
+        def _needs_conversion(source: Path, cached_pdf: Path) -> bool:
+            """Check if a page needs (re-)conversion."""
+            if force:
+                return True
+            if changed_page_ids is None:
+                # No change info → convert pages older than anything they're built from
+                return not _is_fresh(cached_pdf, _page_sources(source))
+            return source.stem in changed_page_ids
+
+        def _cached_page(rm_file: Path) -> Optional[Path]:
+            """Return the cached PDF for a page that hasn't changed, else None."""
+            cached_pdf = page_cache_dir / f"{rm_file.stem}.pdf"
+            if not _needs_conversion(rm_file, cached_pdf) and cached_pdf.exists():
+                return cached_pdf
+            return None
+
+        def _convert_page(rm_file: Path) -> Optional[Path]:
+            """Convert a single page into the page cache.
+
+            Returns the page PDF, or None on failure.  Runs on a worker
+            thread, so it must not touch *results* or the progress callbacks.
             """
             page_id = rm_file.stem
             cached_pdf = page_cache_dir / f"{page_id}.pdf"
 
-            # Use cached PDF if page hasn't changed
-            if not _needs_conversion(page_id) and cached_pdf.exists():
-                return cached_pdf, True
+            if page_id in v6_ids:
+                convert_fn = convert_v6_file_with_rmc
+            elif page_id in v4_ids:
+                convert_fn = convert_v4_file_with_rmrl
+            else:
+                convert_fn = convert_v5_file_with_rmrl
 
             # Convert the .rm file to a content PDF
             content_pdf = page_cache_dir / f"{page_id}_content.pdf"
-            if not convert_fn(rm_file, content_pdf):
-                return None, False
+            if not convert_fn(rm_file, content_pdf, work_dir=work_dir):
+                return None
 
             # Apply template if available
-            if template_renderer and template_temp_dir:
+            if template_renderer:
                 template_name = page_templates.get(page_id, "Blank")
                 if template_name and template_name != "Blank":
-                    temp_template_pdf = template_temp_dir / f"template_{page_id}.pdf"
-                    if template_renderer.render_template_to_pdf(template_name, temp_template_pdf):
-                        if merge_pdf_with_template(content_pdf, temp_template_pdf, cached_pdf):
+                    # The background goes straight from the renderer's cache
+                    # into the merge, with no per-page template file
+                    template_pdf = template_renderer.render_template_pdf(template_name)
+                    if template_pdf:
+                        if merge_pdf_with_template(content_pdf, template_pdf, cached_pdf):
                             # Clean up intermediate content PDF
                             try:
                                 content_pdf.unlink(missing_ok=True)
                             except OSError:
                                 pass
-                            results[result_key] += 1
-                            return cached_pdf, False
+                            return cached_pdf
 
-            # No template or template merge failed — content PDF is the final
+            # No template or template merge failed — content PDF is the final.
+            # Both live in the page cache dir, so a rename replaces the old
+            # page without copying the new one.
             if content_pdf != cached_pdf:
                 try:
-                    shutil.copy2(content_pdf, cached_pdf)
-                    content_pdf.unlink(missing_ok=True)
+                    os.replace(content_pdf, cached_pdf)
                 except OSError:
                     cached_pdf = content_pdf
-            results[result_key] += 1
-            return cached_pdf, False
+            return cached_pdf
+
+        all_cached = True
 
-        # Convert all pages in content-file order
-        for rm_file in ordered_pages:
+        def _record_page(rm_file: Path, pdf: Optional[Path], cached: bool) -> None:
+            nonlocal all_cached
+            all_cached = all_cached and cached
             page_id = rm_file.stem
-            if on_page_start:
-                on_page_start()
-            if page_id in v6_ids:
-                pdf, cached = _convert_page(rm_file, "v6", convert_v6_file_with_rmc, "v6_converted")
-            elif page_id in v4_ids:
-                pdf, cached = _convert_page(
-                    rm_file, "v4", convert_v4_file_with_rmrl, "v4_converted"
-                )
-            else:
-                pdf, cached = _convert_page(
-                    rm_file, "v5", convert_v5_file_with_rmrl, "v5_converted"
-                )
             if pdf:
                 page_pdfs.append(pdf)
+                if not cached:
+                    if page_id in v6_ids:
+                        results["v6_converted"] += 1
+                    elif page_id in v4_ids:
+                        results["v4_converted"] += 1
+                    else:
+                        results["v5_converted"] += 1
             if on_page_done:
                 on_page_done(cached=cached)
 
+        # Convert all pages in content-file order.  Each page is an
+        # independent rmc/rmrl run, so when several pages changed they are
+        # spread over a thread pool sized to those pages alone; map() hands
+        # results back in page order.  Cached pages never enter the pool.
+        cached_pages = {rm_file: _cached_page(rm_file) for rm_file in ordered_pages}
+        pending = [rm_file for rm_file in ordered_pages if cached_pages[rm_file] is None]
+        if pending:
+            work_dir = Path(
+                scratch.enter_context(
+                    tempfile.TemporaryDirectory(
+                        prefix=f"remarkable_convert_{notebook['uuid'][:8]}_",
+                        ignore_cleanup_errors=True,
+                    )
+                )
+            )
+        workers = min(page_workers, len(pending))
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            if executor:
+                converted = executor.map(_convert_page, pending)
+            else:
+                # The builtin map() is lazy, so each page converts right
+                # after its on_page_start callback
+                converted = map(_convert_page, pending)
+            for rm_file in ordered_pages:
+                if on_page_start:
+                    on_page_start()
+                if cached_pages[rm_file] is not None:
+                    _record_page(rm_file, cached_pages[rm_file], True)
+                else:
+                    _record_page(rm_file, next(converted), False)
+        finally:
+            if executor:
+                executor.shutdown()
+
         # Copy existing PDFs
         for i, pdf_file in enumerate(notebook["pdf_files"]):
             if on_page_start:
                 on_page_start()
             cached_pdf = page_cache_dir / f"existing_{i+1:03d}.pdf"
             was_cached = False
-            if not cached_pdf.exists() or changed_page_ids is None:
+            if (
+                force
+                or not cached_pdf.exists()
+                or (changed_page_ids is None and _needs_conversion(pdf_file, cached_pdf))
+            ):
+                all_cached = False
                 if copy_existing_pdf(pdf_file, cached_pdf):
                     page_pdfs.append(cached_pdf)
                     results["pdfs_copied"] += 1
@@ -674,18 +976,35 @@ def convert_notebook(
         # Create merged PDF if we have any pages
         if page_pdfs:
             final_pdf = output_notebook_dir / f"{safe_name}.pdf"
-            pre_merge_hash = _hash_file(final_pdf)
 
-            if merge_pdfs(page_pdfs, final_pdf):
+            # Nothing was re-rendered and the merged PDF is newer than every
+            # page and the page ordering, so the existing output is current
+            up_to_date = (
+                changed_page_ids is None
+                and not force
+                and all_cached
+                and _is_fresh(final_pdf, page_pdfs + ([content_path] if content_path else []))
+            )
+            if up_to_date:
                 results["output_files"].append(final_pdf)
-                results["pdf_changed"] = _hash_file(final_pdf) != pre_merge_hash
-                logging.info(
-                    f"OK - {notebook['name']}: Merged {len(page_pdfs)} pages into {final_pdf.name}"
-                )
+                results["pdf_changed"] = False
+                logging.info("OK - %s: Up to date (%s)", notebook["name"], final_pdf.name)
             else:
-                logging.warning(
-                    f"[FAIL] {notebook['name']}: Failed to merge {len(page_pdfs)} pages"
-                )
+                pre_merge_hash = _hash_file(final_pdf)
+
+                if merge_pdfs(page_pdfs, final_pdf):
+                    results["output_files"].append(final_pdf)
+                    results["pdf_changed"] = _hash_file(final_pdf) != pre_merge_hash
+                    logging.info(
+                        "OK - %s: Merged %d pages into %s",
+                        notebook["name"],
+                        len(page_pdfs),
+                        final_pdf.name,
+                    )
+                else:
+                    logging.warning(
+                        "[FAIL] %s: Failed to merge %d pages", notebook["name"], len(page_pdfs)
+                    )
 
         results["total_files"] = (
             len(notebook["v5_files"])
@@ -698,30 +1017,32 @@ def convert_notebook(
         # Unsupported versions note
         if results["v4_detected"] or results["v3_detected"]:
             unsupported_info = output_notebook_dir / f"{safe_name}_unsupported.txt"
+            lines = [
+                f"Notebook: {notebook['name']}",
+                f"UUID: {notebook['uuid']}",
+                "",
+                "Detected unsupported .rm versions:",
+            ]
+            if results["v4_detected"]:
+                lines.append(
+                    f"  - v4 pages: {results['v4_detected']} (no converter implemented yet)"
+                )
+            if results["v3_detected"]:
+                lines.append(f"  - v3 pages: {results['v3_detected']} (legacy format)")
+            lines.append(
+                "\nSuggestion: Keep these files; future tooling or an older firmware converter may be needed.\n"
+            )
+            note = "\n".join(lines)
             try:
-                with open(unsupported_info, "w", encoding="utf-8") as f:
-                    f.write(f"Notebook: {notebook['name']}\n")
-                    f.write(f"UUID: {notebook['uuid']}\n\n")
-                    f.write("Detected unsupported .rm versions:\n")
-                    if results["v4_detected"]:
-                        f.write(
-                            f"  - v4 pages: {results['v4_detected']} (no converter implemented yet)\n"
-                        )
-                    if results["v3_detected"]:
-                        f.write(f"  - v3 pages: {results['v3_detected']} (legacy format)\n")
-                    f.write(
-                        "\nSuggestion: Keep these files; future tooling or an older firmware converter may be needed.\n"
-                    )
+                # Rewritten only when it changes, so reruns leave its mtime alone
+                try:
+                    unchanged = unsupported_info.read_text(encoding="utf-8") == note
+                except OSError:
+                    unchanged = False
+                if not unchanged:
+                    unsupported_info.write_text(note, encoding="utf-8")
                 results["output_files"].append(unsupported_info)
             except Exception as e:
                 logging.debug("Could not write unsupported info for %s: %s", notebook["name"], e)
 
-    finally:
-        # Clean up template temp dir only (page PDFs are persistent cache)
-        try:
-            if template_temp_dir and template_temp_dir.exists():
-                shutil.rmtree(template_temp_dir, ignore_errors=True)
-        except Exception as e:
-            logging.debug(f"Cleanup error: {e}")
-
     return results
@@ -16,15 +16,15 @@ Output structure (inside the output directory)::
 """
 
 import hashlib
-import json
 import logging
+import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .ocr.ocr_engine import OCREngine
-from .utils import sanitize_name
+from .utils import read_json, sanitize_name
 from .utils.name_registry import NameRegistry
 
 # ---------------------------------------------------------------------------
@@ -41,6 +41,19 @@ def _file_hash(path: Path) -> str:
     return h.hexdigest()
 
 
+def _safe_folder_parts(notebook: Dict) -> List[str]:
+    """Return the sanitized folder names from the root down to *notebook*.
+
+    Uses the raw ``folder_hierarchy`` names when present, as the converter
+    does, so a folder name containing ``/`` maps to the same directory.
+    """
+    hierarchy = notebook.get("folder_hierarchy")
+    if hierarchy is not None:
+        return [sanitize_name(name) for name, _ in hierarchy]
+    folder_path = notebook.get("folder_path", "")
+    return [sanitize_name(segment) for segment in folder_path.split("/")] if folder_path else []
+
+
 # ---------------------------------------------------------------------------
 # Markdown exporter
 # ---------------------------------------------------------------------------
@@ -77,8 +90,7 @@ class MarkdownExporter:
         if not content_path.exists():
             return None
         try:
-            with open(content_path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = read_json(content_path)
             page_ids = data.get("pages", [])
             if not page_ids:
                 cpages = data.get("cPages", {}).get("pages", [])
@@ -87,6 +99,25 @@ class MarkdownExporter:
         except Exception:
             return None
 
+    @staticmethod
+    def _list_page_pdfs(cache: Path) -> Optional[Dict[str, Path]]:
+        """Map page IDs to the page PDFs in *cache*, or None if it doesn't exist.
+
+        One scandir pass, with no separate exists() check; ``*_content``
+        files hold the strokes without a template and are left out.
+        """
+        try:
+            with os.scandir(cache) as entries:
+                return {
+                    entry.name[:-4]: Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".pdf")
+                    and not entry.name.endswith("_content.pdf")
+                    and not entry.name.startswith(".")
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     # ------------------------------------------------------------------
     # Page image export
     # ------------------------------------------------------------------
@@ -315,11 +346,7 @@ class MarkdownExporter:
         safe = sanitize_name(name) or f"notebook_{uuid[:8]}"
 
         # Notebook becomes a folder
-        notebook_dir = self.output_dir
-        if folder_path:
-            for segment in folder_path.split("/"):
-                notebook_dir = notebook_dir / sanitize_name(segment)
-        notebook_dir = notebook_dir / safe
+        notebook_dir = self.output_dir.joinpath(*_safe_folder_parts(notebook), safe)
         notebook_dir.mkdir(parents=True, exist_ok=True)
 
         # Determine pages to process
@@ -480,14 +507,18 @@ class MarkdownExporter:
         nb_page_counts = []
         # Count total pages that actually need OCR processing
         total_ocr_pages = 0
+        # Page PDFs found in each notebook's cache dir, listed once here and
+        # reused by the export loop below
+        cached_page_pdfs: Dict[str, Dict[str, Path]] = {}
         for nb in doc_notebooks:
             count = 0
             if converted_pages and nb["uuid"] in converted_pages:
                 count = len(converted_pages[nb["uuid"]])
             else:
-                cache = self.backup_dir / "PagePDFs" / nb["uuid"]
-                if cache.exists():
-                    count = len([p for p in cache.glob("*.pdf") if not p.stem.endswith("_content")])
+                pdfs_on_disk = self._list_page_pdfs(self.backup_dir / "PagePDFs" / nb["uuid"])
+                if pdfs_on_disk is not None:
+                    cached_page_pdfs[nb["uuid"]] = pdfs_on_disk
+                    count = len(pdfs_on_disk)
             count = max(count, 1)
             nb_page_counts.append(count)
             total_pages += count
@@ -517,36 +548,25 @@ class MarkdownExporter:
                 )
 
                 safe = sanitize_name(notebook["name"]) or f"notebook_{notebook['uuid'][:8]}"
-                folder_path = notebook.get("folder_path", "")
 
                 # Locate the PDF produced by the converter
-                pdf_dir = pdf_output_dir
-                if folder_path:
-                    for seg in folder_path.split("/"):
-                        pdf_dir = pdf_dir / sanitize_name(seg)
-                pdf_path = pdf_dir / f"{safe}.pdf"
+                pdf_path = pdf_output_dir.joinpath(*_safe_folder_parts(notebook), f"{safe}.pdf")
 
                 # Use page PDFs from pipeline if available, else scan cache
                 page_pdfs_list: Optional[List[Path]] = None
                 if converted_pages and notebook["uuid"] in converted_pages:
                     page_pdfs_list = converted_pages[notebook["uuid"]]
                 else:
-                    page_cache_dir = self.backup_dir / "PagePDFs" / notebook["uuid"]
-                    if page_cache_dir.exists():
-                        pdfs_on_disk = {
-                            p.stem: p
-                            for p in page_cache_dir.glob("*.pdf")
-                            if not p.stem.endswith("_content")
-                        }
-                        if pdfs_on_disk:
-                            # Order by .content file if available
-                            ordered = self._get_content_page_order(notebook)
-                            if ordered:
-                                page_pdfs_list = [
-                                    pdfs_on_disk[pid] for pid in ordered if pid in pdfs_on_disk
-                                ]
-                            else:
-                                page_pdfs_list = sorted(pdfs_on_disk.values())
+                    pdfs_on_disk = cached_page_pdfs.get(notebook["uuid"])
+                    if pdfs_on_disk:
+                        # Order by .content file if available
+                        ordered = self._get_content_page_order(notebook)
+                        if ordered:
+                            page_pdfs_list = [
+                                pdfs_on_disk[pid] for pid in ordered if pid in pdfs_on_disk
+                            ]
+                        else:
+                            page_pdfs_list = sorted(pdfs_on_disk.values())
 
                 # Filter to specific page if requested
                 if page_filter and page_pdfs_list:
@@ -14,12 +14,62 @@ This module provides:
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .hybrid_converter import convert_notebook, find_notebooks, organize_notebooks_by_structure
 from .template_renderer import TemplateRenderer
 from .utils.console import create_progress, print_error
+from .utils.logging import init_worker_logging, worker_log_queue
+
+_worker_renderer: Optional[TemplateRenderer] = None
+_worker_renderer_ready = False
+
+
+def _notebook_page_count(notebook: dict) -> int:
+    """Return the number of pages a notebook contributes to the progress bar."""
+    return (
+        len(notebook.get("v5_files", []))
+        + len(notebook.get("v6_files", []))
+        + len(notebook.get("v4_files", []))
+        + len(notebook.get("pdf_files", []))
+    )
+
+
+def _convert_in_worker(
+    notebook: dict,
+    output_dir: Path,
+    backup_dir: Path,
+    changed_page_ids: Optional[set],
+    page_workers: int,
+    force: bool,
+) -> dict:
+    """Convert one notebook inside a worker process.
+
+    The template renderer is built once per worker process, on the first
+    notebook it receives, since it cannot be shared across processes.
+    """
+    global _worker_renderer, _worker_renderer_ready  # pylint: disable=global-statement
+    if not _worker_renderer_ready:
+        _worker_renderer_ready = True
+        templates_dir = backup_dir / "Templates"
+        if templates_dir.exists():
+            try:
+                _worker_renderer = TemplateRenderer(templates_dir)
+            except Exception as e:
+                logging.warning(f"Failed to initialize template renderer: {e}")
+
+    return convert_notebook(
+        notebook,
+        output_dir,
+        backup_dir,
+        _worker_renderer,
+        changed_page_ids=changed_page_ids,
+        page_workers=page_workers,
+        force=force,
+    )
 
 
 def run_conversion(
@@ -31,6 +81,8 @@ def run_conversion(
     updated_uuids: Optional[set] = None,
     updated_pages: Optional[dict] = None,
     folder_filter: Optional[list] = None,
+    workers: int = 1,
+    force: bool = False,
 ) -> Tuple[bool, Dict[str, List[Path]], List[Path]]:
     """Run PDF conversion on backed up notebooks.
 
@@ -43,6 +95,11 @@ def run_conversion(
         updated_uuids: Set of notebook UUIDs to convert. When None, all are converted.
         updated_pages: Dict mapping notebook UUID to set of changed page IDs
         folder_filter: List of top-level folder names to include.
+        workers: Number of notebooks to convert in parallel worker processes.
+            ``1`` converts sequentially in this process; ``0`` or less uses
+            one worker per CPU.
+        force: Re-convert every page and re-merge every PDF, even when the
+            cached output is newer than its sources.
 
     Returns:
         Tuple of (success: bool, converted: dict).  ``converted`` maps
@@ -65,6 +122,10 @@ def run_conversion(
         logging.warning("No items found in backup directory")
         return False, {}, []
 
+    # Folders are kept aside so paths still resolve (without re-reading their
+    # .metadata files) once the filters below have dropped them
+    folders = [item for item in all_items if item["type"] == "CollectionType"]
+
     # Filter by updated UUIDs if provided
     if updated_uuids is not None:
         if not updated_uuids:
@@ -88,7 +149,10 @@ def run_conversion(
             return False, {}, []
 
     # Organize into folder structure
-    organization = organize_notebooks_by_structure(all_items, backup_dir)
+    kept = {item["uuid"] for item in all_items}
+    organization = organize_notebooks_by_structure(
+        all_items + [f for f in folders if f["uuid"] not in kept], backup_dir
+    )
     notebooks = organization["documents_to_convert"]
 
     # Filter by selected folders if provided
@@ -117,10 +181,15 @@ def run_conversion(
     if sample and sample > 0:
         notebooks = notebooks[:sample]
 
-    # Initialize template renderer if templates directory exists
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(notebooks))
+
+    # Initialize template renderer if templates directory exists.  Worker
+    # processes build their own, so only the sequential path needs one here.
     templates_dir = backup_dir / "Templates"
     template_renderer = None
-    if templates_dir.exists():
+    if workers == 1 and templates_dir.exists():
         try:
             template_renderer = TemplateRenderer(templates_dir)
             logging.info(
@@ -134,71 +203,107 @@ def run_conversion(
     converted: Dict[str, List[Path]] = {}
     merged_pdfs: List[Path] = []
 
-    # Count total pages across all notebooks for the progress bar
-    total_pages = 0
-    for nb in notebooks:
-        total_pages += len(nb.get("v5_files", []))
-        total_pages += len(nb.get("v6_files", []))
-        total_pages += len(nb.get("v4_files", []))
-        total_pages += len(nb.get("pdf_files", []))
+    def _changed_pages(notebook):
+        if updated_pages is None:
+            return None
+        return updated_pages.get(notebook["uuid"], set())
+
+    def _collect(notebook, results):
+        nonlocal successful
+        if results["output_files"]:
+            successful += 1
+            page_pdfs = results.get("page_pdfs", [])
+            merged = [f for f in results["output_files"] if isinstance(f, Path)]
+            merged_pdfs.extend(merged)
+            if page_pdfs and results.get("pdf_changed", True):
+                converted[notebook["uuid"]] = page_pdfs
+            elif page_pdfs:
+                logging.debug("PDF unchanged after conversion, skipping MD: %s", notebook["name"])
+
+    # Count each notebook's pages once; the total sizes the progress bar and
+    # the per-notebook counts drive scheduling and progress updates
+    page_counts = {nb["uuid"]: _notebook_page_count(nb) for nb in notebooks}
+    total_pages = sum(page_counts.values())
 
     print(f"  Converting {len(notebooks)} notebooks ({total_pages} pages)...")
 
     with create_progress("Converting") as progress:
         task = progress.add_task("Converting", total=total_pages)
 
-        for notebook in notebooks:
-            nb_name = notebook["name"][:30]
-            nb_total = (
-                len(notebook.get("v5_files", []))
-                + len(notebook.get("v6_files", []))
-                + len(notebook.get("v4_files", []))
-                + len(notebook.get("pdf_files", []))
-            )
-            page_counter = [0]  # mutable so the lambda can update it
-
-            def _on_page_done(_pc=page_counter, _nb=nb_name, _nbt=nb_total, cached=False):
-                _pc[0] += 1
-                progress.update(task, advance=1)
-                suffix = " [cached]" if cached else ""
-                logging.info("PDF: %s (page %d/%d)%s", _nb, _pc[0], _nbt, suffix)
-
-            def _on_page_start(_pc=page_counter, _nb=nb_name, _nbt=nb_total):
-                progress.update(
-                    task,
-                    description=f"{_nb} (page {_pc[0] + 1} of {_nbt})",
-                )
-
-            progress.update(task, description=f"{nb_name} (page 1 of {nb_total})")
-
-            try:
-                notebook_changed_pages = None
-                if updated_pages is not None:
-                    notebook_changed_pages = updated_pages.get(notebook["uuid"], set())
-
-                results = convert_notebook(
-                    notebook,
-                    output_dir,
-                    backup_dir,
-                    template_renderer,
-                    changed_page_ids=notebook_changed_pages,
-                    on_page_done=_on_page_done,
-                    on_page_start=_on_page_start,
-                )
-
-                if results["output_files"]:
-                    successful += 1
-                    page_pdfs = results.get("page_pdfs", [])
-                    merged = [f for f in results["output_files"] if isinstance(f, Path)]
-                    merged_pdfs.extend(merged)
-                    if page_pdfs and results.get("pdf_changed", True):
-                        converted[notebook["uuid"]] = page_pdfs
-                    elif page_pdfs:
-                        logging.debug(
-                            "PDF unchanged after conversion, skipping MD: %s", notebook["name"]
-                        )
-            except Exception as e:
-                print_error(f"  ERR - Failed to convert {notebook['name']}: {e}")
+        if workers > 1:
+            # Notebooks are independent, so hand each one to a worker process
+            # and advance the bar a whole notebook at a time as they finish.
+            # Split the CPUs between workers so page threads don't oversubscribe.
+            page_workers = max(1, (os.cpu_count() or 1) // workers)
+            # Largest notebooks first, so one long notebook picked up last
+            # doesn't leave the other workers idle at the end of the run
+            by_size = sorted(notebooks, key=lambda nb: page_counts[nb["uuid"]], reverse=True)
+            with (
+                worker_log_queue() as (log_queue, log_level),
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=init_worker_logging,
+                    initargs=(log_queue, log_level),
+                ) as executor,
+            ):
+                futures = {
+                    executor.submit(
+                        _convert_in_worker,
+                        notebook,
+                        output_dir,
+                        backup_dir,
+                        _changed_pages(notebook),
+                        page_workers,
+                        force,
+                    ): notebook
+                    for notebook in by_size
+                }
+                for future in as_completed(futures):
+                    notebook = futures[future]
+                    progress.update(
+                        task,
+                        advance=page_counts[notebook["uuid"]],
+                        description=notebook["name"][:30],
+                    )
+                    try:
+                        _collect(notebook, future.result())
+                        logging.info("PDF: %s", notebook["name"][:30])
+                    except Exception as e:
+                        print_error(f"  ERR - Failed to convert {notebook['name']}: {e}")
+        else:
+            for notebook in notebooks:
+                nb_name = notebook["name"][:30]
+                nb_total = page_counts[notebook["uuid"]]
+                page_counter = [0]  # mutable so the lambda can update it
+
+                def _on_page_done(_pc=page_counter, _nb=nb_name, _nbt=nb_total, cached=False):
+                    _pc[0] += 1
+                    progress.update(task, advance=1)
+                    suffix = " [cached]" if cached else ""
+                    logging.info("PDF: %s (page %d/%d)%s", _nb, _pc[0], _nbt, suffix)
+
+                def _on_page_start(_pc=page_counter, _nb=nb_name, _nbt=nb_total):
+                    progress.update(
+                        task,
+                        description=f"{_nb} (page {_pc[0] + 1} of {_nbt})",
+                    )
+
+                progress.update(task, description=f"{nb_name} (page 1 of {nb_total})")
+
+                try:
+                    results = convert_notebook(
+                        notebook,
+                        output_dir,
+                        backup_dir,
+                        template_renderer,
+                        changed_page_ids=_changed_pages(notebook),
+                        on_page_done=_on_page_done,
+                        on_page_start=_on_page_start,
+                        force=force,
+                    )
+                    _collect(notebook, results)
+                except Exception as e:
+                    print_error(f"  ERR - Failed to convert {notebook['name']}: {e}")
 
     print(f"  Conversion complete: {successful}/{len(notebooks)} notebooks converted")
     return successful > 0, converted, merged_pdfs
@@ -13,13 +13,15 @@ This module provides:
 - Template compositing with notebook content
 """
 
-import json
+import io
 import logging
 from pathlib import Path
 from typing import Dict, Optional
 
 from reportlab.pdfgen import canvas
 
+from .utils import read_json
+
 
 class TemplateRenderer:
     """Renders ReMarkable templates as PDF backgrounds."""
@@ -47,7 +49,10 @@ class TemplateRenderer:
         """
         self.templates_dir = templates_dir
         self.templates_json_path = templates_dir / "templates.json"
-        self.template_cache: Dict[str, Dict] = {}
+        # Parsed templates by name; None records a name with no usable file
+        self.template_cache: Dict[str, Optional[Dict]] = {}
+        # Rendered background PDFs by template name
+        self.pdf_cache: Dict[str, bytes] = {}
         self.templates_metadata: Dict[str, Dict] = {}
 
         self._load_templates_metadata()
@@ -59,12 +64,11 @@ class TemplateRenderer:
             return
 
         try:
-            with open(self.templates_json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for template in data.get("templates", []):
-                    name = template.get("name", "")
-                    if name:
-                        self.templates_metadata[name] = template
+            data = read_json(self.templates_json_path)
+            for template in data.get("templates", []):
+                name = template.get("name", "")
+                if name:
+                    self.templates_metadata[name] = template
             logging.info(f"Loaded {len(self.templates_metadata)} template definitions")
         except Exception as e:
             logging.warning(f"Failed to load templates.json: {e}")
@@ -115,17 +119,39 @@ class TemplateRenderer:
 
         template_file = self.get_template_file(template_name)
         if not template_file:
+            # Remember the miss too, so pages using a template that isn't
+            # backed up don't each probe the templates directory again
+            self.template_cache[template_name] = None
             return None
 
         try:
-            with open(template_file, "r", encoding="utf-8") as f:
-                template_data = json.load(f)
-                self.template_cache[template_name] = template_data
-                return template_data
+            template_data = read_json(template_file)
+            self.template_cache[template_name] = template_data
+            return template_data
         except Exception as e:
             logging.debug(f"Failed to load template {template_name}: {e}")
+            self.template_cache[template_name] = None
             return None
 
+    def render_template_pdf(self, template_name: str) -> Optional[bytes]:
+        """Return a template rendered as PDF bytes.
+
+        Each template is drawn once per renderer; later pages using the same
+        template get the cached bytes.
+
+        Args:
+            template_name: Name of the template to render
+
+        Returns:
+            The PDF bytes, or None if not even a blank page could be created
+        """
+        pdf_bytes = self.pdf_cache.get(template_name)
+        if pdf_bytes is None:
+            pdf_bytes = self._render_template(template_name)
+            if pdf_bytes is not None:
+                self.pdf_cache[template_name] = pdf_bytes
+        return pdf_bytes
+
     def render_template_to_pdf(self, template_name: str, output_pdf: Path) -> bool:
         """Render a template as a PDF file.
 
@@ -139,20 +165,32 @@ class TemplateRenderer:
         Returns:
             bool: True if successful, False otherwise
         """
+        pdf_bytes = self.render_template_pdf(template_name)
+        if pdf_bytes is None:
+            return False
+
+        try:
+            output_pdf.write_bytes(pdf_bytes)
+            return True
+        except OSError as e:
+            logging.debug(f"Failed to write template PDF {output_pdf}: {e}")
+            return False
+
+    def _render_template(self, template_name: str) -> Optional[bytes]:
+        """Draw *template_name* and return the PDF bytes (blank if it can't be drawn)."""
         if not template_name or template_name == "Blank":
             # For blank templates, create a blank PDF
-            return self._create_blank_pdf(output_pdf)
+            return self._create_blank_pdf()
 
         template_data = self.load_template(template_name)
         if not template_data:
             logging.debug(f"Could not load template {template_name}, using blank")
-            return self._create_blank_pdf(output_pdf)
+            return self._create_blank_pdf()
 
         try:
             # Create PDF with ReMarkable dimensions
-            c = canvas.Canvas(
-                str(output_pdf), pagesize=(self.REMARKABLE_WIDTH, self.REMARKABLE_HEIGHT)
-            )
+            buf = io.BytesIO()
+            c = canvas.Canvas(buf, pagesize=(self.REMARKABLE_WIDTH, self.REMARKABLE_HEIGHT))
 
             # Basic rendering: draw grid lines if it's a grid template
             if "Grid" in template_name or "grid" in template_name.lower():
@@ -163,30 +201,26 @@ class TemplateRenderer:
                 self._render_dots(c, template_data)
 
             c.save()
-            return output_pdf.exists()
+            return buf.getvalue()
 
         except Exception as e:
             logging.debug(f"Failed to render template {template_name}: {e}")
-            return self._create_blank_pdf(output_pdf)
+            return self._create_blank_pdf()
 
-    def _create_blank_pdf(self, output_pdf: Path) -> bool:
+    def _create_blank_pdf(self) -> Optional[bytes]:
         """Create a blank PDF with ReMarkable dimensions.
 
-        Args:
-            output_pdf: Path where the PDF should be saved
-
         Returns:
-            bool: True if successful
+            The PDF bytes, or None on failure
         """
         try:
-            c = canvas.Canvas(
-                str(output_pdf), pagesize=(self.REMARKABLE_WIDTH, self.REMARKABLE_HEIGHT)
-            )
+            buf = io.BytesIO()
+            c = canvas.Canvas(buf, pagesize=(self.REMARKABLE_WIDTH, self.REMARKABLE_HEIGHT))
             c.save()
-            return True
+            return buf.getvalue()
         except Exception as e:
             logging.debug(f"Failed to create blank PDF: {e}")
-            return False
+            return None
 
     def _render_grid(self, c: canvas.Canvas, template_data: Dict):
         """Render a grid template pattern.
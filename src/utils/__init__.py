@@ -1,11 +1,34 @@
 """Utility modules for RemarkableSync."""
 
+import errno as _errno
+import json as _json
 import logging as _logging
+import os as _os
+import shutil as _shutil
 import subprocess as _subprocess
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
-_ILLEGAL_FS_CHARS = set('\\/:*?"<>|\x00')
+try:
+    import orjson as _orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+    _json_loads = _orjson.loads
+    _json_dumps = _orjson.dumps
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = _json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# copy_file_range errors meaning "not here": no syscall, a cross-device copy
+# on kernels before 5.3, or a filesystem that can't do it
+_COPY_RANGE_UNSUPPORTED = {_errno.ENOSYS, _errno.EXDEV, _errno.EINVAL, _errno.EOPNOTSUPP}
+
+# Translation table mapping each character illegal on NTFS to "-"
+_ILLEGAL_FS_TABLE = str.maketrans(dict.fromkeys('\\/:*?"<>|\x00', "-"))
 
 
 def sanitize_name(name: str) -> str:
@@ -16,7 +39,63 @@ def sanitize_name(name: str) -> str:
     Everything else — spaces, parentheses, ampersands, dots, etc. — is kept.
     Leading/trailing whitespace is stripped.
     """
-    return "".join("-" if c in _ILLEGAL_FS_CHARS else c for c in name).strip()
+    return name.translate(_ILLEGAL_FS_TABLE).strip()
+
+
+def is_page_dir(entry: "_os.DirEntry") -> bool:
+    """Return True if *entry* in a xochitl files directory holds notebook pages.
+
+    Pages live in bare ``<uuid>`` directories.  The ``<uuid>.thumbnails``,
+    ``.highlights`` and ``.textconversion`` sidecars can be large and are
+    never looked up, so directory scans skip them.
+    """
+    return "." not in entry.name and entry.is_dir()
+
+
+def read_json(path: Path) -> Any:
+    """Parse the JSON file at *path*.
+
+    Reads the raw bytes in one call and parses them with orjson when it is
+    installed, falling back to the stdlib parser.  Raises ``OSError`` or
+    ``json.JSONDecodeError`` (which orjson's error subclasses) on failure.
+    """
+    return _json_loads(path.read_bytes())
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON, with orjson when it is installed.
+
+    Raises ``TypeError`` (which orjson's error subclasses) for values that
+    cannot be encoded.
+    """
+    return _json_dumps(obj)
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy the contents of *src* to *dst*, overwriting it.
+
+    On Linux the data is moved with ``copy_file_range``, which never passes
+    through user space and lets btrfs, XFS and NFS clone or copy it server
+    side.  Anywhere that isn't available, or refuses (including a 0 return
+    before the whole file is copied, as FUSE and some older kernels give),
+    this is ``shutil.copyfile``.  Raises ``OSError`` on failure.
+    """
+    if hasattr(_os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                remaining = _os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = _os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                else:
+                    return
+            except OSError as exc:
+                if exc.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+    # copyfile() truncates dst and rewrites it from the start
+    _shutil.copyfile(src, dst)
 
 
 def write_manifest(path: Path, items: Iterable, label: str) -> None:
@@ -1,5 +1,8 @@
 """Colored console output helpers and progress bar utilities using Rich."""
 
+import time
+from typing import Optional
+
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import (
@@ -59,6 +62,54 @@ def create_progress(description: str = "Working") -> Progress:
     )
 
 
+class ThrottledProgress:
+    """Coalesce per-item progress updates into at most one per *min_interval*.
+
+    Use as a context manager around a fast loop; pending advances are
+    flushed on exit so the final count is always exact::
+
+        with create_progress("Downloading") as progress:
+            task = progress.add_task("files", total=len(items))
+            with ThrottledProgress(progress, task) as bar:
+                for item in items:
+                    ...
+                    bar.advance(description=item.name)
+    """
+
+    def __init__(self, progress: Progress, task, min_interval: float = 0.1):
+        self.progress = progress
+        self.task = task
+        self.min_interval = min_interval
+        self._pending = 0
+        self._description: Optional[str] = None
+        self._last_flush = 0.0
+
+    def advance(self, description: Optional[str] = None) -> None:
+        """Count one finished item, updating the bar if the interval has elapsed."""
+        self._pending += 1
+        if description is not None:
+            self._description = description
+        if time.monotonic() - self._last_flush >= self.min_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Push any pending advance and the latest description to the bar."""
+        if self._pending or self._description is not None:
+            kwargs = {"advance": self._pending}
+            if self._description is not None:
+                kwargs["description"] = self._description
+            self.progress.update(self.task, **kwargs)
+            self._pending = 0
+            self._description = None
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> "ThrottledProgress":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
 def get_rich_logging_handler() -> RichHandler:
     """Return a RichHandler that coexists with Rich progress bars."""
     return RichHandler(
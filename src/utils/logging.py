@@ -1,11 +1,14 @@
 """Logging configuration utilities."""
 
 import logging
+import multiprocessing
 import os
 import sys
+from contextlib import contextmanager
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 # Custom level higher than CRITICAL — effectively silences the console
 _NONE_LEVEL = logging.CRITICAL + 10
@@ -123,6 +126,16 @@ def setup_logging(
         "Interactive: %s, Console log level: %s, Log dir: %s", interactive, log_level.value, log_dir
     )
 
+    quiet_third_party_loggers()
+
+
+def quiet_third_party_loggers():
+    """Raise the levels of chatty third-party loggers.
+
+    Called by :func:`setup_logging`, and again by worker processes, which
+    under the spawn start method (Windows, frozen builds) begin with no
+    logging configuration at all.
+    """
     # Suppress verbose debug messages from third-party libraries
     logging.getLogger("svglib.svglib").setLevel(logging.WARNING)
     logging.getLogger("reportlab").setLevel(logging.WARNING)
@@ -136,3 +149,40 @@ def setup_logging(
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+@contextmanager
+def worker_log_queue() -> Iterator[Tuple["multiprocessing.Queue", int]]:
+    """Forward log records from worker processes to this process's handlers.
+
+    Yields ``(queue, level)`` to pass to :func:`init_worker_logging` in each
+    worker.  *level* is the lowest level any current handler would emit, so
+    workers don't ship records that would only be dropped here.
+    """
+    root = logging.getLogger()
+    levels = [h.level for h in root.handlers]
+    # With no handlers only logging's last-resort WARNING output remains
+    level = max(min(levels) if levels else logging.WARNING, root.getEffectiveLevel())
+    queue: "multiprocessing.Queue" = multiprocessing.Queue()
+    # The root logger is handed the records itself, so they reach whatever
+    # handlers it has (or the last resort) with their own level checks
+    listener = QueueListener(queue, root)
+    listener.start()
+    try:
+        yield queue, level
+    finally:
+        listener.stop()
+        queue.close()
+
+
+def init_worker_logging(queue: "multiprocessing.Queue", level: int):
+    """Send this worker process's log records to *queue*.
+
+    Used as a process pool initializer together with :func:`worker_log_queue`.
+    Handlers inherited through fork are replaced, so only the parent writes
+    to the console and the log file.
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(queue)]
+    root.setLevel(level)
+    quiet_third_party_loggers()
@@ -5,10 +5,13 @@ Provides a drop-in replacement for ReMarkableConnection that serves files
 from a local fixture directory, simulating the tablet's SSH filesystem.
 """
 
+import io
 import json
 import shutil
+import tarfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Path to the fixture tablet filesystem
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "fake_tablet"
@@ -18,6 +21,21 @@ XOCHITL_DIR = FIXTURES_DIR / "xochitl"
 REMOTE_XOCHITL = "/home/root/.local/share/remarkable/xochitl"
 
 
+class MockPool:
+    """Mock replacement for ConnectionPool that hands out the connection itself."""
+
+    def __init__(self, connection: "MockConnection", size: int = 4):
+        self._connection = connection
+        self.size = size
+
+    @contextmanager
+    def client(self):
+        yield self._connection
+
+    def close(self):
+        pass
+
+
 class MockConnection:
     """Mock replacement for ReMarkableConnection.
 
@@ -47,6 +65,8 @@ class MockConnection:
         self._connected = False
         self._fixture_dir = fixture_dir or FIXTURES_DIR
         self._xochitl_dir = self._fixture_dir / "xochitl"
+        self.scp_client = None
+        self.pool = None
 
     def get_saved_password(self) -> str | None:
         return "mock-password"
@@ -64,11 +84,15 @@ class MockConnection:
     def connect(self) -> bool:
         """Simulate a successful connection."""
         self._connected = True
+        self.scp_client = self
+        self.pool = MockPool(self)
         return True
 
     def disconnect(self):
         """Simulate disconnection."""
         self._connected = False
+        self.scp_client = None
+        self.pool = None
 
     def execute_command(self, command: str) -> Tuple[str, str, int]:
         """Simulate executing a command on the tablet.
@@ -117,6 +141,12 @@ class MockConnection:
 
         return files
 
+    def iter_files(self, remote_path: str, newer_than: Optional[int] = None) -> Iterator[Dict]:
+        """Yield fixture files one at a time, like the streaming tablet listing."""
+        for remote_file in self.list_files(remote_path):
+            if newer_than is None or remote_file["mtime"] > newer_than:
+                yield remote_file
+
     def get(self, remote_path: str, local_path: str, recursive: bool = False):
         """Simulate SCP file download by copying from fixtures."""
         src = self._remote_to_local(remote_path)
@@ -133,6 +163,19 @@ class MockConnection:
             dst.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src, dst)
 
+    @contextmanager
+    def stream_tar(self, remote_dir: str, rel_paths: List[str]):
+        """Simulate ``tar cf - -C <dir> <paths>`` by archiving fixture files."""
+        base = self._remote_to_local(remote_dir)
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            for rel in rel_paths:
+                src = base / rel if base else None
+                if src is not None and src.is_file():
+                    archive.add(src, arcname=rel)
+        buffer.seek(0)
+        yield buffer
+
     # ------------------------------------------------------------------
     # Helpers for folder listing (used by config command)
     # ------------------------------------------------------------------
@@ -0,0 +1,349 @@
+"""Tests for ReMarkableBackup file download orchestration (mock tablet)."""
+
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.backup.backup_manager import _UUID_RE, ReMarkableBackup, _tar_batches
+from tests.mock_connection import XOCHITL_DIR, MockConnection
+
+
+@pytest.fixture
+def backup(tmp_path):
+    """ReMarkableBackup wired to the mock tablet connection."""
+    tool = ReMarkableBackup(tmp_path / "backup")
+    tool.connection = MockConnection()
+    tool.connection.connect()
+    with patch("src.config.load_config", return_value={"folders": []}):
+        yield tool
+
+
+class TestDoBackupFiles:
+    def test_downloads_all_files(self, backup):
+        success, updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        for fixture in XOCHITL_DIR.iterdir():
+            local = backup.files_dir / fixture.name
+            assert local.read_bytes() == fixture.read_bytes()
+        assert "aaaa1111-2222-3333-4444-555566667777" in updated
+
+    def test_records_metadata_for_each_file(self, backup):
+        backup._do_backup_files()
+
+        assert len(backup.metadata.data) == len(list(XOCHITL_DIR.iterdir()))
+        assert all(entry["hash"] for entry in backup.metadata.data.values())
+
+    def test_second_run_downloads_nothing(self, backup):
+        backup._do_backup_files()
+        success, updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        assert updated == set()
+
+    def test_download_error_is_reported_not_raised(self, backup):
+        with patch.object(MockConnection, "get", side_effect=OSError("boom")):
+            success, updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        assert updated == set()
+
+    def test_fails_without_pool(self, backup):
+        backup.connection.pool = None
+        success, _updated, _pages = backup._do_backup_files()
+        assert success is False
+
+
+class TestIncrementalListing:
+    def _listing_cutoffs(self, backup, runs=1):
+        cutoffs = []
+        real_iter = backup.connection.iter_files
+
+        def _spy(remote_path, newer_than=None):
+            cutoffs.append(newer_than)
+            return real_iter(remote_path, newer_than=newer_than)
+
+        with patch.object(backup.connection, "iter_files", side_effect=_spy):
+            for _ in range(runs):
+                backup._do_backup_files()
+        return cutoffs
+
+    def test_second_run_lists_only_newer_files(self, backup):
+        cutoffs = self._listing_cutoffs(backup, runs=2)
+
+        newest = max(f.stat().st_mtime for f in XOCHITL_DIR.iterdir())
+        assert cutoffs == [None, int(newest) - 1]
+
+    def test_failed_download_keeps_full_listing(self, backup):
+        with patch.object(MockConnection, "get", side_effect=OSError("boom")):
+            backup._do_backup_files()
+
+        assert self._listing_cutoffs(backup) == [None]
+
+    def test_changed_folder_filter_forces_full_listing(self, backup):
+        backup._do_backup_files()
+        with patch.object(backup, "_resolve_allowed_uuids", return_value={"x"}):
+            assert self._listing_cutoffs(backup) == [None]
+
+    def test_periodic_full_listing(self, backup):
+        with patch("src.backup.backup_manager.FULL_LISTING_EVERY", 2):
+            cutoffs = self._listing_cutoffs(backup, runs=4)
+
+        assert cutoffs[0] is None and cutoffs[3] is None
+        assert cutoffs[1] is not None and cutoffs[2] is not None
+
+
+class TestDownloadFiles:
+    def test_creates_missing_parent_directories(self, backup):
+        remote_files = backup.connection.list_files(backup.remote_xochitl_dir)[:2]
+        files_to_sync = [
+            (rf, backup.files_dir / "nested" / "dir" / rf["path"].rsplit("/", 1)[1])
+            for rf in remote_files
+        ]
+
+        results = list(backup._download_files(backup.remote_xochitl_dir, files_to_sync))
+
+        assert [error for _, _, error in results] == [None, None]
+        assert all(local_path.exists() for _, local_path in files_to_sync)
+
+    def test_largest_files_start_first(self, backup):
+        remote_files = backup.connection.list_files(backup.remote_xochitl_dir)
+        files_to_sync = [
+            (rf, backup.files_dir / rf["path"].rsplit("/", 1)[1]) for rf in remote_files
+        ]
+        started = []
+        real_download = backup._download_one
+
+        def _download_one(remote_file, local_path):
+            started.append(remote_file["size"])
+            return real_download(remote_file, local_path)
+
+        with (
+            patch.object(backup.connection.pool, "size", 1),
+            patch.object(backup, "_download_one", _download_one),
+        ):
+            list(backup._download_files(backup.remote_xochitl_dir, files_to_sync))
+
+        assert started == sorted(started, reverse=True)
+
+    def test_sftp_download_is_hashed_while_written(self, backup):
+        remote_file = backup.connection.list_files(backup.remote_xochitl_dir)[0]
+        content = XOCHITL_DIR.joinpath(remote_file["path"].rsplit("/", 1)[1]).read_bytes()
+        local_path = backup.files_dir / "copy"
+
+        class _SftpClient:
+            def getfo(self, remote_path, fl):
+                fl.write(content[:5])
+                fl.write(content[5:])
+
+        @contextmanager
+        def _client():
+            yield _SftpClient()
+
+        with (
+            patch.object(backup.connection, "pool", MagicMock(size=1, client=_client)),
+            patch.object(backup.metadata, "get_file_hash", side_effect=AssertionError("reread")),
+        ):
+            results = list(
+                backup._download_files(backup.remote_xochitl_dir, [(remote_file, local_path)])
+            )
+
+        assert results == [(remote_file, local_path, None)]
+        assert local_path.read_bytes() == content
+        entry = backup.metadata.data[remote_file["path"]]
+        assert entry["hash"] == hashlib.sha256(content).hexdigest()
+
+
+class TestDoBackupTemplates:
+    def test_streams_template_listing(self, backup):
+        backup.remote_templates_dir = backup.remote_xochitl_dir
+
+        listing = backup.connection.list_files(backup.remote_templates_dir)
+
+        with (
+            patch.object(backup.connection, "iter_files", return_value=iter(listing)),
+            patch.object(backup.connection, "list_files", side_effect=AssertionError("list")),
+        ):
+            assert backup._do_backup_templates() is True
+
+        for fixture in XOCHITL_DIR.iterdir():
+            assert (backup.templates_dir / fixture.name).read_bytes() == fixture.read_bytes()
+
+    def test_empty_template_dir(self, backup):
+        backup.remote_templates_dir = "/nonexistent/templates"
+
+        assert backup._do_backup_templates() is True
+        assert list(backup.templates_dir.iterdir()) == []
+
+
+class TestTarBulkTransfer:
+    def test_large_batch_streams_tar(self, backup):
+        with (
+            patch("src.backup.backup_manager.TAR_BATCH_THRESHOLD", 2),
+            patch.object(MockConnection, "get", side_effect=AssertionError("per-file get")),
+        ):
+            success, updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        for fixture in XOCHITL_DIR.iterdir():
+            assert (backup.files_dir / fixture.name).read_bytes() == fixture.read_bytes()
+        assert len(backup.metadata.data) == len(list(XOCHITL_DIR.iterdir()))
+
+    def test_archive_members_are_not_read_back_to_hash(self, backup):
+        with (
+            patch("src.backup.backup_manager.TAR_BATCH_THRESHOLD", 2),
+            patch.object(backup.metadata, "get_file_hash", side_effect=AssertionError("reread")),
+        ):
+            success, _updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        for fixture in XOCHITL_DIR.iterdir():
+            entry = backup.metadata.data[f"{backup.remote_xochitl_dir}/{fixture.name}"]
+            assert entry["hash"] == hashlib.sha256(fixture.read_bytes()).hexdigest()
+
+    def test_large_files_skip_the_archive(self, backup):
+        remote_files = backup.connection.list_files(backup.remote_xochitl_dir)
+        streamed = []
+        real_stream_tar = backup.connection.stream_tar
+
+        def _stream_tar(remote_dir, rel_paths):
+            streamed.extend(rel_paths)
+            return real_stream_tar(remote_dir, rel_paths)
+
+        with (
+            patch("src.backup.backup_manager.TAR_BATCH_THRESHOLD", 1),
+            patch("src.backup.backup_manager.TAR_MEMBER_MAX_BYTES", 300),
+            patch.object(backup.connection, "stream_tar", _stream_tar),
+        ):
+            success, _updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        small = {rf["path"].rsplit("/", 1)[1] for rf in remote_files if rf["size"] < 300}
+        assert len(small) > 1
+        assert set(streamed) == small
+        for fixture in XOCHITL_DIR.iterdir():
+            assert (backup.files_dir / fixture.name).read_bytes() == fixture.read_bytes()
+
+    def test_files_missing_from_archive_fall_back_to_get(self, backup):
+        from contextlib import contextmanager
+        from io import BytesIO
+
+        @contextmanager
+        def _empty_tar(remote_dir, rel_paths):
+            yield BytesIO()
+
+        with (
+            patch("src.backup.backup_manager.TAR_BATCH_THRESHOLD", 2),
+            patch.object(backup.connection, "stream_tar", _empty_tar),
+        ):
+            success, _updated, _pages = backup._do_backup_files()
+
+        assert success is True
+        for fixture in XOCHITL_DIR.iterdir():
+            assert (backup.files_dir / fixture.name).exists()
+
+
+class TestTarBatches:
+    def _files(self, names):
+        return [({"path": f"/x/{name}"}, Path(name)) for name in names]
+
+    def test_small_listing_is_one_batch(self):
+        batches = list(_tar_batches("/x", self._files(["a", "b", "c"])))
+
+        assert [list(batch) for batch in batches] == [["a", "b", "c"]]
+
+    def test_batches_split_on_name_bytes(self):
+        names = [f"{i:03d}" for i in range(10)]
+
+        with patch("src.backup.backup_manager.TAR_BATCH_BYTES", 12):
+            batches = list(_tar_batches("/x/", self._files(names)))
+
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+        assert [name for batch in batches for name in batch] == names
+
+
+class TestUuidDetection:
+    UUID = "aaaa1111-2222-3333-4444-555566667777"
+
+    @pytest.mark.parametrize("suffix", [".metadata", ".content", "/page-1.rm", ""])
+    def test_matches_notebook_paths(self, suffix):
+        match = _UUID_RE.match(self.UUID + suffix)
+        assert match and match.group(1) == self.UUID
+
+    @pytest.mark.parametrize(
+        "path",
+        ["templates/foo.png", "version", "zzzz1111-2222-3333-4444-555566667777.metadata"],
+    )
+    def test_rejects_non_uuid_names(self, path):
+        assert _UUID_RE.match(path) is None
+
+
+class TestFindNotebooks:
+    def test_buckets_page_files_by_notebook(self, backup):
+        uuid = "aaaa1111-2222-3333-4444-555566667777"
+        files = backup.files_dir
+        (files / f"{uuid}.metadata").write_text('{"visibleName": "Nb"}', encoding="utf-8")
+        (files / f"{uuid}.content").write_text("{}", encoding="utf-8")
+        (files / uuid).mkdir()
+        (files / uuid / "p1.rm").write_bytes(b"")
+        (files / uuid / "p1-metadata.json").write_text("{}", encoding="utf-8")
+        (files / "orphan.metadata").write_text("{}", encoding="utf-8")
+
+        notebooks = backup.find_notebooks()
+
+        assert [nb["uuid"] for nb in notebooks] == [uuid]
+        assert notebooks[0]["name"] == "Nb"
+        assert notebooks[0]["rm_files"] == [files / uuid / "p1.rm"]
+        assert notebooks[0]["pagedata_files"] == [files / uuid / "p1-metadata.json"]
+
+    def test_sidecar_dirs_are_not_scanned(self, backup):
+        uuid = "aaaa1111-2222-3333-4444-555566667777"
+        files = backup.files_dir
+        (files / f"{uuid}.metadata").write_text('{"visibleName": "Nb"}', encoding="utf-8")
+        (files / f"{uuid}.content").write_text("{}", encoding="utf-8")
+        (files / f"{uuid}.thumbnails").mkdir()
+        (files / f"{uuid}.thumbnails" / "p1.rm").write_bytes(b"")
+
+        with patch("src.backup.backup_manager.os.scandir", wraps=os.scandir) as scandir:
+            notebooks = backup.find_notebooks()
+
+        assert [str(call.args[0]) for call in scandir.call_args_list] == [str(files)]
+        assert notebooks[0]["rm_files"] == []
+
+    def test_skips_unparseable_metadata(self, backup):
+        files = backup.files_dir
+        (files / "bad.metadata").write_text("{not json", encoding="utf-8")
+        (files / "bad.content").write_text("{}", encoding="utf-8")
+
+        assert backup.find_notebooks() == []
+
+    def test_metadata_without_content_is_not_read(self, backup):
+        files = backup.files_dir
+        (files / "orphan.metadata").write_text("{}", encoding="utf-8")
+
+        with patch("src.backup.backup_manager.read_json") as read:
+            assert backup.find_notebooks() == []
+
+        read.assert_not_called()
+
+
+class TestConvertToPdfPlaceholder:
+    def test_writes_placeholder_text(self, backup):
+        (backup.backup_dir / "PDF").mkdir()
+        notebook = {
+            "name": "Nb",
+            "uuid": "aaaa1111-2222-3333-4444-555566667777",
+            "type": "DocumentType",
+            "rm_files": [1, 2],
+            "pagedata_files": [1],
+        }
+
+        path = backup.convert_to_pdf(notebook)
+
+        text = path.read_text(encoding="utf-8")
+        assert text.startswith("Notebook: Nb\nUUID: aaaa1111-2222-3333-4444-555566667777\n")
+        assert "RM Files: 2\nPages: 1\n" in text
@@ -121,6 +121,7 @@ class TestConfigModule:
             "ai_model": "",
             "pre_sync_command": "",
             "post_sync_command": "",
+            "conversion_workers": 2,
         }
 
         with patch("src.config.get_config_path", return_value=fake_path):
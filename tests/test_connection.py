@@ -0,0 +1,251 @@
+"""Tests for ReMarkableConnection remote command helpers (fake SSH client)."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import paramiko
+
+from src.backup.connection import (
+    KEEPALIVE_INTERVAL,
+    SCP_BUFF_SIZE,
+    SFTP_WINDOW_SIZE,
+    ConnectionPool,
+    ReMarkableConnection,
+)
+
+
+def _fake_exec(responses):
+    """Build an exec_command side effect returning *responses* as (stdout, exit_code)."""
+    calls = []
+
+    def exec_command(command):
+        calls.append(command)
+        output, exit_code = responses[len(calls) - 1]
+        stdout = io.BytesIO(output.encode())
+        stdout.channel = MagicMock()
+        stdout.channel.recv_exit_status.return_value = exit_code
+        stderr = io.BytesIO(b"")
+        return None, stdout, stderr
+
+    return exec_command, calls
+
+
+def _connection(responses):
+    conn = ReMarkableConnection()
+    exec_command, calls = _fake_exec(responses)
+    conn.ssh_client = MagicMock()
+    conn.ssh_client.exec_command.side_effect = exec_command
+    return conn, calls
+
+
+class TestIterFiles:
+    def test_parses_nul_delimited_printf_output(self):
+        conn, calls = _connection([("10.25 3 /x/a b.txt\x0020.0 4 /x/new\nline\x00", 0)])
+
+        files = list(conn.iter_files("/x"))
+
+        assert files == [
+            {"path": "/x/a b.txt", "mtime": 10, "size": 3},
+            {"path": "/x/new\nline", "mtime": 20, "size": 4},
+        ]
+        assert "-printf" in calls[0]
+
+    def test_records_split_across_reads(self):
+        conn, _calls = _connection([("10 3 /x/a\x0020 4 /x/c\x00", 0)])
+
+        with patch("src.backup.connection.STREAM_CHUNK_SIZE", 4):
+            files = list(conn.iter_files("/x"))
+
+        assert [f["path"] for f in files] == ["/x/a", "/x/c"]
+
+    def test_skips_malformed_records(self):
+        conn, _calls = _connection([("10 3 /x/a\x00garbage here\x0010 x /x/b\x0020 4 /x/c\x00", 0)])
+
+        files = list(conn.iter_files("/x"))
+
+        assert [f["path"] for f in files] == ["/x/a", "/x/c"]
+
+    def test_falls_back_to_batched_stat(self):
+        conn, calls = _connection([("", 1), ("10 3 /x/a b.txt\n20 4 /x/c\n", 0)])
+
+        files = list(conn.iter_files("/x"))
+
+        assert files == [
+            {"path": "/x/a b.txt", "mtime": 10, "size": 3},
+            {"path": "/x/c", "mtime": 20, "size": 4},
+        ]
+        assert calls[1].endswith("{} +")
+
+    def test_falls_back_to_per_file_exec(self):
+        conn, calls = _connection([("", 1), ("", 1), ("10 3 /x/a\n", 0)])
+
+        files = list(conn.iter_files("/x"))
+
+        assert files == [{"path": "/x/a", "mtime": 10, "size": 3}]
+        assert len(calls) == 3
+        assert calls[2].endswith("{} \\;")
+
+    def test_remembers_working_form(self):
+        conn, calls = _connection([("", 1), ("10 3 /x/a\n", 0), ("10 3 /x/a\n", 0)])
+
+        list(conn.iter_files("/x"))
+        list(conn.iter_files("/x"))
+
+        assert calls[2] == calls[1]
+
+    def test_newer_than_adds_newermt_filter(self):
+        conn, calls = _connection([("10 3 /x/a\x00", 0)])
+
+        assert len(list(conn.iter_files("/x", newer_than=5))) == 1
+        assert "-newermt @5" in calls[0]
+
+    def test_unsupported_newermt_falls_back_to_full_listing(self):
+        conn, calls = _connection([("", 1), ("", 1), ("", 1), ("10 3 /x/a\x00", 0)])
+
+        assert len(list(conn.iter_files("/x", newer_than=5))) == 1
+        assert "-newermt" not in calls[3]
+
+    def test_list_files_returns_empty_when_all_forms_fail(self):
+        conn, _calls = _connection([("", 1), ("", 1), ("", 1)])
+        assert conn.list_files("/x") == []
+
+
+class TestConnectRetries:
+    def test_retries_reuse_one_ssh_client(self):
+        conn = ReMarkableConnection(password="pw")
+        client = MagicMock()
+        client.connect.side_effect = [OSError("link down"), None]
+
+        with (
+            patch("src.backup.connection.paramiko.SSHClient", return_value=client) as ctor,
+            patch("src.backup.connection.SCPClient"),
+            patch("src.backup.connection.ConnectionPool"),
+        ):
+            assert conn.connect() is True
+
+        ctor.assert_called_once()
+        assert client.connect.call_count == 2
+        assert conn.ssh_client is client
+
+    def test_connection_sends_keepalives(self):
+        conn = ReMarkableConnection(password="pw")
+        client = MagicMock()
+
+        with (
+            patch("src.backup.connection.paramiko.SSHClient", return_value=client),
+            patch("src.backup.connection.SCPClient"),
+            patch("src.backup.connection.ConnectionPool"),
+        ):
+            assert conn.connect() is True
+
+        client.get_transport().set_keepalive.assert_called_once_with(KEEPALIVE_INTERVAL)
+
+    def test_failed_connect_leaves_no_client(self):
+        conn = ReMarkableConnection(password="pw")
+        client = MagicMock()
+        client.connect.side_effect = OSError("link down")
+
+        with patch("src.backup.connection.paramiko.SSHClient", return_value=client):
+            assert conn.connect() is False
+
+        assert conn.ssh_client is None
+        client.close.assert_called()
+
+    def test_rejected_password_closes_each_transport(self):
+        conn = ReMarkableConnection(password="pw")
+        client = MagicMock()
+        client.connect.side_effect = paramiko.AuthenticationException("bad password")
+
+        with (
+            patch("src.backup.connection.paramiko.SSHClient", return_value=client),
+            patch.object(conn, "get_saved_password", return_value=None),
+            patch("src.backup.connection.click.prompt", return_value="still wrong"),
+        ):
+            assert conn.connect() is False
+
+        # One close per rejected attempt, then the final one on the way out
+        assert client.close.call_count == client.connect.call_count + 1
+
+    def test_successful_connect_keeps_client_open(self):
+        conn = ReMarkableConnection(password="pw")
+        client = MagicMock()
+
+        with (
+            patch("src.backup.connection.paramiko.SSHClient", return_value=client),
+            patch("src.backup.connection.SCPClient"),
+            patch("src.backup.connection.ConnectionPool"),
+        ):
+            assert conn.connect() is True
+
+        client.close.assert_not_called()
+
+
+class TestCompression:
+    def _connect(self, conn):
+        client = MagicMock()
+        with (
+            patch("src.backup.connection.paramiko.SSHClient", return_value=client),
+            patch("src.backup.connection.SCPClient"),
+            patch("src.backup.connection.ConnectionPool"),
+        ):
+            assert conn.connect() is True
+        return client.connect.call_args.kwargs["compress"]
+
+    def test_usb_link_is_not_compressed(self):
+        assert self._connect(ReMarkableConnection(password="pw")) is False
+
+    def test_wifi_link_is_compressed(self):
+        conn = ReMarkableConnection(password="pw", use_wifi=True, wifi_host="192.168.1.20")
+        assert self._connect(conn) is True
+
+    def test_explicit_setting_wins(self):
+        conn = ReMarkableConnection(
+            password="pw", use_wifi=True, wifi_host="tablet", compress=False
+        )
+        assert self._connect(conn) is False
+
+
+class TestExecuteCommand:
+    def test_reads_output_before_waiting_for_exit(self):
+        conn = ReMarkableConnection()
+        order = []
+        stdout = MagicMock()
+        stdout.read.side_effect = lambda: order.append("read") or b"out"
+        stdout.channel.recv_exit_status.side_effect = lambda: order.append("exit") or 0
+        stderr = io.BytesIO(b"err")
+        conn.ssh_client = MagicMock()
+        conn.ssh_client.exec_command.return_value = (None, stdout, stderr)
+
+        assert conn.execute_command("ls") == ("out", "err", 0)
+        assert order == ["read", "exit"]
+
+
+class TestConnectionPool:
+    def test_sftp_channels_use_tuned_window(self):
+        with patch("src.backup.connection.paramiko.SFTPClient.from_transport") as from_transport:
+            pool = ConnectionPool(MagicMock(), max_conns=2)
+
+        assert pool.size == 2
+        assert from_transport.call_args.kwargs["window_size"] == SFTP_WINDOW_SIZE
+
+    def test_shrinks_to_channels_the_server_allows(self):
+        refused = paramiko.ChannelException(1, "Administratively prohibited")
+        with patch(
+            "src.backup.connection.paramiko.SFTPClient.from_transport",
+            side_effect=[MagicMock(), MagicMock(), refused],
+        ):
+            pool = ConnectionPool(MagicMock(), max_conns=4)
+
+        assert pool.size == 2
+
+    def test_falls_back_to_scp_with_larger_buffer(self):
+        with (
+            patch(
+                "src.backup.connection.paramiko.SFTPClient.from_transport",
+                side_effect=OSError("no sftp"),
+            ),
+            patch("src.backup.connection.SCPClient") as scp_client,
+        ):
+            ConnectionPool(MagicMock(), max_conns=1)
+
+        assert scp_client.call_args.kwargs["buff_size"] == SCP_BUFF_SIZE
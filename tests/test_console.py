@@ -1,6 +1,9 @@
 """Tests for the console utility module."""
 
+from unittest.mock import MagicMock
+
 from src.utils.console import (
+    ThrottledProgress,
     create_progress,
     print_error,
     print_status,
@@ -40,3 +43,25 @@ class TestProgressBar:
             for _ in range(3):
                 p.update(task, advance=1)
         # No crash = pass
+
+
+class TestThrottledProgress:
+    """Verify per-item updates are coalesced."""
+
+    def test_coalesces_updates_within_interval(self):
+        progress = MagicMock()
+        with ThrottledProgress(progress, "task", min_interval=60) as bar:
+            for i in range(5):
+                bar.advance(description=f"item{i}")
+
+        # First advance flushes immediately, the rest are flushed together on exit
+        assert progress.update.call_count == 2
+        progress.update.assert_called_with("task", advance=4, description="item4")
+
+    def test_zero_interval_updates_every_item(self):
+        progress = MagicMock()
+        with ThrottledProgress(progress, "task", min_interval=0) as bar:
+            for _ in range(3):
+                bar.advance()
+
+        assert progress.update.call_count == 3
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.converters import base_converter
 from src.converters.base_converter import BaseConverter
 from src.converters.v4_converter import V4Converter
 from src.converters.v5_converter import V5Converter
@@ -127,6 +128,14 @@ class TestV4ConvertToPdf:
             result = V4Converter().convert_to_pdf(rm, out)
         assert result is False
 
+    def test_missing_rmrl_is_not_reimported(self, tmp_path):
+        rm = _make_rm(tmp_path, 4)
+        converter = V4Converter()
+        with patch.dict("sys.modules", {"rmrl": None}):
+            assert converter.convert_to_pdf(rm, tmp_path / "a.pdf") is False
+        with patch.dict("sys.modules", {"rmrl": MagicMock()}):
+            assert converter.convert_to_pdf(rm, tmp_path / "b.pdf") is False
+
     def test_returns_false_when_rmrl_render_fails(self, tmp_path):
         rm = _make_rm(tmp_path, 4)
         out = tmp_path / "out.pdf"
@@ -224,6 +233,14 @@ class TestV5ConvertToPdf:
             result = V5Converter().convert_to_pdf(rm, out)
         assert result is False
 
+    def test_missing_rmrl_is_not_reimported(self, tmp_path):
+        rm = _make_rm(tmp_path, 5)
+        converter = V5Converter()
+        with patch.dict("sys.modules", {"rmrl": None}):
+            assert converter.convert_to_pdf(rm, tmp_path / "a.pdf") is False
+        with patch.dict("sys.modules", {"rmrl": MagicMock()}):
+            assert converter.convert_to_pdf(rm, tmp_path / "b.pdf") is False
+
     def test_returns_false_when_rmrl_render_returns_none(self, tmp_path):
         rm = _make_rm(tmp_path, 5)
         out = tmp_path / "out.pdf"
@@ -325,6 +342,16 @@ class TestV6ConvertToPdf:
 
         assert result is False
 
+    def test_missing_rmc_is_not_respawned(self, tmp_path):
+        rm = _make_rm(tmp_path, 6)
+        converter = V6Converter()
+
+        with patch("subprocess.run", side_effect=FileNotFoundError("rmc not found")) as run:
+            assert converter.convert_to_pdf(rm, tmp_path / "a.pdf") is False
+            assert converter.convert_to_pdf(rm, tmp_path / "b.pdf") is False
+
+        run.assert_called_once()
+
     def test_returns_false_when_rmc_fails(self, tmp_path):
         rm = _make_rm(tmp_path, 6)
         out = tmp_path / "out.pdf"
@@ -384,6 +411,86 @@ class TestV6ConvertToPdf:
         assert result is True
         mock_svg.assert_called_once()
 
+    @pytest.mark.skipif(
+        not (Path(__file__).parent / "fixtures" / "rm_files" / "minimal_v6.rm").exists(),
+        reason="v6 fixture file not found",
+    )
+    def test_renders_in_process_without_rmc_subprocess(self):
+        rm = Path(__file__).parent / "fixtures" / "rm_files" / "minimal_v6.rm"
+        converter = V6Converter()
+
+        with (
+            patch("src.converters.v6_converter.RMC_LIBRARY_AVAILABLE", True),
+            patch("subprocess.run") as mock_run,
+            patch.object(converter, "svg_data_to_pdf", return_value=True) as mock_svg,
+        ):
+            result = converter.convert_to_pdf(rm, Path("unused.pdf"))
+
+        assert result is True
+        mock_run.assert_not_called()
+        assert b"<svg" in mock_svg.call_args.args[0]
+
+    def test_falls_back_to_rmc_cli_without_library(self, tmp_path):
+        rm = _make_rm(tmp_path, 6)
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stderr = "conversion error"
+
+        with (
+            patch("src.converters.v6_converter.RMC_LIBRARY_AVAILABLE", False),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            assert V6Converter().convert_to_pdf(rm, tmp_path / "out.pdf") is False
+
+        mock_run.assert_called_once()
+
+    def test_shared_work_dir_used_instead_of_temp_dir(self, tmp_path):
+        rm = _make_rm(tmp_path, 6)
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        converter = V6Converter()
+        svg_paths = []
+
+        def _fake_run(cmd, **kwargs):
+            svg_paths.append(Path(cmd[4]))
+            svg_paths[-1].write_bytes(b"<svg>" + b"x" * 200 + b"</svg>")
+            return MagicMock(returncode=0)
+
+        with (
+            patch("src.converters.v6_converter.RMC_LIBRARY_AVAILABLE", False),
+            patch("subprocess.run", side_effect=_fake_run),
+            patch("tempfile.TemporaryDirectory") as mock_tempdir,
+            patch.object(converter, "svg_to_pdf", return_value=True),
+        ):
+            assert converter.convert_to_pdf(rm, tmp_path / "out.pdf", work_dir) is True
+
+        mock_tempdir.assert_not_called()
+        assert svg_paths[0].parent == work_dir
+        assert not svg_paths[0].exists()
+
+    def test_rmc_output_discarded_unless_debug_logging(self, tmp_path):
+        import logging
+        import subprocess
+
+        rm = _make_rm(tmp_path, 6)
+        converter = V6Converter()
+        mock_result = MagicMock(returncode=1, stderr=None)
+
+        with (
+            patch("src.converters.v6_converter.RMC_LIBRARY_AVAILABLE", False),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            converter.logger.setLevel(logging.INFO)
+            converter.convert_to_pdf(rm, tmp_path / "out.pdf")
+            quiet = mock_run.call_args.kwargs
+            converter.logger.setLevel(logging.DEBUG)
+            converter.convert_to_pdf(rm, tmp_path / "out.pdf")
+            verbose = mock_run.call_args.kwargs
+        converter.logger.setLevel(logging.NOTSET)
+
+        assert quiet["stdout"] == quiet["stderr"] == subprocess.DEVNULL
+        assert verbose["stderr"] == subprocess.PIPE
+
     def test_is_rmc_available_returns_bool(self):
         result = V6Converter().is_rmc_available()
         assert isinstance(result, bool)
@@ -462,6 +569,20 @@ class TestBaseConverterUtilities:
         assert dst.exists()
         assert dst.read_bytes() == src.read_bytes()
 
+    def test_copy_existing_pdf_replaces_target_atomically(self, tmp_path):
+        src = tmp_path / "source.pdf"
+        src.write_bytes(b"%PDF-1.4 new content")
+        dst = tmp_path / "dest.pdf"
+        dst.write_bytes(b"%PDF-1.4 old content")
+
+        with patch("src.converters.base_converter.copy_file", side_effect=OSError("disk full")):
+            assert _ConcreteConverter().copy_existing_pdf(src, dst) is False
+        assert dst.read_bytes() == b"%PDF-1.4 old content"
+
+        assert _ConcreteConverter().copy_existing_pdf(src, dst) is True
+        assert dst.read_bytes() == src.read_bytes()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dest.pdf", "source.pdf"]
+
     def test_copy_existing_pdf_missing_source(self, tmp_path):
         result = _ConcreteConverter().copy_existing_pdf(
             tmp_path / "ghost.pdf", tmp_path / "out.pdf"
@@ -471,3 +592,72 @@ class TestBaseConverterUtilities:
     def test_repr(self):
         c = _ConcreteConverter()
         assert "test" in repr(c)
+
+    def test_svg_to_pdf_prefers_cairosvg(self, tmp_path):
+        svg = tmp_path / "page.svg"
+        svg.write_text("<svg/>", encoding="utf-8")
+        pdf = tmp_path / "page.pdf"
+        fake_cairosvg = MagicMock()
+        fake_cairosvg.svg2pdf.side_effect = lambda **kw: Path(kw["write_to"]).write_bytes(
+            b"%PDF" + b"x" * 600
+        )
+
+        with (
+            patch("src.converters.base_converter.CAIROSVG_AVAILABLE", True),
+            patch("src.converters.base_converter.cairosvg", fake_cairosvg, create=True),
+            patch("svglib.svglib.svg2rlg") as mock_svglib,
+        ):
+            assert _ConcreteConverter().svg_to_pdf(svg, pdf) is True
+
+        fake_cairosvg.svg2pdf.assert_called_once()
+        mock_svglib.assert_not_called()
+
+    def test_svg_to_pdf_falls_back_to_svglib_when_cairo_fails(self, tmp_path):
+        svg = tmp_path / "page.svg"
+        svg.write_text("<svg/>", encoding="utf-8")
+        fake_cairosvg = MagicMock()
+        fake_cairosvg.svg2pdf.side_effect = RuntimeError("no cairo")
+
+        with (
+            patch("src.converters.base_converter.CAIROSVG_AVAILABLE", True),
+            patch("src.converters.base_converter.cairosvg", fake_cairosvg, create=True),
+            patch("src.converters.base_converter.PYMUPDF_AVAILABLE", False),
+            patch("svglib.svglib.svg2rlg", return_value=None) as mock_svglib,
+        ):
+            assert _ConcreteConverter().svg_to_pdf(svg, tmp_path / "page.pdf") is False
+
+        mock_svglib.assert_called_once()
+
+    @pytest.mark.skipif(not base_converter.PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+    def test_svg_to_pdf_uses_pymupdf_before_svglib(self, tmp_path):
+        svg = tmp_path / "page.svg"
+        svg.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="1404" height="1872">'
+            '<path d="M 10 10 L 1000 1500" stroke="black" stroke-width="4"/></svg>',
+            encoding="utf-8",
+        )
+        pdf = tmp_path / "page.pdf"
+
+        with (
+            patch("src.converters.base_converter.CAIROSVG_AVAILABLE", False),
+            patch("svglib.svglib.svg2rlg") as mock_svglib,
+        ):
+            assert _ConcreteConverter().svg_to_pdf(svg, pdf) is True
+
+        mock_svglib.assert_not_called()
+        with base_converter.pymupdf.open(str(pdf)) as doc:
+            assert doc.page_count == 1
+            assert doc[0].rect.width == pytest.approx(base_converter.REMARKABLE_WIDTH, abs=0.1)
+            assert doc[0].rect.height == pytest.approx(base_converter.REMARKABLE_HEIGHT, abs=0.1)
+
+    def test_svg_data_to_pdf_renders_from_memory(self, tmp_path):
+        svg = (
+            b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+            b'<path d="M 10 10 L 90 90" stroke="black"/></svg>'
+        )
+        pdf = tmp_path / "page.pdf"
+
+        with patch("src.converters.base_converter.CAIROSVG_AVAILABLE", False):
+            assert _ConcreteConverter().svg_data_to_pdf(svg, pdf, "page.rm") is True
+
+        assert pdf.read_bytes()[:4] == b"%PDF"
@@ -1,15 +1,23 @@
 """Tests for the hybrid_converter module (notebook discovery and organization)."""
 
 import json
+import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.hybrid_converter import (
+    convert_notebook,
     find_notebooks,
     get_folder_hierarchy,
+    get_page_templates,
+    merge_pdf_with_template,
+    merge_pdfs,
     organize_notebooks_by_structure,
 )
+from src.utils import read_json
 
 
 def _write_metadata(files_dir: Path, uuid: str, name: str, ntype: str, parent: str = ""):
@@ -89,6 +97,19 @@ class TestFindNotebooks:
         assert len(mixed["v5_files"]) == 1
         assert len(mixed["v6_files"]) == 1
 
+    def test_classifies_legacy_and_ignores_unknown_headers(self, backup_dir):
+        files_dir = backup_dir / "Notebooks"
+        _write_metadata(files_dir, "nb-old", "Legacy", "DocumentType")
+        _write_rm_file(files_dir, "nb-old", "p3", 3)
+        _write_rm_file(files_dir, "nb-old", "p4", 4)
+        (files_dir / "nb-old" / "junk.rm").write_bytes(b"not a lines file")
+
+        legacy = next(n for n in find_notebooks(backup_dir) if n["name"] == "Legacy")
+
+        assert [f.stem for f in legacy["v3_files"]] == ["p3"]
+        assert [f.stem for f in legacy["v4_files"]] == ["p4"]
+        assert len(legacy["rm_files"]) == 3
+
     def test_excludes_empty_documents(self, backup_dir):
         results = find_notebooks(backup_dir)
         names = [n["name"] for n in results]
@@ -115,6 +136,62 @@ class TestFindNotebooks:
         work = next(n for n in results if n["name"] == "Work")
         assert work["type"] == "CollectionType"
 
+    def test_collects_pdf_files_from_notebook_dir(self, backup_dir):
+        files_dir = backup_dir / "Notebooks"
+        _write_metadata(files_dir, "nb-pdf", "Imported", "DocumentType")
+        (files_dir / "nb-pdf").mkdir()
+        (files_dir / "nb-pdf" / "doc.pdf").write_bytes(b"%PDF-1.4")
+        (files_dir / "nb-pdf.pdf").write_bytes(b"%PDF-1.4")
+
+        results = find_notebooks(backup_dir)
+
+        imported = next(n for n in results if n["name"] == "Imported")
+        assert imported["pdf_files"] == [files_dir / "nb-pdf" / "doc.pdf"]
+
+    def test_sidecar_dirs_are_not_scanned(self, backup_dir):
+        files_dir = backup_dir / "Notebooks"
+        (files_dir / "nb-001.thumbnails").mkdir()
+        (files_dir / "nb-001.thumbnails" / "page.rm").write_bytes(b"version=6")
+        scanned = []
+        real_scandir = os.scandir
+
+        def _scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        with patch("src.hybrid_converter.os.scandir", side_effect=_scandir):
+            results = find_notebooks(backup_dir)
+
+        assert "nb-001.thumbnails" not in scanned
+        assert all("thumbnails" not in str(f) for n in results for f in n["rm_files"])
+
+    def test_unchanged_metadata_served_from_cache(self, backup_dir):
+        find_notebooks(backup_dir)
+
+        with patch("src.hybrid_converter.read_json", wraps=read_json) as mock_read:
+            results = find_notebooks(backup_dir)
+
+        parsed = [c.args[0].suffix for c in mock_read.call_args_list]
+        assert ".metadata" not in parsed
+        assert "Meeting Notes" in [n["name"] for n in results]
+
+    def test_changed_metadata_is_reparsed(self, backup_dir):
+        find_notebooks(backup_dir)
+        _write_metadata(backup_dir / "Notebooks", "nb-002", "Renamed Notebook", "DocumentType")
+
+        names = [n["name"] for n in find_notebooks(backup_dir)]
+
+        assert "Renamed Notebook" in names
+        assert "Old Notebook" not in names
+
+    def test_corrupt_cache_is_ignored(self, backup_dir):
+        cache_file = backup_dir / ".cache" / "metadata.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text("not json!!!", encoding="utf-8")
+
+        assert len(find_notebooks(backup_dir)) == 4
+        assert "nb-001.metadata" in json.loads(cache_file.read_text(encoding="utf-8"))
+
 
 class TestGetFolderHierarchy:
     """Tests for resolving folder paths via parent UUIDs."""
@@ -147,6 +224,72 @@ class TestGetFolderHierarchy:
         hierarchy = get_folder_hierarchy(notebook, bd)
         assert hierarchy == [("Projects", "root-folder"), ("2024", "sub-folder")]
 
+    def test_shared_cache_reads_each_folder_once(self, tmp_path):
+        bd = tmp_path / "backup"
+        files_dir = bd / "Notebooks"
+        files_dir.mkdir(parents=True)
+        _write_metadata(files_dir, "root-folder", "Projects", "CollectionType", parent="")
+        _write_metadata(files_dir, "sub-folder", "2024", "CollectionType", parent="root-folder")
+        cache = {}
+
+        with patch("src.hybrid_converter.read_json", wraps=read_json) as mock_read:
+            first = get_folder_hierarchy({"parent": "sub-folder"}, bd, cache)
+            second = get_folder_hierarchy({"parent": "sub-folder"}, bd, cache)
+            top = get_folder_hierarchy({"parent": "root-folder"}, bd, cache)
+
+        assert first == second == [("Projects", "root-folder"), ("2024", "sub-folder")]
+        assert top == [("Projects", "root-folder")]
+        assert mock_read.call_count == 2
+
+    def test_parent_cycle_terminates(self, tmp_path):
+        bd = tmp_path / "backup"
+        files_dir = bd / "Notebooks"
+        files_dir.mkdir(parents=True)
+        _write_metadata(files_dir, "a", "A", "CollectionType", parent="b")
+        _write_metadata(files_dir, "b", "B", "CollectionType", parent="a")
+
+        assert get_folder_hierarchy({"parent": "a"}, bd) == [("B", "b"), ("A", "a")]
+
+    def test_known_folders_are_not_read_from_disk(self, tmp_path):
+        bd = tmp_path / "backup"
+        files_dir = bd / "Notebooks"
+        files_dir.mkdir(parents=True)
+        _write_metadata(files_dir, "root-folder", "Projects", "CollectionType", parent="")
+        folders = {"sub-folder": {"uuid": "sub-folder", "name": "2024", "parent": "root-folder"}}
+
+        with patch("src.hybrid_converter.read_json", wraps=read_json) as mock_read:
+            hierarchy = get_folder_hierarchy({"parent": "sub-folder"}, bd, folders=folders)
+
+        assert hierarchy == [("Projects", "root-folder"), ("2024", "sub-folder")]
+        assert mock_read.call_count == 1
+
+
+class TestGetPageTemplates:
+    """Tests for reading per-page template names from .content files."""
+
+    def test_reads_cpages_templates(self, tmp_path):
+        content = tmp_path / "nb.content"
+        content.write_bytes(
+            json.dumps(
+                {
+                    "cPages": {
+                        "pages": [
+                            {"id": "p1", "template": {"value": "P Lines small"}},
+                            {"id": "p2"},
+                        ]
+                    }
+                }
+            ).encode()
+        )
+
+        assert get_page_templates(content) == {"p1": "P Lines small", "p2": "Blank"}
+
+    def test_invalid_json_returns_empty(self, tmp_path):
+        content = tmp_path / "nb.content"
+        content.write_text("{not json", encoding="utf-8")
+
+        assert get_page_templates(content) == {}
+
 
 class TestOrganizeNotebooksByStructure:
     """Tests for organizing notebooks into folder structure."""
@@ -179,3 +322,305 @@ class TestOrganizeNotebooksByStructure:
         structure = result["folder_structure"]
         assert "Work" in structure
         assert "" in structure  # root-level docs
+
+
+class TestConvertNotebookPages:
+    """Tests for page ordering and bookkeeping in convert_notebook."""
+
+    PAGES = ["p5", "p1", "p4", "p2", "p3"]
+
+    def _notebook(self, tmp_path):
+        files_dir = tmp_path / "backup" / "Notebooks"
+        files_dir.mkdir(parents=True)
+        _write_metadata(files_dir, "nb-001", "Long Notes", "DocumentType")
+        for page in self.PAGES:
+            _write_rm_file(files_dir, "nb-001", page, 6)
+        (files_dir / "nb-001.content").write_text(json.dumps({"pages": self.PAGES}))
+        return find_notebooks(tmp_path / "backup")[0]
+
+    def _convert(self, tmp_path, notebook=None, **kwargs):
+        if notebook is None:
+            notebook = self._notebook(tmp_path)
+
+        def _fake_rmc(rm_file, output_file, work_dir=None):
+            assert work_dir.is_dir()
+            # Later pages finish first to shake out ordering bugs
+            time.sleep(0.01 * (len(self.PAGES) - self.PAGES.index(rm_file.stem)))
+            output_file.write_bytes(b"%PDF-1.4\n%%EOF\n")
+            return True
+
+        def _fake_merge(pages, out):
+            merged.extend(pages)
+            out.write_bytes(b"%PDF-1.4\n%%EOF\n")
+            return True
+
+        merged = []
+        done = []
+        with (
+            patch("src.hybrid_converter.convert_v6_file_with_rmc", side_effect=_fake_rmc),
+            patch("src.hybrid_converter.merge_pdfs", side_effect=_fake_merge),
+        ):
+            results = convert_notebook(
+                notebook,
+                tmp_path / "out",
+                tmp_path / "backup",
+                on_page_done=lambda cached: done.append(cached),
+                **kwargs,
+            )
+        return results, merged, done
+
+    @pytest.mark.parametrize("page_workers", [1, 4])
+    def test_pages_merged_in_content_order(self, tmp_path, page_workers):
+        results, merged, done = self._convert(tmp_path, page_workers=page_workers)
+
+        assert [p.stem for p in merged] == self.PAGES
+        assert results["v6_converted"] == len(self.PAGES)
+        assert done == [False] * len(self.PAGES)
+
+    def test_content_pdf_is_renamed_into_page_cache(self, tmp_path):
+        with patch("shutil.copy2") as copy2:
+            results, merged, _done = self._convert(tmp_path)
+
+        copy2.assert_not_called()
+        cached = sorted(p.name for p in results["page_cache_dir"].iterdir())
+        assert cached == sorted(f"{page}.pdf" for page in self.PAGES)
+        assert merged == [results["page_cache_dir"] / f"{page}.pdf" for page in self.PAGES]
+
+    def test_fresh_output_is_not_reconverted_or_remerged(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+
+        results, merged, done = self._convert(tmp_path, notebook)
+
+        assert merged == []
+        assert done == [True] * len(self.PAGES)
+        assert results["pdf_changed"] is False
+        assert results["output_files"] == [tmp_path / "out" / "Long Notes.pdf"]
+
+    def test_fresh_output_creates_no_scratch_dir(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+
+        with patch("src.hybrid_converter.tempfile.TemporaryDirectory") as scratch:
+            results, _merged, _done = self._convert(tmp_path, notebook)
+
+        scratch.assert_not_called()
+        assert results["pdf_changed"] is False
+
+    def test_scratch_dir_removed_when_conversion_raises(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        work_dirs = []
+
+        def _failing_rmc(rm_file, output_file, work_dir=None):
+            work_dirs.append(work_dir)
+            raise RuntimeError("boom")
+
+        with (
+            patch("src.hybrid_converter.convert_v6_file_with_rmc", side_effect=_failing_rmc),
+            pytest.raises(RuntimeError),
+        ):
+            convert_notebook(notebook, tmp_path / "out", tmp_path / "backup", page_workers=1)
+
+        assert work_dirs and not work_dirs[0].exists()
+        assert not work_dirs[0].is_relative_to(tmp_path / "out")
+
+    def test_touched_page_is_reconverted(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+        rm_file = next(f for f in notebook["v6_files"] if f.stem == "p4")
+        future = time.time_ns() + 10**9
+        os.utime(rm_file, ns=(future, future))
+
+        results, merged, _done = self._convert(tmp_path, notebook)
+
+        assert results["v6_converted"] == 1
+        assert [p.stem for p in merged] == self.PAGES
+
+    def test_content_change_reconverts_cached_pages(self, tmp_path):
+        """A template change edits only the .content file, not the pages."""
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+        content_path = notebook["metadata_file"].with_suffix(".content")
+        future = time.time_ns() + 10**9
+        os.utime(content_path, ns=(future, future))
+
+        results, _merged, done = self._convert(tmp_path, notebook)
+
+        assert results["v6_converted"] == len(self.PAGES)
+        assert done == [False] * len(self.PAGES)
+
+    def test_cached_pages_do_not_start_a_thread_pool(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+        rm_file = next(f for f in notebook["v6_files"] if f.stem == "p4")
+        future = time.time_ns() + 10**9
+        os.utime(rm_file, ns=(future, future))
+
+        with patch("src.hybrid_converter.ThreadPoolExecutor") as pool:
+            results, _merged, done = self._convert(tmp_path, notebook, page_workers=4)
+
+        pool.assert_not_called()
+        assert results["v6_converted"] == 1
+        assert done.count(False) == 1
+
+    def test_empty_notebook_creates_no_directories(self, tmp_path):
+        notebook = {
+            "uuid": "nb-empty",
+            "name": "Empty",
+            "v5_files": [],
+            "v6_files": [],
+            "v4_files": [],
+            "v3_files": [],
+            "pdf_files": [],
+        }
+
+        results = convert_notebook(notebook, tmp_path / "out", tmp_path / "backup")
+
+        assert results["output_files"] == []
+        assert results["page_pdfs"] == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_note_not_rewritten_when_unchanged(self, tmp_path):
+        files_dir = tmp_path / "backup" / "Notebooks"
+        files_dir.mkdir(parents=True)
+        _write_metadata(files_dir, "nb-old", "Old Notes", "DocumentType")
+        _write_rm_file(files_dir, "nb-old", "legacy", 3)
+        notebook = find_notebooks(tmp_path / "backup")[0]
+
+        results = convert_notebook(notebook, tmp_path / "out", tmp_path / "backup")
+        note = tmp_path / "out" / "Old Notes_unsupported.txt"
+        assert results["output_files"] == [note]
+        assert "v3 pages: 1" in note.read_text(encoding="utf-8")
+
+        with patch("pathlib.Path.write_text") as write_text:
+            results = convert_notebook(notebook, tmp_path / "out", tmp_path / "backup")
+
+        write_text.assert_not_called()
+        assert results["output_files"] == [note]
+
+    def test_force_reconverts_fresh_output(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        self._convert(tmp_path, notebook)
+
+        results, merged, _done = self._convert(tmp_path, notebook, force=True)
+
+        assert results["v6_converted"] == len(self.PAGES)
+        assert len(merged) == len(self.PAGES)
+
+    def test_force_recopies_existing_pdfs_with_change_info(self, tmp_path):
+        notebook = self._notebook(tmp_path)
+        notebook["pdf_files"] = [_write_pdf(tmp_path / "nb-001.pdf", 1)]
+        self._convert(tmp_path, notebook)
+
+        with patch("src.hybrid_converter.copy_existing_pdf", return_value=True) as copy_existing:
+            results, merged, _done = self._convert(
+                tmp_path, notebook, changed_page_ids=set(), force=True
+            )
+
+        copy_existing.assert_called_once()
+        assert results["v6_converted"] == len(self.PAGES)
+        assert len(merged) == len(self.PAGES) + 1
+
+
+def _write_pdf(path: Path, pages: int) -> Path:
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(path))
+    for i in range(pages):
+        c.drawString(100, 100, f"page {i}")
+        c.showPage()
+    c.save()
+    return path
+
+
+class TestMergePdfs:
+    """Tests for merging per-page PDFs into one document."""
+
+    def _page_count(self, path: Path) -> int:
+        from PyPDF2 import PdfReader
+
+        return len(PdfReader(str(path)).pages)
+
+    def test_merges_pages_in_order(self, tmp_path):
+        parts = [_write_pdf(tmp_path / f"p{i}.pdf", i + 1) for i in range(3)]
+        out = tmp_path / "out" / "merged.pdf"
+
+        assert merge_pdfs(parts, out) is True
+        assert self._page_count(out) == 6
+
+    def test_falls_back_to_pypdf2(self, tmp_path):
+        parts = [_write_pdf(tmp_path / f"p{i}.pdf", 1) for i in range(2)]
+        out = tmp_path / "merged.pdf"
+
+        with patch.dict("sys.modules", {"pikepdf": None, "pymupdf": None, "fitz": None}):
+            assert merge_pdfs(parts, out) is True
+
+        assert self._page_count(out) == 2
+
+    def test_unchanged_merge_is_byte_identical(self, tmp_path):
+        parts = [_write_pdf(tmp_path / f"p{i}.pdf", 1) for i in range(2)]
+
+        merge_pdfs(parts, tmp_path / "a.pdf")
+        time.sleep(1.1)
+        merge_pdfs(parts, tmp_path / "b.pdf")
+
+        assert (tmp_path / "a.pdf").read_bytes() == (tmp_path / "b.pdf").read_bytes()
+
+    def test_shared_page_resources_are_deduplicated(self, tmp_path):
+        pytest.importorskip("pymupdf")
+        parts = [_write_pdf(tmp_path / f"p{i}.pdf", 1) for i in range(20)]
+        out = tmp_path / "merged.pdf"
+
+        with patch.dict("sys.modules", {"pikepdf": None}):
+            assert merge_pdfs(parts, out) is True
+
+        # Every page embeds the same font, which should be stored once
+        assert out.read_bytes().count(b"/BaseFont") == 1
+
+    def test_single_page_is_copied_without_parsing(self, tmp_path):
+        part = _write_pdf(tmp_path / "p.pdf", 2)
+        out = tmp_path / "merged.pdf"
+
+        with patch("src.hybrid_converter._merge_pdfs_pypdf2") as pypdf2:
+            with patch.dict("sys.modules", {"pikepdf": None, "pymupdf": None, "fitz": None}):
+                assert merge_pdfs([part], out) is True
+
+        pypdf2.assert_not_called()
+        assert out.read_bytes() == part.read_bytes()
+
+
+class TestMergePdfWithTemplate:
+    """Tests for overlaying page content on a template background."""
+
+    def test_every_content_page_gets_the_template(self, tmp_path):
+        from PyPDF2 import PdfReader
+
+        content = _write_pdf(tmp_path / "content.pdf", 3)
+        template = _write_pdf(tmp_path / "template.pdf", 1)
+        out = tmp_path / "out.pdf"
+
+        with patch("PyPDF2.PdfReader", wraps=PdfReader) as reader:
+            assert merge_pdf_with_template(content, template, out) is True
+
+        assert len(PdfReader(str(out)).pages) == 3
+        # One parse of the content plus one of the template per page
+        assert reader.call_count == 4
+
+    def test_template_given_as_bytes(self, tmp_path):
+        from PyPDF2 import PdfReader
+
+        content = _write_pdf(tmp_path / "content.pdf", 2)
+        template = _write_pdf(tmp_path / "template.pdf", 1).read_bytes()
+        out = tmp_path / "out.pdf"
+
+        assert merge_pdf_with_template(content, template, out) is True
+        assert len(PdfReader(str(out)).pages) == 2
+
+    def test_missing_template_copies_content(self, tmp_path):
+        from PyPDF2 import PdfReader
+
+        content = _write_pdf(tmp_path / "content.pdf", 2)
+        out = tmp_path / "out.pdf"
+
+        assert merge_pdf_with_template(content, tmp_path / "none.pdf", out) is True
+        assert len(PdfReader(str(out)).pages) == 2
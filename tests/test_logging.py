@@ -1,8 +1,14 @@
 """Tests for the logging utility module."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
-from src.utils.logging import LogLevel, setup_logging
+from src.utils.logging import LogLevel, init_worker_logging, setup_logging, worker_log_queue
+
+
+def _log_from_worker(message):
+    logging.getLogger("converter.v6").debug(message)
+    logging.getLogger("svglib.svglib").debug("svglib noise")
 
 
 class TestLogLevel:
@@ -70,3 +76,24 @@ class TestSetupLogging:
         setup_logging(LogLevel.DBG, log_dir=tmp_path)
         assert logging.getLogger("paramiko").level >= logging.WARNING
         assert logging.getLogger("openai").level >= logging.WARNING
+
+
+class TestWorkerLogging:
+    """Tests for forwarding worker-process log records to the parent."""
+
+    def test_worker_records_reach_the_log_file(self, tmp_path):
+        setup_logging(LogLevel.NONE, log_dir=tmp_path)
+        with (
+            worker_log_queue() as (log_queue, level),
+            ProcessPoolExecutor(
+                max_workers=1, initializer=init_worker_logging, initargs=(log_queue, level)
+            ) as executor,
+        ):
+            executor.submit(_log_from_worker, "page rendered in worker").result()
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+        content = (tmp_path / "remarkablesync.log").read_text(encoding="utf-8")
+        assert "page rendered in worker" in content
+        assert "[converter.v6]" in content
+        assert "svglib noise" not in content
@@ -1,7 +1,7 @@
 """Tests for the Markdown exporter."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.pdf_md_converter import MarkdownExporter, _file_hash
 from src.utils import sanitize_name
@@ -49,6 +49,9 @@ class TestSafeName:
     def test_strips_whitespace(self):
         assert sanitize_name("  hello  ") == "hello"
 
+    def test_replaces_every_illegal_char(self):
+        assert sanitize_name('a\\b/c:d*e?f"g<h>i|j\x00k') == "a-b-c-d-e-f-g-h-i-j-k"
+
 
 class TestExtractTitle:
     """Tests for MarkdownExporter._extract_title date + title logic."""
@@ -113,6 +116,25 @@ class TestFileHash:
 # ---------------------------------------------------------------------------
 
 
+class TestContentPageOrder:
+    def test_reads_v6_cpages_order(self, tmp_path):
+        metadata = tmp_path / "nb.metadata"
+        metadata.write_text("{}", encoding="utf-8")
+        (tmp_path / "nb.content").write_text(
+            '{"cPages": {"pages": [{"id": "b"}, {"id": "a"}]}}', encoding="utf-8"
+        )
+
+        order = MarkdownExporter._get_content_page_order({"metadata_file": metadata})
+
+        assert order == ["b", "a"]
+
+    def test_unreadable_content_returns_none(self, tmp_path):
+        metadata = tmp_path / "nb.metadata"
+        (tmp_path / "nb.content").write_text("{broken", encoding="utf-8")
+
+        assert MarkdownExporter._get_content_page_order({"metadata_file": metadata}) is None
+
+
 class TestMarkdownExporter:
     def _make_exporter(
         self, output_dir: Path, backup_dir: Path, ocr_engine=None
@@ -243,6 +265,20 @@ class TestMarkdownExporter:
         assert expected_dir.exists()
         assert Path(result) == expected_dir
 
+    def test_slash_in_folder_name_matches_converter_layout(self, tmp_path):
+        output_dir = tmp_path / "output"
+        backup = tmp_path / "backup"
+        backup.mkdir()
+
+        notebook = _make_notebook("Note", "uuid-slash", folder_path="1/1")
+        notebook["folder_hierarchy"] = [("1/1", "folder-uuid")]
+        pdf = backup / "Note.pdf"
+        _write_dummy_pdf(pdf)
+
+        result = self._make_exporter(output_dir, backup).export_notebook(notebook, pdf)
+
+        assert Path(result) == output_dir / "1-1" / "Note"
+
     def test_ocr_text_included_in_markdown(self, tmp_path):
         output_dir = tmp_path / "output"
         backup = tmp_path / "backup"
@@ -312,3 +348,20 @@ class TestMarkdownExporter:
         exp = self._make_exporter(output_dir, backup)
         exported, skipped, _dirs = exp.export_all(notebooks, pdf_dir)
         assert exported == 1  # only the document, not the folder
+
+    def test_export_all_uses_cached_page_pdfs(self, tmp_path):
+        output_dir = tmp_path / "output"
+        backup = tmp_path / "backup"
+        cache = backup / "PagePDFs" / "uuid-n"
+        for stem in ("p2", "p1", "p1_content"):
+            _write_dummy_pdf(cache / f"{stem}.pdf")
+
+        exp = self._make_exporter(output_dir, backup)
+        with patch.object(exp, "export_notebook", return_value=None) as export_notebook:
+            exp.export_all([_make_notebook("My Note", "uuid-n")], backup / "PDF")
+
+        page_pdfs = export_notebook.call_args.kwargs["page_pdfs"]
+        assert page_pdfs == [cache / "p1.pdf", cache / "p2.pdf"]
+
+    def test_missing_page_cache_lists_nothing(self, tmp_path):
+        assert MarkdownExporter._list_page_pdfs(tmp_path / "absent") is None
@@ -1,8 +1,14 @@
 """Tests for the backup metadata module (FileMetadata)."""
 
+import hashlib
 import json
+import os
+from pathlib import Path
+from unittest.mock import patch
 
-from src.backup.metadata import FileMetadata
+import pytest
+
+from src.backup.metadata import FileMetadata, SqliteMetadataStore
 
 
 class TestFileMetadataLoadSave:
@@ -30,6 +36,32 @@ class TestFileMetadataLoadSave:
         meta2 = FileMetadata(meta_path)
         assert meta2.data["/path/to/file"]["hash"] == "abc"
 
+    def test_unchanged_save_does_not_rewrite(self, tmp_path):
+        meta_path = tmp_path / "meta.json"
+        meta = FileMetadata(meta_path)
+        meta.data["/path/to/file"] = {"mtime": 100}
+        meta.save()
+
+        meta2 = FileMetadata(meta_path)
+        with patch("src.backup.metadata.os.replace") as replace:
+            meta2.save()
+            meta2.data["/path/to/other"] = {"mtime": 200}
+            meta2.save()
+
+        replace.assert_called_once()
+
+    def test_interrupted_save_keeps_previous_file(self, tmp_path):
+        meta_path = tmp_path / "meta.json"
+        meta = FileMetadata(meta_path)
+        meta.data["/path/to/file"] = {"mtime": 100}
+        meta.save()
+        meta.data["/path/to/file"] = {"mtime": 200}
+
+        with patch("src.backup.metadata.os.replace", side_effect=OSError("disk full")):
+            meta.save()
+
+        assert json.loads(meta_path.read_text())["/path/to/file"]["mtime"] == 100
+
     def test_load_handles_corrupt_json(self, tmp_path):
         meta_path = tmp_path / "bad.json"
         meta_path.write_text("not valid json {{{", encoding="utf-8")
@@ -45,7 +77,7 @@ class TestFileMetadataLoadSave:
 
 
 class TestFileHash:
-    """MD5 hash computation."""
+    """File hash computation."""
 
     def test_consistent_hash(self, tmp_path):
         f = tmp_path / "test.txt"
@@ -54,7 +86,7 @@ class TestFileHash:
         h1 = meta.get_file_hash(f)
         h2 = meta.get_file_hash(f)
         assert h1 == h2
-        assert len(h1) == 32
+        assert h1 == hashlib.sha256(b"hello world").hexdigest()
 
     def test_different_content(self, tmp_path):
         meta = FileMetadata(tmp_path / "m.json")
@@ -109,6 +141,17 @@ class TestShouldSyncFile:
         remote = {"path": "/remote/file", "mtime": 100, "size": 7}
         assert meta.should_sync_file(remote, local) is False
 
+    def test_legacy_md5_entry_is_verified_and_upgraded(self, tmp_path):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.json")
+        md5 = hashlib.md5(b"content").hexdigest()
+        meta.data["/remote/file"] = {"mtime": 100, "size": 7, "hash": md5}
+        remote = {"path": "/remote/file", "mtime": 100, "size": 7}
+
+        assert meta.should_sync_file(remote, local) is False
+        assert meta.data["/remote/file"]["hash"] == hashlib.sha256(b"content").hexdigest()
+
     def test_hash_mismatch_triggers_sync(self, tmp_path):
         local = tmp_path / "file.txt"
         local.write_text("content", encoding="utf-8")
@@ -118,6 +161,55 @@ class TestShouldSyncFile:
         assert meta.should_sync_file(remote, local) is True
 
 
+class TestLocalStatFastPath:
+    """Skipping the re-hash when the local copy is untouched."""
+
+    def _synced(self, tmp_path, **kwargs):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.json", **kwargs)
+        remote = {"path": "/remote/file", "mtime": 100, "size": 7}
+        meta.update_file_metadata(remote, local)
+        return meta, remote, local
+
+    def test_unchanged_local_file_is_not_rehashed(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        with patch.object(meta, "get_file_hash", side_effect=AssertionError("hashed")):
+            assert meta.should_sync_file(remote, local) is False
+
+    def test_touched_local_file_is_rehashed(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        os.utime(local, ns=(0, 0))
+        assert meta.should_sync_file(remote, local) is False
+        assert meta.data["/remote/file"]["local_mtime_ns"] == 0
+
+    def test_modified_local_file_triggers_sync(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        local.write_text("CONTENT", encoding="utf-8")
+        os.utime(local, ns=(0, 0))
+        assert meta.should_sync_file(remote, local) is True
+
+    def test_unchanged_file_costs_one_stat(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        with (
+            patch("pathlib.Path.exists", side_effect=AssertionError("exists")),
+            patch("pathlib.Path.stat", autospec=True, side_effect=Path.stat) as mock_stat,
+        ):
+            assert meta.should_sync_file(remote, local) is False
+        mock_stat.assert_called_once()
+
+    def test_deleted_local_file_triggers_sync(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        local.unlink()
+        assert meta.should_sync_file(remote, local) is True
+
+    def test_verify_hashes_always_rehashes(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path, verify_hashes=True)
+        with patch.object(meta, "get_file_hash", return_value="other") as mock_hash:
+            assert meta.should_sync_file(remote, local) is True
+        mock_hash.assert_called_once()
+
+
 class TestUpdateFileMetadata:
     """Metadata update after sync."""
 
@@ -131,5 +223,102 @@ class TestUpdateFileMetadata:
         entry = meta.data["/remote/file"]
         assert entry["mtime"] == 12345
         assert entry["size"] == 12
-        assert len(entry["hash"]) == 32
+        assert len(entry["hash"]) == 64
         assert "last_sync" in entry
+
+
+class TestSqliteBackend:
+    """SQLite-backed metadata store (``.db`` suffix)."""
+
+    def _synced(self, tmp_path):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.db")
+        remote = {"path": "/remote/file", "mtime": 100, "size": 7}
+        meta.update_file_metadata(remote, local)
+        return meta, remote, local
+
+    def test_uses_sqlite_store(self, tmp_path):
+        meta = FileMetadata(tmp_path / "m.db")
+        assert isinstance(meta.data, SqliteMetadataStore)
+        assert len(meta.data) == 0
+
+    def test_round_trip_after_save(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        meta.save()
+
+        meta2 = FileMetadata(tmp_path / "m.db")
+        assert meta2.data["/remote/file"]["hash"] == meta.get_file_hash(local)
+        assert meta2.should_sync_file(remote, local) is False
+
+    def test_writes_committed_in_batches_without_save(self, tmp_path):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.db")
+        with patch("src.backup.metadata.COMMIT_EVERY", 2):
+            for i in range(2):
+                meta.update_file_metadata({"path": f"/r/{i}", "mtime": 1, "size": 7}, local)
+
+        assert "/r/1" in FileMetadata(tmp_path / "m.db").data
+
+    def test_refreshed_local_stat_is_persisted(self, tmp_path):
+        meta, remote, local = self._synced(tmp_path)
+        os.utime(local, ns=(0, 0))
+        assert meta.should_sync_file(remote, local) is False
+        assert meta.data["/remote/file"]["local_mtime_ns"] == 0
+
+    def test_migrates_legacy_json(self, tmp_path):
+        legacy = {"/remote/file": {"mtime": 100, "size": 7, "hash": "abc"}}
+        (tmp_path / "m.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        meta = FileMetadata(tmp_path / "m.db")
+
+        assert meta.data["/remote/file"] == legacy["/remote/file"]
+
+    def test_missing_key_raises(self, tmp_path):
+        meta = FileMetadata(tmp_path / "m.db")
+        assert "/nope" not in meta.data
+        assert meta.data.get("/nope") is None
+
+
+class TestVerifyBatch:
+    """Pre-computing local hashes for the verify-hashes path."""
+
+    def test_hashes_match_serial(self, tmp_path):
+        meta = FileMetadata(tmp_path / "m.json")
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.txt"
+            path.write_text(f"content {i}", encoding="utf-8")
+            paths.append(path)
+
+        with patch("src.backup.metadata.PARALLEL_HASH_MIN_FILES", 1):
+            hashes = meta.verify_batch(paths)
+
+        assert hashes == {path: meta.get_file_hash(path) for path in paths}
+
+    def test_cached_hash_used_by_should_sync(self, tmp_path):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.json", verify_hashes=True)
+        remote = {"path": "/remote/file", "mtime": 100, "size": 7}
+        meta.update_file_metadata(remote, local)
+        meta.verify_batch([local])
+
+        with patch.object(meta, "get_file_hash", side_effect=AssertionError("hashed")):
+            assert meta.should_sync_file(remote, local) is False
+
+    def test_empty_batch(self, tmp_path):
+        assert FileMetadata(tmp_path / "m.json").verify_batch([]) == {}
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="no posix_fadvise")
+    def test_verified_files_dropped_from_page_cache(self, tmp_path):
+        local = tmp_path / "file.txt"
+        local.write_text("content", encoding="utf-8")
+        meta = FileMetadata(tmp_path / "m.json")
+
+        with patch("os.posix_fadvise") as fadvise:
+            meta.verify_batch([local])
+
+        assert fadvise.call_count == 1
+        assert fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_DONTNEED)
@@ -5,6 +5,7 @@ are mocked so these tests exercise only the orchestration/filtering logic.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -65,6 +66,15 @@ def _fake_progress():
     return ctx
 
 
+def _thread_pool(max_workers, **_):
+    """Stand in for the process pool with threads, without the log initializer.
+
+    The initializer repoints the root logger at the worker log queue, which
+    in this process would feed the queue listener's own records back to it.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
 def _patch_progress(monkeypatch=None):
     return patch(_PATCH_PROGRESS, return_value=_fake_progress())
 
@@ -165,6 +175,20 @@ class TestRunConversionUpdatedUuids:
         # Only notebook "nb-a" should have been converted
         assert results_captured == ["nb-a"]
 
+    def test_filtered_out_folders_still_reach_organize(self, tmp_path):
+        folder = _make_notebook(uuid="f-1", name="Work", type="CollectionType")
+        nbs = [folder, _make_notebook(uuid="nb-a", parent="f-1", v6_files=["a.rm"])]
+        bd = _build_backup(tmp_path)
+
+        with (
+            patch(_PATCH_FIND, return_value=nbs),
+            patch(_PATCH_ORG, return_value={"documents_to_convert": []}) as org,
+            _patch_progress(),
+        ):
+            run_conversion(bd, tmp_path / "output", updated_uuids={"nb-a"})
+
+        assert [item["uuid"] for item in org.call_args.args[0]] == ["nb-a", "f-1"]
+
 
 # ---------------------------------------------------------------------------
 # notebook_filter
@@ -344,3 +368,117 @@ class TestRunConversionErrorHandling:
             run_conversion(bd, out)
 
         assert out.exists()
+
+
+# ---------------------------------------------------------------------------
+# Parallel conversion
+# ---------------------------------------------------------------------------
+
+
+class TestRunConversionWorkers:
+    def _run(self, tmp_path, nbs, fake_convert, workers):
+        bd = _build_backup(tmp_path)
+        org = {"documents_to_convert": nbs}
+        # Threads stand in for worker processes so the patched converter is visible
+        with (
+            patch(_PATCH_FIND, return_value=nbs),
+            patch(_PATCH_ORG, return_value=org),
+            patch(_PATCH_CONVERT, side_effect=fake_convert),
+            patch("src.rm_pdf_converter.ProcessPoolExecutor", side_effect=_thread_pool) as pool,
+            _patch_progress(),
+        ):
+            result = run_conversion(bd, tmp_path / "output", workers=workers)
+        return result, pool
+
+    def test_parallel_results_are_collected(self, tmp_path):
+        nbs = [
+            _make_notebook(uuid=f"nb-{i}", name=f"Notebook {i}", v6_files=[f"p{i}.rm"])
+            for i in range(4)
+        ]
+        out = tmp_path / "output"
+
+        def _fake_convert(notebook, *args, **kwargs):
+            assert "on_page_done" not in kwargs
+            pdf = out / f"{notebook['uuid']}.pdf"
+            return {"output_files": [pdf], "page_pdfs": [pdf], "pdf_changed": True}
+
+        (success, converted, merged), _pool = self._run(tmp_path, nbs, _fake_convert, workers=2)
+
+        assert success is True
+        assert set(converted) == {nb["uuid"] for nb in nbs}
+        assert len(merged) == 4
+
+    def test_parallel_failure_does_not_stop_others(self, tmp_path):
+        nbs = [_make_notebook(uuid="bad", v6_files=["x.rm"]), _make_notebook(uuid="good")]
+
+        def _fake_convert(notebook, *args, **kwargs):
+            if notebook["uuid"] == "bad":
+                raise RuntimeError("Simulated converter crash")
+            return {"output_files": [Path("good.pdf")], "page_pdfs": [], "pdf_changed": True}
+
+        (success, _converted, merged), _pool = self._run(tmp_path, nbs, _fake_convert, workers=2)
+
+        assert success is True
+        assert merged == [Path("good.pdf")]
+
+    def test_single_worker_converts_in_process(self, tmp_path):
+        nbs = [_make_notebook(uuid="nb-1"), _make_notebook(uuid="nb-2")]
+
+        def _fake_convert(notebook, *args, **kwargs):
+            assert "on_page_done" in kwargs
+            return {"output_files": [], "page_pdfs": [], "pdf_changed": False}
+
+        _result, pool = self._run(tmp_path, nbs, _fake_convert, workers=1)
+
+        assert not pool.called
+
+    def test_parallel_submits_largest_notebooks_first(self, tmp_path):
+        nbs = [
+            _make_notebook(uuid="small", v6_files=["a.rm"]),
+            _make_notebook(uuid="large", v6_files=["a.rm", "b.rm", "c.rm"]),
+        ]
+        submitted = []
+
+        def _fake_convert(notebook, *args, **kwargs):
+            submitted.append(notebook["uuid"])
+            return {"output_files": [], "page_pdfs": [], "pdf_changed": False}
+
+        bd = _build_backup(tmp_path)
+        # A single thread runs submissions in order, exposing the submit order
+        with (
+            patch(_PATCH_FIND, return_value=nbs),
+            patch(_PATCH_ORG, return_value={"documents_to_convert": nbs}),
+            patch(_PATCH_CONVERT, side_effect=_fake_convert),
+            patch(
+                "src.rm_pdf_converter.ProcessPoolExecutor",
+                side_effect=lambda max_workers, **_: _thread_pool(1),
+            ),
+            _patch_progress(),
+        ):
+            run_conversion(bd, tmp_path / "output", workers=2)
+
+        assert submitted == ["large", "small"]
+
+    def test_page_counts_computed_once_per_notebook(self, tmp_path):
+        nbs = [
+            _make_notebook(uuid="small", v6_files=["a.rm"]),
+            _make_notebook(uuid="large", v6_files=["a.rm", "b.rm", "c.rm"]),
+        ]
+        bd = _build_backup(tmp_path)
+        with (
+            patch(_PATCH_FIND, return_value=nbs),
+            patch(_PATCH_ORG, return_value={"documents_to_convert": nbs}),
+            patch(
+                _PATCH_CONVERT,
+                return_value={"output_files": [], "page_pdfs": [], "pdf_changed": False},
+            ),
+            patch(
+                "src.rm_pdf_converter.ProcessPoolExecutor",
+                side_effect=lambda max_workers, **_: _thread_pool(1),
+            ),
+            patch("src.rm_pdf_converter._notebook_page_count", return_value=1) as page_count,
+            _patch_progress(),
+        ):
+            run_conversion(bd, tmp_path / "output", workers=2)
+
+        assert page_count.call_count == len(nbs)
@@ -1,6 +1,7 @@
 """Tests for the TemplateRenderer module."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -101,6 +102,15 @@ class TestLoadTemplate:
         renderer = TemplateRenderer(templates_dir)
         assert renderer.load_template("Does Not Exist") is None
 
+    def test_caches_missing_template(self, templates_dir):
+        renderer = TemplateRenderer(templates_dir)
+        assert renderer.load_template("Does Not Exist") is None
+
+        with patch.object(renderer, "get_template_file") as get_file:
+            assert renderer.load_template("Does Not Exist") is None
+
+        get_file.assert_not_called()
+
 
 class TestRenderTemplateToPdf:
     """Tests for PDF rendering (no sample .rm files needed)."""
@@ -147,6 +157,23 @@ class TestRenderTemplateToPdf:
         assert result is True
         assert output.exists()
 
+    def test_template_drawn_once_for_many_pages(self, templates_dir, tmp_path):
+        renderer = TemplateRenderer(templates_dir)
+        first, second = tmp_path / "page1.pdf", tmp_path / "page2.pdf"
+
+        with patch.object(renderer, "_render_grid", wraps=renderer._render_grid) as render_grid:
+            assert renderer.render_template_to_pdf("P Grid small", first) is True
+            assert renderer.render_template_to_pdf("P Grid small", second) is True
+
+        render_grid.assert_called_once()
+        assert second.read_bytes() == first.read_bytes()
+
+    def test_pdf_bytes_are_cached(self, templates_dir):
+        renderer = TemplateRenderer(templates_dir)
+        pdf_bytes = renderer.render_template_pdf("P Lines medium")
+        assert pdf_bytes[:4] == b"%PDF"
+        assert renderer.render_template_pdf("P Lines medium") is pdf_bytes
+
     def test_unknown_template_falls_back_to_blank(self, templates_dir, tmp_path):
         renderer = TemplateRenderer(templates_dir)
         output = tmp_path / "fallback.pdf"
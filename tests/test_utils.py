@@ -0,0 +1,77 @@
+"""Tests for the shared helpers in src.utils."""
+
+import errno
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import copy_file, dump_json, read_json
+
+
+class TestReadJson:
+    def test_parses_file(self, tmp_path):
+        path = tmp_path / "a.metadata"
+        path.write_text('{"visibleName": "Café", "pinned": false}', encoding="utf-8")
+        assert read_json(path) == {"visibleName": "Café", "pinned": False}
+
+    def test_invalid_json_raises_json_decode_error(self, tmp_path):
+        path = tmp_path / "bad.metadata"
+        path.write_bytes(b"{not json")
+        with pytest.raises(json.JSONDecodeError):
+            read_json(path)
+
+    def test_missing_file_raises_os_error(self, tmp_path):
+        with pytest.raises(OSError):
+            read_json(tmp_path / "nope.metadata")
+
+
+class TestDumpJson:
+    def test_round_trips_through_read_json(self, tmp_path):
+        data = {"/x/Café.rm": {"mtime": 1, "size": 2, "hash": "ab"}}
+        path = tmp_path / "m.json"
+        path.write_bytes(dump_json(data))
+        assert read_json(path) == data
+
+    def test_unencodable_value_raises_type_error(self):
+        with pytest.raises(TypeError):
+            dump_json({"x": object()})
+
+
+class TestCopyFile:
+    def test_copies_and_overwrites(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 " + os.urandom(200_000))
+        dst = tmp_path / "b.pdf"
+        dst.write_bytes(b"old content that is longer than nothing")
+        copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_empty_file(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"")
+        copy_file(src, tmp_path / "b.pdf")
+        assert (tmp_path / "b.pdf").read_bytes() == b""
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+    def test_falls_back_when_kernel_cannot_copy(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        dst = tmp_path / "b.pdf"
+        with patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device")):
+            copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+    def test_falls_back_when_kernel_copies_nothing(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        dst = tmp_path / "b.pdf"
+        with patch("os.copy_file_range", return_value=0):
+            copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_missing_source_raises_os_error(self, tmp_path):
+        with pytest.raises(OSError):
+            copy_file(tmp_path / "nope.pdf", tmp_path / "b.pdf")